@@ -0,0 +1,59 @@
+import redis.asyncio as aioredis
+from typing import TypedDict
+
+EDITABLE_TYPES = {"hash", "set", "zset"}
+DELETE_COMMANDS = {"hash": "HDEL", "set": "SREM", "zset": "ZREM"}
+
+
+class StagedEdit(TypedDict):
+    # "set" (add or update) or "delete"
+    op: str
+    # Hash field, or set/sorted set member
+    field: str
+    # Hash value or sorted set score; unused for sets
+    value: str
+
+
+def stage_edit(edits: list[StagedEdit], edit: StagedEdit) -> list[StagedEdit]:
+    """Returns `edits` with `edit` replacing any earlier edit of the same field."""
+    return [e for e in edits if e["field"] != edit["field"]] + [edit]
+
+
+def edit_commands(key_type: str, key: str, edits: list[StagedEdit]) -> list[tuple]:
+    """Folds edits into at most one delete and one write command.
+
+    Edits are unique per field, so the two commands never touch the same
+    field and their order does not matter.
+    """
+    writes = [e for e in edits if e["op"] == "set"]
+    deletes = [e["field"] for e in edits if e["op"] == "delete"]
+    commands = []
+    if deletes:
+        commands.append((DELETE_COMMANDS[key_type], key, *deletes))
+    if writes:
+        if key_type == "hash":
+            args = [arg for e in writes for arg in (e["field"], e["value"])]
+            commands.append(("HSET", key, *args))
+        elif key_type == "set":
+            commands.append(("SADD", key, *[e["field"] for e in writes]))
+        elif key_type == "zset":
+            args = [arg for e in writes for arg in (e["value"], e["field"])]
+            commands.append(("ZADD", key, *args))
+    return commands
+
+
+async def commit_edits(
+    r: aioredis.Redis,
+    key_type: str,
+    key: str,
+    edits: list[StagedEdit],
+    atomic: bool = False,
+) -> list:
+    """Writes edits in one pipelined round trip, wrapped in MULTI/EXEC if `atomic`.
+
+    Returns the per-command results, with failures as exception instances.
+    """
+    pipe = r.pipeline(transaction=atomic)
+    for command in edit_commands(key_type, key, edits):
+        pipe.execute_command(*command)
+    return await pipe.execute(raise_on_error=False)
\ No newline at end of file
@@ -0,0 +1,77 @@
+import redis.asyncio as aioredis
+import shlex
+import time
+from typing import Any
+from redis.exceptions import ResponseError
+from redis_browser.backend.command_info import changes_connection
+
+
+def parse_script(text: str) -> tuple[list[list[str]], list[str]]:
+    """Splits a pasted script into commands, one per line, with shlex.
+
+    Blank lines and lines starting with '#' are skipped. Returns the
+    commands and a message for every line that failed to parse.
+    """
+    commands, errors = [], []
+    for number, line in enumerate(text.splitlines(), start=1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        try:
+            parts = shlex.split(line)
+        except ValueError as e:
+            errors.append(f"line {number}: {e}")
+            continue
+        if parts:
+            commands.append(parts)
+    return commands, errors
+
+
+async def run_batch(
+    r: aioredis.Redis, commands: list[list[str]], atomic: bool = False
+) -> list[tuple[Any, int]]:
+    """Sends every command in one write and times each reply as it arrives.
+
+    Returns (reply, microseconds) per command; error replies are returned
+    as exceptions. The first latency includes the round trip, later ones
+    are the gap since the previous reply. With `atomic` the batch is
+    wrapped in MULTI/EXEC: latencies then time the QUEUED acknowledgements
+    and the replies come from EXEC. A batch with SELECT, MULTI, SUBSCRIBE
+    or similar disconnects its connection afterwards rather than handing
+    that state back to the pool.
+    """
+    pool = r.connection_pool
+    dirty = any(changes_connection(argv) for argv in commands)
+    conn = await pool.get_connection()
+    try:
+        wire = [("MULTI",), *commands, ("EXEC",)] if atomic else commands
+        await conn.send_packed_command(conn.pack_commands(wire), check_health=False)
+        replies, latencies = [], []
+        last = time.perf_counter()
+        for _ in wire:
+            try:
+                reply = await conn.read_response()
+            except ResponseError as e:
+                reply = e
+            now = time.perf_counter()
+            replies.append(reply)
+            latencies.append(int((now - last) * 1_000_000))
+            last = now
+    except BaseException:
+        dirty = True
+        raise
+    finally:
+        if dirty:
+            await conn.disconnect()
+        await pool.release(conn)
+    if not atomic:
+        return list(zip(replies, latencies))
+    queued, exec_reply = replies[1:-1], replies[-1]
+    if isinstance(exec_reply, list):
+        results = exec_reply
+    else:
+        # EXECABORT: show why each command was rejected while queueing
+        results = [
+            reply if isinstance(reply, Exception) else exec_reply for reply in queued
+        ]
+    return list(zip(results, latencies[1:-1]))
\ No newline at end of file
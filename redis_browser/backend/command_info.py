@@ -0,0 +1,175 @@
+import redis.asyncio as aioredis
+import logging
+from typing import TYPE_CHECKING, Optional, TypedDict
+from redis_browser.backend.pool_registry import get_client
+
+if TYPE_CHECKING:
+    from redis_browser.states.connection_state import RedisConfig
+
+# Commands that change keys wholesale, without naming them
+RESCAN_COMMANDS = {"flushdb", "flushall", "swapdb"}
+# Commands that leave their connection in a state other sessions must not inherit
+SESSION_COMMANDS = {
+    "select",
+    "multi",
+    "exec",
+    "discard",
+    "watch",
+    "unwatch",
+    "subscribe",
+    "psubscribe",
+    "ssubscribe",
+    "monitor",
+    "auth",
+    "hello",
+    "reset",
+    "readonly",
+    "readwrite",
+}
+SESSION_CLIENT_SUBCOMMANDS = {
+    "tracking",
+    "reply",
+    "caching",
+    "setname",
+    "no-evict",
+    "no-touch",
+}
+
+
+class CommandSpec(TypedDict):
+    flags: list[str]
+    # Key positions in argv (argv[0] is the command); first_key 0 means keyless
+    first_key: int
+    last_key: int
+    step: int
+
+
+class WriteEffect(TypedDict):
+    # Keys the commands may have changed
+    keys: list[str]
+    # Some command could not be classified, so any key may have changed
+    unknown: bool
+    rescan: bool
+
+
+def _spec(entry: list) -> tuple[str, CommandSpec]:
+    """Parses one raw COMMAND INFO entry."""
+    return str(entry[0]).lower(), {
+        "flags": [str(flag) for flag in entry[2]],
+        "first_key": int(entry[3]),
+        "last_key": int(entry[4]),
+        "step": int(entry[5]),
+    }
+
+
+def changes_connection(argv: list[str]) -> bool:
+    """Whether a command changes its connection's state (db, auth, mode, ...)."""
+    name = argv[0].lower()
+    if name == "client":
+        return len(argv) > 1 and argv[1].lower() in SESSION_CLIENT_SUBCOMMANDS
+    return name in SESSION_COMMANDS
+
+
+def is_read_only(spec: CommandSpec) -> bool:
+    return "readonly" in spec["flags"]
+
+
+def key_args(spec: CommandSpec, argv: list[str]) -> list[str]:
+    """Keys named by a command's fixed key positions."""
+    first, last, step = spec["first_key"], spec["last_key"], spec["step"]
+    if first <= 0 or step <= 0:
+        return []
+    if last < 0:
+        last = len(argv) + last
+    return argv[first : last + 1 : step]
+
+
+class CommandTable:
+    """COMMAND INFO flags and key positions per server, loaded once on connect."""
+
+    def __init__(self):
+        self._specs: dict[tuple, dict[str, CommandSpec]] = {}
+
+    @staticmethod
+    def _server_key(config: "RedisConfig") -> tuple:
+        return (config["host"], config["port"])
+
+    async def load(self, config: "RedisConfig") -> dict[str, CommandSpec]:
+        table = {}
+        for name, info in (await get_client(config).command()).items():
+            table[name.lower()] = {
+                "flags": list(info["flags"]),
+                "first_key": int(info["first_key_pos"]),
+                "last_key": int(info["last_key_pos"]),
+                "step": int(info["step_count"]),
+            }
+            # Redis 7 nests container subcommands, e.g. config|set
+            for entry in info.get("subcommands") or []:
+                sub_name, spec = _spec(entry)
+                table[sub_name] = spec
+        self._specs[self._server_key(config)] = table
+        return table
+
+    async def ensure(self, config: "RedisConfig") -> dict[str, CommandSpec]:
+        table = self._specs.get(self._server_key(config))
+        if table is None:
+            try:
+                table = await self.load(config)
+            except Exception as e:
+                logging.warning(f"COMMAND INFO unavailable for '{config['name']}': {e}")
+                return {}
+        return table
+
+    @staticmethod
+    def lookup(table: dict[str, CommandSpec], argv: list[str]) -> Optional[CommandSpec]:
+        name = argv[0].lower()
+        if len(argv) > 1 and f"{name}|{argv[1].lower()}" in table:
+            return table[f"{name}|{argv[1].lower()}"]
+        return table.get(name)
+
+    async def write_effect(
+        self, config: "RedisConfig", commands: list[list[str]]
+    ) -> WriteEffect:
+        """Works out which keys a batch of commands may have written.
+
+        Fixed key positions come from the cached table; commands flagged
+        movablekeys (EVAL, ZUNIONSTORE, ...) are resolved with pipelined
+        COMMAND GETKEYS calls.
+        """
+        table = await self.ensure(config)
+        keys: list[str] = []
+        unknown = False
+        rescan = False
+        movable = []
+        for argv in commands:
+            rescan |= argv[0].lower() in RESCAN_COMMANDS
+            spec = self.lookup(table, argv)
+            if spec is None:
+                unknown = True
+            elif is_read_only(spec):
+                continue
+            elif "movablekeys" in spec["flags"]:
+                movable.append(argv)
+            else:
+                keys.extend(key_args(spec, argv))
+        if movable:
+            pipe = get_client(config).pipeline(transaction=False)
+            for argv in movable:
+                pipe.execute_command("COMMAND GETKEYS", *argv)
+            try:
+                results = await pipe.execute(raise_on_error=False)
+            except Exception as e:
+                logging.warning(f"COMMAND GETKEYS failed: {e}")
+                results = [e]
+            for result in results:
+                if isinstance(result, aioredis.ResponseError):
+                    # Keyless invocations are an error too; only unknown is unsafe
+                    unknown |= "no key arguments" not in str(result).lower()
+                elif isinstance(result, Exception):
+                    unknown = True
+                else:
+                    keys.extend(result)
+        return {"keys": list(dict.fromkeys(keys)), "unknown": unknown, "rescan": rescan}
+
+
+command_table = CommandTable()
\ No newline at end of file
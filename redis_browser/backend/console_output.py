@@ -0,0 +1,186 @@
+import collections
+from typing import Any, Callable, Iterator, Optional
+
+# Console replies are rendered a page at a time, redis-cli style
+OUTPUT_PAGE_LINES = 100
+OUTPUT_PAGE_BYTES = 32 * 1024
+# No single reply ever shows more than this, however far it is paged
+OUTPUT_MAX_BYTES = 1024 * 1024
+VALUE_PREVIEW_CHARS = 4096
+# Unsent output kept per session and across all of them; the oldest goes first
+OUTPUT_SESSION_BYTES = 8 * 1024 * 1024
+OUTPUT_TOTAL_BYTES = 64 * 1024 * 1024
+
+_END = object()
+
+
+def _scalar(value: Any) -> str:
+    if value is None:
+        return "(nil)"
+    if isinstance(value, Exception):
+        return f"(error) {value}"
+    if isinstance(value, bool):
+        return str(value)
+    if isinstance(value, int):
+        return f"(integer) {value}"
+    if isinstance(value, (bytes, bytearray)):
+        value = bytes(value).decode(errors="replace")
+    text = str(value)
+    if len(text) > VALUE_PREVIEW_CHARS:
+        hidden = len(text) - VALUE_PREVIEW_CHARS
+        text = f"{text[:VALUE_PREVIEW_CHARS]}... (+{hidden} chars)"
+    return text
+
+
+def _nested(prefix: str, value: Any) -> Iterator[str]:
+    """Yields `value` with `prefix` on its first line and the rest aligned under it."""
+    pad = " " * len(prefix)
+    for i, line in enumerate(reply_lines(value)):
+        yield (prefix if i == 0 else pad) + line
+
+
+def reply_lines(reply: Any) -> Iterator[str]:
+    """Lazily renders a reply as lines: numbered arrays and `key => value` maps."""
+    if isinstance(reply, dict):
+        if not reply:
+            yield "(empty map)"
+        for key, value in reply.items():
+            yield from _nested(f"{_scalar(key)} => ", value)
+    elif isinstance(reply, (list, tuple, set)):
+        if not reply:
+            yield "(empty array)"
+        width = len(str(len(reply)))
+        for i, item in enumerate(reply, start=1):
+            yield from _nested(f"{i:>{width}}) ", item)
+    else:
+        yield from _scalar(reply).splitlines() or [""]
+
+
+def reply_preview(reply: Any) -> str:
+    """The first rendered line of a reply, marked when more lines follow."""
+    lines = reply_lines(reply)
+    first = next(lines, "")
+    return first if next(lines, _END) is _END else f"{first} ..."
+
+
+class OutputPager:
+    """Hands out a reply's rendered lines a page at a time, up to a byte cap.
+
+    Lines are rendered up front, so only the unsent text is kept and not
+    the reply itself; `size` counts its bytes.
+    """
+
+    def __init__(self, reply: Any):
+        self._pending: collections.deque[str] = collections.deque()
+        self.size = 0
+        for line in reply_lines(reply):
+            if self.size >= OUTPUT_MAX_BYTES:
+                line = f"... output capped at {OUTPUT_MAX_BYTES // 1024} KB"
+                self._pending.append(line)
+                self.size += len(line) + 1
+                break
+            self._pending.append(line)
+            self.size += len(line) + 1
+
+    @property
+    def has_more(self) -> bool:
+        return bool(self._pending)
+
+    def next_page(self) -> str:
+        lines, size = [], 0
+        while self._pending:
+            line = self._pending.popleft()
+            lines.append(line)
+            size += len(line) + 1
+            if len(lines) >= OUTPUT_PAGE_LINES or size >= OUTPUT_PAGE_BYTES:
+                break
+        self.size -= size
+        return "\n".join(lines)
+
+
+class OutputStore:
+    """Backend-only pagers for console replies, per session and log entry.
+
+    Only the unsent remainder of each reply is kept, capped in bytes per
+    session and in total; the least recently used outputs are dropped first.
+    """
+
+    def __init__(
+        self,
+        session_bytes: int = OUTPUT_SESSION_BYTES,
+        total_bytes: int = OUTPUT_TOTAL_BYTES,
+    ):
+        self.session_bytes = session_bytes
+        self.total_bytes = total_bytes
+        # Sessions in least recently used order, each with its pagers in order
+        self._sessions: collections.OrderedDict[
+            str, collections.OrderedDict[int, OutputPager]
+        ] = collections.OrderedDict()
+        self._session_size: dict[str, int] = {}
+        self.retained = 0
+
+    def open(self, owner: str, entry_id: int, reply: Any) -> tuple[str, bool]:
+        """Renders the first page; keeps the rest only if there is more."""
+        pager = OutputPager(reply)
+        page = pager.next_page()
+        if pager.has_more:
+            self._sessions.setdefault(owner, collections.OrderedDict())[
+                entry_id
+            ] = pager
+            self._sessions.move_to_end(owner)
+            self._resize(owner, pager.size)
+            self._trim(owner)
+        return page, pager.has_more
+
+    def more(self, owner: str, entry_id: int) -> Optional[tuple[str, bool]]:
+        """Returns the next page and whether more follows, or None if it was dropped."""
+        session = self._sessions.get(owner)
+        pager = session.get(entry_id) if session else None
+        if pager is None:
+            return None
+        before = pager.size
+        page = pager.next_page()
+        self._resize(owner, pager.size - before)
+        self._sessions.move_to_end(owner)
+        if pager.has_more:
+            session.move_to_end(entry_id)
+        else:
+            self._drop(owner, entry_id)
+        return page, pager.has_more
+
+    def discard(self, owner: str, entry_ids: list[int]):
+        for entry_id in entry_ids:
+            self._drop(owner, entry_id)
+
+    def clear(self, owner: str):
+        session = self._sessions.pop(owner, None)
+        if session is not None:
+            self.retained -= self._session_size.pop(owner)
+
+    def clear_closed(self, is_open: Callable[[str], bool]):
+        """Drops the outputs of every session whose browser tab has gone."""
+        for owner in [owner for owner in self._sessions if not is_open(owner)]:
+            self.clear(owner)
+
+    def _resize(self, owner: str, delta: int):
+        self._session_size[owner] = self._session_size.get(owner, 0) + delta
+        self.retained += delta
+
+    def _drop(self, owner: str, entry_id: int):
+        session = self._sessions.get(owner)
+        pager = session.pop(entry_id, None) if session else None
+        if pager is None:
+            return
+        self._resize(owner, -pager.size)
+        if not session:
+            self.clear(owner)
+
+    def _trim(self, owner: str):
+        while self._session_size.get(owner, 0) > self.session_bytes:
+            self._drop(owner, next(iter(self._sessions[owner])))
+        while self.retained > self.total_bytes:
+            oldest = next(iter(self._sessions))
+            self._drop(oldest, next(iter(self._sessions[oldest])))
+
+
+outputs = OutputStore()
\ No newline at end of file
@@ -0,0 +1,210 @@
+import bisect
+from typing import Iterator, Optional, TypedDict
+
+
+class TreeItem(TypedDict):
+    id: str
+    label: str
+    level: int
+    type: str
+    has_children: bool
+    expanded: bool
+    children_count: int
+    full_path: str
+
+
+class _Node:
+    __slots__ = ("children", "names", "count", "is_key")
+
+    def __init__(self):
+        # Leaf keys (no children) are stored as None rather than a _Node,
+        # which keeps the common case of the trie down to one dict entry.
+        self.children: dict[str, Optional["_Node"]] = {}
+        # Child segment names kept sorted so traversal never re-sorts
+        self.names: list[str] = []
+        # Number of keys at or below this node
+        self.count = 0
+        self.is_key = False
+
+    def __getstate__(self):
+        # The sorted names double as the dict's key order, so only the
+        # child values need storing; leaves pickle as a bare None.
+        return (
+            self.names,
+            [self.children[name] for name in self.names],
+            self.count,
+            self.is_key,
+        )
+
+    def __setstate__(self, state):
+        self.names, kids, self.count, self.is_key = state
+        self.children = dict(zip(self.names, kids))
+
+
+def _count(child: Optional[_Node]) -> int:
+    return 1 if child is None else child.count
+
+
+class KeyTrie:
+    """Sorted prefix trie of keys split on a delimiter, with per-node key counts.
+
+    Inserts and removals touch only the path of the affected key, and
+    `visible_rows` walks only expanded folders, so emitting the flattened
+    tree costs time proportional to the rows it returns.
+    """
+
+    def __init__(self, delimiter: str = ":"):
+        self.delimiter = delimiter
+        self._root = _Node()
+
+    def __len__(self) -> int:
+        return self._root.count
+
+    def __contains__(self, key: str) -> bool:
+        node = self._root
+        parts = key.split(self.delimiter)
+        for part in parts[:-1]:
+            node = node.children.get(part)
+            if node is None:
+                return False
+        if parts[-1] not in node.children:
+            return False
+        child = node.children[parts[-1]]
+        return child is None or child.is_key
+
+    def clear(self):
+        self._root = _Node()
+
+    def insert(self, key: str) -> bool:
+        """Adds a key; returns False if it was already present."""
+        if key in self:
+            return False
+        parts = key.split(self.delimiter)
+        node = self._root
+        node.count += 1
+        for part in parts[:-1]:
+            if part not in node.children:
+                bisect.insort(node.names, part)
+                node.children[part] = _Node()
+            child = node.children[part]
+            if child is None:
+                # Promote a leaf key that now has keys beneath it
+                child = _Node()
+                child.is_key = True
+                child.count = 1
+                node.children[part] = child
+            child.count += 1
+            node = child
+        last = parts[-1]
+        if last not in node.children:
+            bisect.insort(node.names, last)
+            node.children[last] = None
+        else:
+            child = node.children[last]
+            child.is_key = True
+            child.count += 1
+        return True
+
+    def update(self, keys) -> int:
+        return sum(1 for key in keys if self.insert(key))
+
+    def remove(self, key: str) -> bool:
+        """Removes a key, pruning empty branches; returns False if absent."""
+        if key not in self:
+            return False
+        parts = key.split(self.delimiter)
+        path = [self._root]
+        for part in parts[:-1]:
+            path.append(path[-1].children[part])
+        for node in path:
+            node.count -= 1
+        parent, last = path[-1], parts[-1]
+        child = parent.children[last]
+        if child is not None:
+            child.is_key = False
+            child.count -= 1
+        if child is None or not child.count:
+            self._unlink(parent, last)
+        for depth in range(len(parts) - 1, 0, -1):
+            node, parent = path[depth], path[depth - 1]
+            if node.count:
+                break
+            self._unlink(parent, parts[depth - 1])
+        return True
+
+    def keys(self) -> Iterator[str]:
+        """Yields every key in sorted segment order."""
+
+        def walk(node: _Node, prefix: Optional[str]):
+            for name in node.names:
+                child = node.children[name]
+                path = f"{prefix}{self.delimiter}{name}" if prefix is not None else name
+                if child is None or child.is_key:
+                    yield path
+                if child is not None:
+                    yield from walk(child, path)
+
+        yield from walk(self._root, None)
+
+    def filtered(self, query: str) -> "KeyTrie":
+        """Returns a new trie holding only keys containing `query` (case-insensitive)."""
+        query = query.lower()
+        result = KeyTrie(self.delimiter)
+        for key in self.keys():
+            if query in key.lower():
+                result.insert(key)
+        return result
+
+    def visible_rows(
+        self, expanded: set[str], pending: Optional[set[str]] = None
+    ) -> list[TreeItem]:
+        """Flattens the tree, descending only into expanded folders.
+
+        Folders in `pending` get a trailing "more" row after their children.
+        """
+        pending = pending or set()
+        rows: list[TreeItem] = []
+
+        def walk(node: _Node, prefix: Optional[str], level: int):
+            for name in node.names:
+                child = node.children[name]
+                full_path = (
+                    f"{prefix}{self.delimiter}{name}" if prefix is not None else name
+                )
+                is_folder = child is not None and bool(child.children)
+                is_expanded = is_folder and full_path in expanded
+                rows.append(
+                    {
+                        "id": full_path,
+                        "label": name,
+                        "level": level,
+                        "type": "folder" if is_folder else "key",
+                        "has_children": is_folder,
+                        "expanded": is_expanded,
+                        "children_count": _count(child) if is_folder else 0,
+                        "full_path": full_path,
+                    }
+                )
+                if is_expanded:
+                    walk(child, full_path, level + 1)
+                    if full_path in pending:
+                        rows.append(
+                            {
+                                "id": f"{full_path}{self.delimiter}__more__",
+                                "label": "Load more…",
+                                "level": level + 1,
+                                "type": "more",
+                                "has_children": False,
+                                "expanded": False,
+                                "children_count": 0,
+                                "full_path": full_path,
+                            }
+                        )
+
+        walk(self._root, None, 0)
+        return rows
+
+    @staticmethod
+    def _unlink(parent: _Node, name: str):
+        del parent.children[name]
+        parent.names.pop(bisect.bisect_left(parent.names, name))
\ No newline at end of file
@@ -0,0 +1,477 @@
+import redis.asyncio as aioredis
+from redis.client import NEVER_DECODE
+from typing import Any, TypedDict, Union
+from redis_browser.backend.keyspace_listener import (
+    LIST_HEAD_EVENTS,
+    LIST_TAIL_EVENTS,
+    REMOVAL_EVENTS,
+    STREAM_ADD_EVENTS,
+    TTL_EVENTS,
+)
+
+DEFAULT_PAGE_SIZE = 100
+PAGE_SIZE_OPTIONS = [50, 100, 500, 1000]
+
+LENGTH_COMMANDS = {
+    "hash": "HLEN",
+    "list": "LLEN",
+    "set": "SCARD",
+    "zset": "ZCARD",
+}
+# Types paged by rank/index offset; the rest page with a SCAN-family cursor
+# and so cannot jump to an arbitrary offset.
+OFFSET_PAGED_TYPES = {"list", "zset"}
+# Strings are read in GETRANGE chunks as raw bytes
+STRING_CHUNK_BYTES = 64 * 1024
+# Scrolling stops loading a string here; the rest needs an explicit request
+STRING_FULL_LOAD_LIMIT = 1024 * 1024
+STRING_FULL_CHUNK_BYTES = 1024 * 1024
+# XREAD BLOCK wait; must stay under the pool's socket timeout
+STREAM_TAIL_BLOCK_MS = 2000
+
+
+class StreamEntry(TypedDict):
+    id: str
+    fields: str
+
+
+class StreamGroup(TypedDict):
+    name: str
+    consumers: int
+    pending: int
+    last_delivered_id: str
+    lag: str
+
+
+async def value_length(r: aioredis.Redis, key: str, key_type: str) -> int:
+    command = LENGTH_COMMANDS.get(key_type)
+    if not command:
+        return 0
+    return await r.execute_command(command, key)
+
+
+async def fetch_string_chunk(
+    r: aioredis.Redis, key: str, start: int, size: int
+) -> bytes:
+    """Reads `size` raw bytes of a string value from `start`, undecoded."""
+    return await r.execute_command(
+        "GETRANGE", key, start, start + size - 1, **{NEVER_DECODE: True}
+    )
+
+
+def is_text(data: bytes) -> bool:
+    """True if `data` is UTF-8, allowing a character cut off at the end of a chunk."""
+    try:
+        data.decode("utf-8")
+    except UnicodeDecodeError as e:
+        return e.reason == "unexpected end of data"
+    return True
+
+
+def utf8_boundary(data: bytes) -> int:
+    """Length of `data` without a multi-byte character cut off at its end."""
+    for back in range(1, min(4, len(data)) + 1):
+        lead = data[-back]
+        if lead & 0xC0 == 0x80:
+            continue
+        width = 4 if lead >= 0xF0 else 3 if lead >= 0xE0 else 2 if lead >= 0xC0 else 1
+        return len(data) - back if width > back else len(data)
+    return len(data)
+
+
+def hex_dump(data: bytes, base: int = 0) -> str:
+    """Classic 16-bytes-per-line dump; `base` offsets the addresses."""
+    lines = []
+    for i in range(0, len(data), 16):
+        row = data[i : i + 16]
+        hexes = " ".join(f"{b:02x}" for b in row)
+        text = "".join(chr(b) if 32 <= b < 127 else "." for b in row)
+        lines.append(f"{base + i:08x}  {hexes:<47}  |{text}|")
+    return "\n".join(lines)
+
+
+def stream_entries(raw) -> list[StreamEntry]:
+    return [
+        {
+            "id": entry_id,
+            "fields": "  ".join(f"{field}={value}" for field, value in fields.items()),
+        }
+        for entry_id, fields in raw
+    ]
+
+
+async def fetch_stream_window(
+    r: aioredis.Redis,
+    key: str,
+    boundary: str,
+    page_size: int,
+    reverse: bool = True,
+    inclusive: bool = False,
+) -> tuple[list[StreamEntry], str]:
+    """Reads a page of entries past `boundary` with XRANGE/XREVRANGE.
+
+    An empty boundary starts from the newest (reverse) or oldest entry.
+    Returns the entries and the ID the next window continues from, or ""
+    once the stream is exhausted.
+    """
+    edge = boundary if inclusive or not boundary else f"({boundary}"
+    if reverse:
+        raw = await r.xrevrange(key, max=edge or "+", min="-", count=page_size)
+    else:
+        raw = await r.xrange(key, min=edge or "-", max="+", count=page_size)
+    entries = stream_entries(raw)
+    return entries, entries[-1]["id"] if len(entries) == page_size else ""
+
+
+async def tail_stream(
+    r: aioredis.Redis, key: str, last_id: str, count: int
+) -> list[StreamEntry]:
+    """Blocks briefly with XREAD for entries newer than `last_id`."""
+    result = await r.xread({key: last_id}, count=count, block=STREAM_TAIL_BLOCK_MS)
+    return stream_entries(result[0][1]) if result else []
+
+
+def _stream_info(info: dict) -> dict[str, str]:
+    summary = {
+        "Last ID": info.get("last-generated-id", ""),
+        "First ID": (info.get("first-entry") or ("",))[0],
+        "Groups": str(info.get("groups", 0)),
+    }
+    if "entries-added" in info:
+        summary["Entries added"] = str(info["entries-added"])
+    if "max-deleted-entry-id" in info:
+        summary["Max deleted ID"] = info["max-deleted-entry-id"]
+    return summary
+
+
+def _stream_groups(groups: list[dict]) -> list[StreamGroup]:
+    return [
+        {
+            "name": group["name"],
+            "consumers": group["consumers"],
+            "pending": group["pending"],
+            "last_delivered_id": group["last-delivered-id"],
+            "lag": "" if group.get("lag") is None else str(group["lag"]),
+        }
+        for group in groups
+    ]
+
+
+async def fetch_value_page(
+    r: aioredis.Redis,
+    key: str,
+    key_type: str,
+    position: Union[int, str],
+    page_size: int,
+    reverse: bool = True,
+) -> tuple[Any, Union[int, str]]:
+    """Fetches one page of a collection value starting at `position`.
+
+    `position` is an index for list/zset, a scan cursor for hash/set and
+    an exclusive entry ID for streams (read newest first when `reverse`).
+    Returns the page and the position of the next page.
+    """
+    if key_type == "stream":
+        return await fetch_stream_window(r, key, position, page_size, reverse)
+    if key_type == "list":
+        page = await r.lrange(key, position, position + page_size - 1)
+        return page, position + len(page)
+    if key_type == "zset":
+        page = await r.zrange(key, position, position + page_size - 1, withscores=True)
+        return page, position + len(page)
+    if key_type == "hash":
+        cursor, page = await r.hscan(key, cursor=position, count=page_size)
+        return page, cursor
+    if key_type == "set":
+        cursor, page = await r.sscan(key, cursor=position, count=page_size)
+        return sorted(page), cursor
+    return None, 0
+
+
+ZSET_QUERY_MODES = ["rank", "score", "lex"]
+ZSET_HISTOGRAM_BINS = 20
+
+
+class ZsetQuery(TypedDict):
+    mode: str
+    min: str
+    max: str
+    reverse: bool
+
+
+class HistogramBin(TypedDict):
+    label: str
+    count: int
+    percent: float
+
+
+def _lex_bound(value: str, default: str) -> str:
+    if not value:
+        return default
+    if value in ("-", "+") or value[0] in "[(":
+        return value
+    return f"[{value}"
+
+
+def _zset_bounds(query: ZsetQuery) -> tuple[str, str]:
+    if query["mode"] == "lex":
+        return _lex_bound(query["min"], "-"), _lex_bound(query["max"], "+")
+    return query["min"] or "-inf", query["max"] or "+inf"
+
+
+async def query_zset(
+    r: aioredis.Redis, key: str, query: ZsetQuery, offset: int, count: int
+) -> tuple[list[tuple[str, float]], int]:
+    """Runs one LIMIT page of a ZRANGE BYSCORE/BYLEX/REV query server-side.
+
+    Returns the page and the total number of matching members (ZCARD,
+    ZCOUNT or ZLEXCOUNT, pipelined with the page).
+    """
+    reverse = query["reverse"]
+    pipe = r.pipeline(transaction=False)
+    if query["mode"] == "rank":
+        pipe.zrange(key, offset, offset + count - 1, desc=reverse, withscores=True)
+        pipe.zcard(key)
+    else:
+        low, high = _zset_bounds(query)
+        by_score = query["mode"] == "score"
+        pipe.zrange(
+            key,
+            high if reverse else low,
+            low if reverse else high,
+            desc=reverse,
+            byscore=by_score,
+            bylex=not by_score,
+            offset=offset,
+            num=count,
+            # WITHSCORES is not allowed with BYLEX
+            withscores=by_score,
+        )
+        if by_score:
+            pipe.zcount(key, low, high)
+        else:
+            pipe.zlexcount(key, low, high)
+    page, total = await pipe.execute()
+    if query["mode"] == "lex" and page:
+        page = list(zip(page, await r.zmscore(key, page)))
+    return page, total
+
+
+async def zset_histogram(
+    r: aioredis.Redis, key: str, query: ZsetQuery, bins: int = ZSET_HISTOGRAM_BINS
+) -> list[HistogramBin]:
+    """Buckets member scores without reading the members.
+
+    The score range comes from the lowest and highest members (or the score
+    query bounds); each bucket is then counted with a pipelined ZCOUNT, so
+    the cost is a few O(log N) commands however large the set is.
+    """
+    pipe = r.pipeline(transaction=False)
+    pipe.zrange(key, 0, 0, withscores=True)
+    pipe.zrange(key, -1, -1, withscores=True)
+    first, last = await pipe.execute()
+    if not first:
+        return []
+    low, high = first[0][1], last[0][1]
+    if query["mode"] == "score":
+        try:
+            low = max(low, float(query["min"] or "-inf"))
+            high = min(high, float(query["max"] or "+inf"))
+        except ValueError:
+            pass
+    if high <= low or high - low == float("inf"):
+        bins = 1
+    width = (high - low) / bins if bins > 1 else 0
+    edges = [low + width * i for i in range(bins)] + [high]
+    pipe = r.pipeline(transaction=False)
+    for i in range(bins):
+        # Half-open buckets, with the last one closed at the top score
+        upper = edges[i + 1] if i == bins - 1 else f"({edges[i + 1]}"
+        pipe.zcount(key, edges[i], upper)
+    counts = await pipe.execute()
+    peak = max(counts) or 1
+    return [
+        {
+            "label": f"{edges[i]:g} – {edges[i + 1]:g}",
+            "count": count,
+            "percent": round(count * 100 / peak, 1),
+        }
+        for i, count in enumerate(counts)
+    ]
+
+
+class KeyDescription(TypedDict):
+    type: str
+    pttl: int
+    encoding: str
+    memory_usage: int
+    length: int
+    string_bytes: bytes
+    page: Any
+    next_position: Union[int, str]
+    stream_info: dict[str, str]
+    stream_groups: list[StreamGroup]
+
+
+def _ok(result, default=None):
+    return default if isinstance(result, Exception) or result is None else result
+
+
+async def describe_key(
+    r: aioredis.Redis, key: str, page_size: int, stream_reverse: bool = True
+) -> KeyDescription:
+    """Describes a key and fetches its first page in a single round trip.
+
+    The type is not known up front, so the length and first-page command
+    for every type are pipelined together; the ones that do not match
+    fail fast with WRONGTYPE and are discarded.
+    """
+    pipe = r.pipeline(transaction=False)
+    pipe.type(key)
+    pipe.pttl(key)
+    pipe.object("encoding", key)
+    pipe.memory_usage(key)
+    pipe.strlen(key)
+    pipe.execute_command(
+        "GETRANGE", key, 0, STRING_CHUNK_BYTES - 1, **{NEVER_DECODE: True}
+    )
+    pipe.llen(key)
+    pipe.lrange(key, 0, page_size - 1)
+    pipe.zcard(key)
+    pipe.zrange(key, 0, page_size - 1, withscores=True)
+    pipe.hlen(key)
+    pipe.hscan(key, cursor=0, count=page_size)
+    pipe.scard(key)
+    pipe.sscan(key, cursor=0, count=page_size)
+    pipe.xlen(key)
+    if stream_reverse:
+        pipe.xrevrange(key, count=page_size)
+    else:
+        pipe.xrange(key, count=page_size)
+    pipe.xinfo_stream(key)
+    pipe.xinfo_groups(key)
+    (
+        k_type,
+        pttl,
+        encoding,
+        memory,
+        strlen,
+        string_bytes,
+        llen,
+        list_page,
+        zcard,
+        zset_page,
+        hlen,
+        hash_scan,
+        scard,
+        set_scan,
+        xlen,
+        stream_page,
+        xinfo,
+        xgroups,
+    ) = await pipe.execute(raise_on_error=False)
+    k_type = _ok(k_type, "none")
+    description: KeyDescription = {
+        "type": k_type,
+        "pttl": _ok(pttl, -2),
+        "encoding": _ok(encoding, ""),
+        "memory_usage": _ok(memory, 0),
+        "length": 0,
+        "string_bytes": b"",
+        "page": None,
+        "next_position": 0,
+        "stream_info": {},
+        "stream_groups": [],
+    }
+    if k_type == "string":
+        description["length"] = _ok(strlen, 0)
+        description["string_bytes"] = _ok(string_bytes, b"")
+    elif k_type == "list":
+        page = _ok(list_page, [])
+        description.update(length=_ok(llen, 0), page=page, next_position=len(page))
+    elif k_type == "zset":
+        page = _ok(zset_page, [])
+        description.update(length=_ok(zcard, 0), page=page, next_position=len(page))
+    elif k_type == "hash":
+        cursor, page = _ok(hash_scan, (0, {}))
+        description.update(length=_ok(hlen, 0), page=page, next_position=cursor)
+    elif k_type == "set":
+        cursor, page = _ok(set_scan, (0, []))
+        description.update(
+            length=_ok(scard, 0), page=sorted(page), next_position=cursor
+        )
+    elif k_type == "stream":
+        page = stream_entries(_ok(stream_page, []))
+        description.update(
+            length=_ok(xlen, 0),
+            page=page,
+            next_position=page[-1]["id"] if len(page) == page_size else "",
+            stream_info=_stream_info(_ok(xinfo, {})),
+            stream_groups=_stream_groups(_ok(xgroups, [])),
+        )
+    return description
+
+
+def has_more(key_type: str, next_position: Union[int, str], length: int) -> bool:
+    if key_type == "stream":
+        return bool(next_position)
+    if key_type in OFFSET_PAGED_TYPES:
+        return next_position < length
+    return next_position != 0
+
+
+def change_scope(events: list[str], key_type: str) -> str:
+    """Narrows a batch of keyspace events to the part of the key it touched.
+
+    Returns "gone", "ttl", "list_head", "list_tail", "list", "stream_tail"
+    or "full".
+    """
+    if events[-1] in REMOVAL_EVENTS:
+        return "gone"
+    kinds = set(events)
+    if kinds <= TTL_EVENTS:
+        return "ttl"
+    if key_type == "list" and kinds <= LIST_HEAD_EVENTS | LIST_TAIL_EVENTS:
+        # Only pure pushes or pure pops on one end leave the rest of the
+        # window predictable; a pop followed by a push replaces elements.
+        if len(kinds) == 1:
+            return "list_head" if kinds <= LIST_HEAD_EVENTS else "list_tail"
+        return "list"
+    if key_type == "stream" and kinds <= STREAM_ADD_EVENTS:
+        return "stream_tail"
+    return "full"
+
+
+async def refresh_list_window(
+    r: aioredis.Redis,
+    key: str,
+    scope: str,
+    offset: int,
+    loaded: list[str],
+    old_length: int,
+    page_size: int,
+) -> tuple[list[str], int]:
+    """Re-reads only the changed edge of a loaded list window after pushes/pops.
+
+    `scope` must come from a batch of only pushes or only pops on one end.
+    Tail operations leave existing indexes in place, so only the part of the
+    window past the old end is read. Head operations on a window at offset 0
+    shift it by the change in length, so only the new head is read. Anything
+    else re-reads the window. Returns the new window and the list length.
+    """
+    length = await r.llen(key)
+    want = max(len(loaded), page_size)
+    if scope == "list_tail":
+        window = loaded[: max(0, length - offset)]
+    elif scope == "list_head" and offset == 0 and abs(length - old_length) < want:
+        shift = length - old_length
+        if shift > 0:
+            window = (await r.lrange(key, 0, shift - 1) + loaded)[:want]
+        else:
+            window = loaded[-shift:]
+    else:
+        return await r.lrange(key, offset, offset + want - 1), length
+    if len(window) < want and offset + len(window) < length:
+        start = offset + len(window)
+        window += await r.lrange(key, start, offset + want - 1)
+    return window, length
\ No newline at end of file
@@ -0,0 +1,279 @@
+import redis.asyncio as aioredis
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Optional
+from redis_browser.backend.pool_registry import get_client
+
+if TYPE_CHECKING:
+    from redis_browser.states.connection_state import RedisConfig
+
+# Delivered to subscribers after the shared connection was re-established,
+# since any notifications published while it was down are lost.
+RESYNC_EVENT = "__resync__"
+RECONNECT_DELAY_SECONDS = 1.0
+# Bounded read wait so the pool's socket_timeout never trips on a quiet server.
+LISTEN_TIMEOUT_SECONDS = 30.0
+KEYSPACE_NOTIFY_FLAGS = "KA"
+KEYEVENT_NOTIFY_FLAGS = "EA"
+# Notification event names, grouped by what they change about a key
+REMOVAL_EVENTS = {"del", "expired", "evicted", "rename_from", "move_from"}
+FLUSH_EVENTS = {"flushdb", "flushall"}
+TTL_EVENTS = {"expire", "persist"}
+LIST_HEAD_EVENTS = {"lpush", "lpop"}
+LIST_TAIL_EVENTS = {"rpush", "rpop"}
+STREAM_ADD_EVENTS = {"xadd"}
+
+
+def keyspace_channel(db: int, key: str) -> str:
+    return f"__keyspace@{db}__:{key}"
+
+
+def keyevent_pattern(db: int) -> str:
+    return f"__keyevent@{db}__:*"
+
+
+def keyevent_name(channel: str) -> str:
+    """Extracts the event name from a __keyevent@<db>__:<event> channel."""
+    return channel.split("__:", 1)[-1]
+
+
+class Subscription:
+    """A single session's interest in one channel (or pattern) on a server."""
+
+    def __init__(self, owner: str, channel: str, is_pattern: bool, maxsize: int = 0):
+        self.owner = owner
+        self.channel = channel
+        self.is_pattern = is_pattern
+        self.queue: asyncio.Queue[Optional[tuple[str, str]]] = asyncio.Queue(maxsize)
+        self.closed = False
+        # Messages discarded because the consumer fell behind a bounded queue
+        self.dropped = 0
+        self.listener: Optional["_ServerListener"] = None
+
+    def deliver(self, channel: str, data: str):
+        if self.closed:
+            return
+        try:
+            self.queue.put_nowait((channel, data))
+        except asyncio.QueueFull:
+            self.dropped += 1
+
+    def drain(self) -> list[Optional[tuple[str, str]]]:
+        """Returns everything already queued without waiting."""
+        items = []
+        while not self.queue.empty():
+            items.append(self.queue.get_nowait())
+        return items
+
+    def close(self):
+        """Wakes the consumer with a None sentinel; safe to call from sync code."""
+        if not self.closed:
+            self.closed = True
+            if self.queue.full():
+                self.queue.get_nowait()
+                self.dropped += 1
+            self.queue.put_nowait(None)
+
+    async def next_event(self) -> Optional[tuple[str, str]]:
+        """Returns the next (channel, data) pair, or None once closed."""
+        if self.closed and self.queue.empty():
+            return None
+        return await self.queue.get()
+
+
+class _ServerListener:
+    """One pub/sub connection per server, multiplexing every watched channel."""
+
+    def __init__(self, config: "RedisConfig"):
+        self.config = config
+        self.name = config["name"]
+        self._subscribers: dict[tuple[str, bool], set[Subscription]] = {}
+        self._pubsub: Optional[aioredis.client.PubSub] = None
+        self._task: Optional[asyncio.Task] = None
+        self._lock = asyncio.Lock()
+        self._ensured_flags: set[str] = set()
+
+    @property
+    def is_idle(self) -> bool:
+        return not self._subscribers
+
+    async def add(self, sub: Subscription, notify_flags: str):
+        async with self._lock:
+            await self._ensure_notifications(notify_flags)
+            topic = (sub.channel, sub.is_pattern)
+            subscribers = self._subscribers.setdefault(topic, set())
+            subscribers.add(sub)
+            sub.listener = self
+            if len(subscribers) > 1:
+                return
+            if self._pubsub is None:
+                self._pubsub = get_client(self.config).pubsub()
+            await self._subscribe(self._pubsub, [topic])
+            if self._task is None or self._task.done():
+                self._task = asyncio.create_task(self._run())
+
+    async def remove(self, sub: Subscription):
+        async with self._lock:
+            topic = (sub.channel, sub.is_pattern)
+            subscribers = self._subscribers.get(topic)
+            if not subscribers or sub not in subscribers:
+                return
+            subscribers.discard(sub)
+            if subscribers:
+                return
+            del self._subscribers[topic]
+            if self._subscribers:
+                try:
+                    if sub.is_pattern:
+                        await self._pubsub.punsubscribe(sub.channel)
+                    else:
+                        await self._pubsub.unsubscribe(sub.channel)
+                except Exception as e:
+                    logging.warning(f"Unsubscribe from '{sub.channel}' failed: {e}")
+                return
+            await self._shutdown()
+
+    async def _ensure_notifications(self, flags: str):
+        """Merges flags into notify-keyspace-events, once per flag per server."""
+        wanted = [flag for flag in flags if flag not in self._ensured_flags]
+        if not wanted:
+            return
+        self._ensured_flags.update(wanted)
+        r = get_client(self.config)
+        try:
+            current = (await r.config_get("notify-keyspace-events")).get(
+                "notify-keyspace-events", ""
+            )
+            missing = [flag for flag in wanted if flag not in current]
+            if missing:
+                await r.config_set("notify-keyspace-events", current + "".join(missing))
+        except aioredis.ResponseError:
+            logging.warning(
+                "Could not enable keyspace notifications via CONFIG SET. "
+                f"Ensure 'notify-keyspace-events' includes '{flags}' in redis.conf."
+            )
+
+    @staticmethod
+    async def _subscribe(pubsub, topics: list[tuple[str, bool]]):
+        channels = [channel for channel, is_pattern in topics if not is_pattern]
+        patterns = [channel for channel, is_pattern in topics if is_pattern]
+        if channels:
+            await pubsub.subscribe(*channels)
+        if patterns:
+            await pubsub.psubscribe(*patterns)
+
+    async def _run(self):
+        while self._pubsub is not None:
+            pubsub = self._pubsub
+            try:
+                msg = await pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=LISTEN_TIMEOUT_SECONDS
+                )
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if self._pubsub is not pubsub:
+                    # Shut down or replaced while the read was in flight
+                    return
+                logging.warning(f"Keyspace listener for '{self.name}' lost: {e}")
+                if not await self._reconnect():
+                    return
+                continue
+            if not msg:
+                continue
+            if msg["type"] == "pmessage":
+                topic = (msg["pattern"], True)
+            else:
+                topic = (msg["channel"], False)
+            for sub in list(self._subscribers.get(topic, ())):
+                sub.deliver(msg["channel"], msg["data"])
+
+    async def _reconnect(self) -> bool:
+        while True:
+            await asyncio.sleep(RECONNECT_DELAY_SECONDS)
+            async with self._lock:
+                if self.is_idle:
+                    return False
+                await self._close_pubsub()
+                try:
+                    self._pubsub = get_client(self.config).pubsub()
+                    await self._subscribe(self._pubsub, list(self._subscribers))
+                except Exception as e:
+                    logging.warning(f"Keyspace listener reconnect failed: {e}")
+                    continue
+                for subscribers in self._subscribers.values():
+                    for sub in subscribers:
+                        sub.deliver("", RESYNC_EVENT)
+                logging.info(f"Keyspace listener for '{self.name}' reconnected")
+                return True
+
+    async def _shutdown(self):
+        if self._task and self._task is not asyncio.current_task():
+            self._task.cancel()
+        self._task = None
+        await self._close_pubsub()
+
+    async def _close_pubsub(self):
+        if self._pubsub is None:
+            return
+        try:
+            await self._pubsub.aclose()
+        except Exception:
+            pass
+        self._pubsub = None
+
+
+class KeyspaceDispatcher:
+    """Routes keyspace notifications from shared per-server listeners to sessions."""
+
+    def __init__(self):
+        self._listeners: dict[tuple, _ServerListener] = {}
+        self._owned: dict[tuple[str, str], Subscription] = {}
+
+    @staticmethod
+    def _server_key(config: "RedisConfig") -> tuple:
+        return (config["host"], config["port"], config["password"])
+
+    async def subscribe(
+        self,
+        owner: str,
+        config: "RedisConfig",
+        channel: str,
+        is_pattern: bool = False,
+        slot: str = "default",
+        notify_flags: str = KEYSPACE_NOTIFY_FLAGS,
+        maxsize: int = 0,
+    ) -> Subscription:
+        """Subscribes `owner` to a channel, replacing its previous one in `slot`."""
+        self.close_owner(owner, slot)
+        sub = Subscription(owner, channel, is_pattern, maxsize)
+        self._owned[(owner, slot)] = sub
+        server_key = self._server_key(config)
+        listener = self._listeners.get(server_key)
+        if listener is None:
+            listener = _ServerListener(config)
+            self._listeners[server_key] = listener
+        await listener.add(sub, notify_flags)
+        return sub
+
+    def close_owner(self, owner: str, slot: str = "default"):
+        sub = self._owned.pop((owner, slot), None)
+        if sub:
+            sub.close()
+
+    async def release(self, sub: Subscription):
+        """Detaches a closed or abandoned subscription from its server listener."""
+        sub.close()
+        for key, owned in list(self._owned.items()):
+            if owned is sub:
+                del self._owned[key]
+        listener = sub.listener
+        if listener is None:
+            return
+        await listener.remove(sub)
+        for server_key, candidate in list(self._listeners.items()):
+            if candidate is listener and listener.is_idle:
+                del self._listeners[server_key]
+
+
+dispatcher = KeyspaceDispatcher()
\ No newline at end of file
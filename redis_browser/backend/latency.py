@@ -0,0 +1,295 @@
+import redis.asyncio as aioredis
+import collections
+import threading
+import time
+from typing import Any, Optional, TypedDict
+from redis.exceptions import ResponseError
+
+# Rolling window kept per command, in slices that expire whole
+LATENCY_WINDOW_SECONDS = 300
+LATENCY_SLICE_SECONDS = 30
+# 2**4 linear sub-buckets per power of two: values within ~6% share a bucket
+SUB_BUCKET_BITS = 4
+SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+PERCENTILES = (50, 95, 99)
+# Commands whose first argument names the actual operation
+CONTAINER_COMMANDS = {
+    "ACL",
+    "CLIENT",
+    "CLUSTER",
+    "COMMAND",
+    "CONFIG",
+    "FUNCTION",
+    "LATENCY",
+    "MEMORY",
+    "MODULE",
+    "OBJECT",
+    "PUBSUB",
+    "SCRIPT",
+    "SLOWLOG",
+    "XGROUP",
+    "XINFO",
+}
+# After these a connection only streams pushed messages, which have no latency
+STREAMING_COMMANDS = {"SUBSCRIBE", "PSUBSCRIBE", "SSUBSCRIBE", "MONITOR"}
+
+
+class LatencyStats(TypedDict):
+    connection: str
+    command: str
+    count: int
+    mean_us: int
+    p50_us: int
+    p95_us: int
+    p99_us: int
+    max_us: int
+
+
+def format_latency(micros: int) -> str:
+    if micros < 1000:
+        return f"{micros} µs"
+    return f"{micros / 1000:.2f} ms"
+
+
+def _bucket_index(micros: int) -> int:
+    if micros < 2 * SUB_BUCKETS:
+        return micros
+    shift = micros.bit_length() - SUB_BUCKET_BITS - 1
+    return (shift + 1) * SUB_BUCKETS + (micros >> shift) - SUB_BUCKETS
+
+
+def _bucket_upper(index: int) -> int:
+    """Highest value that falls in a bucket, as HDR histograms report."""
+    if index < 2 * SUB_BUCKETS:
+        return index
+    shift = index // SUB_BUCKETS - 1
+    return ((index - shift * SUB_BUCKETS + 1) << shift) - 1
+
+
+class LatencyHistogram:
+    """Log-linear latency histogram in microseconds, HDR style.
+
+    Buckets are exact below 32µs and otherwise keep a bounded relative
+    error, so percentiles stay accurate from local round trips to
+    multi-second stalls in a few hundred sparse counters.
+    """
+
+    def __init__(self):
+        self.counts: dict[int, int] = collections.defaultdict(int)
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def record(self, micros: int):
+        micros = max(0, micros)
+        self.counts[_bucket_index(micros)] += 1
+        self.count += 1
+        self.total += micros
+        self.max = max(self.max, micros)
+
+    def merge(self, other: "LatencyHistogram"):
+        for index, count in other.counts.items():
+            self.counts[index] += count
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    def percentile(self, percent: float) -> int:
+        if not self.count:
+            return 0
+        rank = max(1, round(self.count * percent / 100))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return min(_bucket_upper(index), self.max)
+        return self.max
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "mean_us": self.total // self.count if self.count else 0,
+            "max_us": self.max,
+            **{f"p{p}_us": self.percentile(p) for p in PERCENTILES},
+            "buckets": [
+                {"le_us": _bucket_upper(index), "count": self.counts[index]}
+                for index in sorted(self.counts)
+            ],
+        }
+
+
+class LatencyRecorder:
+    """Process-wide rolling latency histograms per (connection, command)."""
+
+    def __init__(
+        self,
+        window: float = LATENCY_WINDOW_SECONDS,
+        slice_seconds: float = LATENCY_SLICE_SECONDS,
+    ):
+        self.window = window
+        self.slice_seconds = slice_seconds
+        self._slices: dict[
+            tuple[str, str], collections.deque[tuple[float, LatencyHistogram]]
+        ] = {}
+        self._lock = threading.Lock()
+
+    def record(self, connection: str, command: str, micros: int):
+        now = time.monotonic()
+        slice_start = now - now % self.slice_seconds
+        with self._lock:
+            slices = self._slices.setdefault((connection, command), collections.deque())
+            if not slices or slices[-1][0] != slice_start:
+                slices.append((slice_start, LatencyHistogram()))
+            slices[-1][1].record(micros)
+
+    def histograms(
+        self, connection: Optional[str] = None
+    ) -> dict[tuple[str, str], LatencyHistogram]:
+        """Merges the live window of each command, optionally for one connection."""
+        cutoff = time.monotonic() - self.window
+        merged = {}
+        with self._lock:
+            for key, slices in list(self._slices.items()):
+                while slices and slices[0][0] + self.slice_seconds < cutoff:
+                    slices.popleft()
+                if not slices:
+                    del self._slices[key]
+                    continue
+                if connection is not None and key[0] != connection:
+                    continue
+                histogram = LatencyHistogram()
+                for _, part in slices:
+                    histogram.merge(part)
+                merged[key] = histogram
+        return merged
+
+    def stats(self, connection: Optional[str] = None) -> list[LatencyStats]:
+        """Per-command rows, plus an "(all)" row per connection, slowest p99 first."""
+        histograms = self.histograms(connection)
+        totals: dict[str, LatencyHistogram] = {}
+        for (conn, _), histogram in histograms.items():
+            totals.setdefault(conn, LatencyHistogram()).merge(histogram)
+        rows = [
+            _stats_row(conn, "(all)", histogram) for conn, histogram in totals.items()
+        ]
+        commands = [
+            _stats_row(conn, command, histogram)
+            for (conn, command), histogram in histograms.items()
+        ]
+        commands.sort(key=lambda row: row["p99_us"], reverse=True)
+        return sorted(rows, key=lambda row: row["connection"]) + commands
+
+    def export(self, connection: Optional[str] = None) -> dict[str, Any]:
+        return {
+            "window_seconds": self.window,
+            "generated_at": time.time(),
+            "histograms": [
+                {"connection": conn, "command": command, **histogram.to_dict()}
+                for (conn, command), histogram in sorted(
+                    self.histograms(connection).items()
+                )
+            ],
+        }
+
+    def reset(self, connection: Optional[str] = None):
+        with self._lock:
+            for key in list(self._slices):
+                if connection is None or key[0] == connection:
+                    del self._slices[key]
+
+
+def _stats_row(connection: str, command: str, h: LatencyHistogram) -> LatencyStats:
+    return {
+        "connection": connection,
+        "command": command,
+        "count": h.count,
+        "mean_us": h.total // h.count if h.count else 0,
+        "p50_us": h.percentile(50),
+        "p95_us": h.percentile(95),
+        "p99_us": h.percentile(99),
+        "max_us": h.max,
+    }
+
+
+recorder = LatencyRecorder()
+
+
+def _text(arg: Any) -> str:
+    if isinstance(arg, (bytes, bytearray, memoryview)):
+        return bytes(arg).decode(errors="replace")
+    return str(arg)
+
+
+def command_name(args: tuple) -> str:
+    """Names a command for the histograms, e.g. "GET" or "CLIENT SETINFO"."""
+    parts = _text(args[0]).upper().split()
+    if len(parts) == 1 and parts[0] in CONTAINER_COMMANDS and len(args) > 1:
+        parts.append(_text(args[1]).upper())
+    return " ".join(parts[:2])
+
+
+class TimedConnection(aioredis.Connection):
+    """A connection that times every reply against the command it answers.
+
+    Commands are queued by name when packed and stamped once their write
+    completes; each reply is matched to the oldest outstanding command.
+    A pipelined reply is timed from the later of its send and the
+    previous reply, so a batch of N commands is not counted as N full
+    round trips.
+    """
+
+    def __init__(self, *, latency_key: str = "", **kwargs):
+        super().__init__(**kwargs)
+        self.latency_key = latency_key
+        self._packed: list[str] = []
+        self._sent: collections.deque[tuple[str, float]] = collections.deque()
+        self._last_reply = 0.0
+        self._streaming = False
+
+    def pack_command(self, *args):
+        name = command_name(args)
+        if name in STREAMING_COMMANDS:
+            self._streaming = True
+        self._packed.append(name)
+        return super().pack_command(*args)
+
+    async def send_packed_command(self, command, check_health: bool = True):
+        # Taken first: the handshake on a fresh connection packs its own
+        names, self._packed = self._packed, []
+        await super().send_packed_command(command, check_health)
+        if self._streaming:
+            self._sent.clear()
+            return
+        sent_at = time.perf_counter()
+        self._sent.extend((name, sent_at) for name in names)
+
+    async def read_response(
+        self,
+        disable_decoding: bool = False,
+        timeout: Optional[float] = None,
+        **kwargs,
+    ):
+        try:
+            response = await super().read_response(disable_decoding, timeout, **kwargs)
+        except ResponseError:
+            self._record_reply()
+            raise
+        # With an explicit timeout a None reply may just mean nothing arrived
+        if response is not None or timeout is None:
+            self._record_reply()
+        return response
+
+    async def disconnect(self, *args, **kwargs):
+        self._packed.clear()
+        self._sent.clear()
+        self._streaming = False
+        await super().disconnect(*args, **kwargs)
+
+    def _record_reply(self):
+        if not self._sent:
+            return
+        name, sent_at = self._sent.popleft()
+        now = time.perf_counter()
+        started = max(sent_at, self._last_reply)
+        self._last_reply = now
+        recorder.record(self.latency_key, name, int((now - started) * 1_000_000))
\ No newline at end of file
@@ -0,0 +1,121 @@
+import redis.asyncio as aioredis
+import hashlib
+import time
+from typing import TYPE_CHECKING, Any, Awaitable, TypedDict
+from redis.exceptions import NoScriptError
+from redis_browser.backend.pool_registry import get_client
+
+if TYPE_CHECKING:
+    from redis_browser.states.connection_state import RedisConfig
+
+
+class SavedScript(TypedDict):
+    name: str
+    source: str
+
+
+def script_sha(source: str) -> str:
+    """The SHA1 that SCRIPT LOAD returns, computed locally."""
+    return hashlib.sha1(source.encode()).hexdigest()
+
+
+class ScriptCache:
+    """Script SHAs known to be loaded on each server.
+
+    A script is sent with SCRIPT LOAD the first time it runs against a
+    server and invoked by EVALSHA from then on. A NOSCRIPT reply (after
+    SCRIPT FLUSH or a restart) drops it from the cache and reloads it.
+    """
+
+    def __init__(self):
+        self._loaded: dict[tuple, set[str]] = {}
+
+    @staticmethod
+    def _server_key(config: "RedisConfig") -> tuple:
+        return (config["host"], config["port"])
+
+    async def ensure_loaded(self, config: "RedisConfig", source: str) -> str:
+        loaded = self._loaded.setdefault(self._server_key(config), set())
+        sha = script_sha(source)
+        if sha not in loaded:
+            await get_client(config).script_load(source)
+            loaded.add(sha)
+        return sha
+
+    def forget(self, config: "RedisConfig", sha: str):
+        self._loaded.get(self._server_key(config), set()).discard(sha)
+
+    async def run(
+        self,
+        config: "RedisConfig",
+        source: str,
+        keys: list[str],
+        args: list[str],
+    ) -> tuple[Any, int, bool]:
+        """Runs a script once by EVALSHA.
+
+        Returns (reply, microseconds, reloaded); the timing covers the
+        EVALSHA that produced the reply only, not a SCRIPT LOAD or the
+        call that hit NOSCRIPT.
+        """
+        r = get_client(config)
+        sha = await self.ensure_loaded(config, source)
+        try:
+            reply, elapsed = await _timed(r.evalsha(sha, len(keys), *keys, *args))
+            return reply, elapsed, False
+        except NoScriptError:
+            self.forget(config, sha)
+        await self.ensure_loaded(config, source)
+        reply, elapsed = await _timed(r.evalsha(sha, len(keys), *keys, *args))
+        return reply, elapsed, True
+
+    async def run_per_key(
+        self,
+        config: "RedisConfig",
+        source: str,
+        keys: list[str],
+        args: list[str],
+    ) -> tuple[list[Any], int, bool]:
+        """Runs a script once for each key, pipelined in one round trip.
+
+        Returns the per-key replies (errors as exceptions), the
+        microseconds spent in EVALSHA pipelines and whether the script had
+        to be reloaded. Calls that hit NOSCRIPT are re-sent once after
+        reloading; the SCRIPT LOAD in between is not counted.
+        """
+        r = get_client(config)
+        sha = await self.ensure_loaded(config, source)
+        replies, elapsed = await _timed(_evalsha_each(r, sha, keys, args))
+        missing = [
+            i for i, reply in enumerate(replies) if isinstance(reply, NoScriptError)
+        ]
+        if missing:
+            self.forget(config, sha)
+            await self.ensure_loaded(config, source)
+            retried, retry_elapsed = await _timed(
+                _evalsha_each(r, sha, [keys[i] for i in missing], args)
+            )
+            # A pipeline that only hit NOSCRIPT ran nothing; time the retry alone
+            elapsed = retry_elapsed + (elapsed if len(missing) < len(keys) else 0)
+            for i, reply in zip(missing, retried):
+                replies[i] = reply
+        return replies, elapsed, bool(missing)
+
+
+async def _timed(call: Awaitable) -> tuple[Any, int]:
+    """Awaits `call`, returning its result and the microseconds it took."""
+    started = time.perf_counter()
+    result = await call
+    return result, int((time.perf_counter() - started) * 1_000_000)
+
+
+async def _evalsha_each(
+    r: aioredis.Redis, sha: str, keys: list[str], args: list[str]
+) -> list[Any]:
+    pipe = r.pipeline(transaction=False)
+    for key in keys:
+        pipe.evalsha(sha, 1, key, *args)
+    return await pipe.execute(raise_on_error=False)
+
+
+scripts = ScriptCache()
\ No newline at end of file
@@ -0,0 +1,247 @@
+import asyncio
+import collections
+import datetime
+import logging
+import re
+import time
+from typing import TYPE_CHECKING, Optional, TypedDict
+from redis_browser.backend.command_info import command_table, key_args
+from redis_browser.backend.pool_registry import get_client
+
+if TYPE_CHECKING:
+    from redis_browser.states.connection_state import RedisConfig
+
+MONITOR_QUEUE_SIZE = 1000
+MONITOR_DEFAULT_SAMPLE = 10
+MONITOR_DEFAULT_SECONDS = 60
+# MONITOR costs the server on every command; never leave it running unattended
+MONITOR_MAX_SECONDS = 600
+MONITOR_READ_TIMEOUT_SECONDS = 1.0
+MONITOR_ARGS_PREVIEW = 200
+RATE_WINDOW_SECONDS = 10
+RATE_TOP = 10
+NO_PREFIX = "(none)"
+
+_LINE_RE = re.compile(r"^(\d+(?:\.\d+)?) \[(\d+) ([^\]]*)\] (.*)$")
+_ARG_RE = re.compile(r'"((?:[^"\\]|\\.)*)"')
+_ESCAPE_RE = re.compile(r"\\(x[0-9a-fA-F]{2}|.)")
+_ESCAPES = {"n": "\n", "r": "\r", "t": "\t", "a": "\a", "b": "\b"}
+
+
+class MonitorLine(TypedDict):
+    time: str
+    client: str
+    db: int
+    command: str
+    # Raw quoted arguments as MONITOR printed them, truncated
+    args: str
+
+
+class RateRow(TypedDict):
+    name: str
+    ops_per_sec: float
+
+
+def _unescape(arg: str) -> str:
+    """Undoes the sdscatrepr quoting MONITOR applies to each argument."""
+
+    def replace(match: re.Match) -> str:
+        escape = match.group(1)
+        if escape.startswith("x") and len(escape) == 3:
+            return chr(int(escape[1:], 16))
+        return _ESCAPES.get(escape, escape)
+
+    return _ESCAPE_RE.sub(replace, arg)
+
+
+def parse_monitor_line(raw: str) -> Optional[tuple[MonitorLine, list[str]]]:
+    """Splits a MONITOR line into a display row and the unescaped argv."""
+    match = _LINE_RE.match(raw)
+    if not match:
+        return None
+    timestamp, db, client, rest = match.groups()
+    argv = [_unescape(arg) for arg in _ARG_RE.findall(rest)]
+    if not argv:
+        return None
+    args_start = rest.find('"', rest.find('"', 1) + 1)
+    args = rest[args_start:] if args_start > 0 else ""
+    if len(args) > MONITOR_ARGS_PREVIEW:
+        args = args[:MONITOR_ARGS_PREVIEW] + "..."
+    when = datetime.datetime.fromtimestamp(float(timestamp))
+    line: MonitorLine = {
+        "time": when.strftime("%H:%M:%S.%f")[:-3],
+        "client": client,
+        "db": int(db),
+        "command": argv[0].upper(),
+        "args": args,
+    }
+    return line, argv
+
+
+def key_prefix(key: str, delimiter: str = ":") -> str:
+    if delimiter not in key:
+        return NO_PREFIX
+    return key.split(delimiter, 1)[0] + delimiter
+
+
+class MonitorSession:
+    """A time-limited MONITOR stream, filtered, sampled and aggregated here.
+
+    Every matching command counts toward the ops/sec rates, but only one
+    in `sample_rate` is queued for the UI, and the queue is bounded: when
+    the consumer falls behind, lines are dropped and counted instead.
+    """
+
+    def __init__(
+        self,
+        config: "RedisConfig",
+        sample_rate: int = MONITOR_DEFAULT_SAMPLE,
+        max_seconds: int = MONITOR_DEFAULT_SECONDS,
+        prefix: str = "",
+        commands: Optional[set[str]] = None,
+    ):
+        self.config = config
+        self.sample_rate = max(1, sample_rate)
+        self.max_seconds = min(max(1, max_seconds), MONITOR_MAX_SECONDS)
+        self.prefix = prefix
+        self.commands = {command.upper() for command in commands or ()}
+        self.queue: asyncio.Queue[MonitorLine] = asyncio.Queue(MONITOR_QUEUE_SIZE)
+        self.seen = 0
+        self.matched = 0
+        self.dropped = 0
+        self.error = ""
+        self.finished = False
+        self.started_at = time.monotonic()
+        # (second, command counts, prefix counts) over the rate window
+        self._rates: collections.deque[
+            tuple[int, collections.Counter, collections.Counter]
+        ] = collections.deque()
+        self._conn = None
+        self._task: Optional[asyncio.Task] = None
+        self._table = {}
+
+    @property
+    def remaining_seconds(self) -> int:
+        if self.finished:
+            return 0
+        return max(0, int(self.started_at + self.max_seconds - time.monotonic()))
+
+    async def start(self):
+        self._table = await command_table.ensure(self.config)
+        pool = get_client(self.config).connection_pool
+        conn = pool.connection_class(**pool.connection_kwargs)
+        await conn.connect()
+        try:
+            await conn.send_command("MONITOR")
+            await conn.read_response()
+        except BaseException:
+            await conn.disconnect()
+            raise
+        self._conn = conn
+        self.started_at = time.monotonic()
+        self._task = asyncio.create_task(self._run())
+
+    def stop(self):
+        if self._task and not self._task.done():
+            self._task.cancel()
+
+    def drain(self) -> list[MonitorLine]:
+        lines = []
+        while not self.queue.empty():
+            lines.append(self.queue.get_nowait())
+        return lines
+
+    def rates(self) -> tuple[list[RateRow], list[RateRow]]:
+        """Top commands and key prefixes by ops/sec over the rate window."""
+        now = int(time.monotonic())
+        self._expire_rates(now)
+        commands, prefixes = collections.Counter(), collections.Counter()
+        for _, command_counts, prefix_counts in self._rates:
+            commands.update(command_counts)
+            prefixes.update(prefix_counts)
+        elapsed = max(1.0, min(RATE_WINDOW_SECONDS, time.monotonic() - self.started_at))
+
+        def rows(counts: collections.Counter) -> list[RateRow]:
+            return [
+                {"name": name, "ops_per_sec": round(count / elapsed, 1)}
+                for name, count in counts.most_common(RATE_TOP)
+            ]
+
+        return rows(commands), rows(prefixes)
+
+    def _expire_rates(self, now: int):
+        while self._rates and self._rates[0][0] <= now - RATE_WINDOW_SECONDS:
+            self._rates.popleft()
+
+    def _count(self, command: str, prefixes: set[str]):
+        now = int(time.monotonic())
+        if not self._rates or self._rates[-1][0] != now:
+            self._expire_rates(now)
+            self._rates.append((now, collections.Counter(), collections.Counter()))
+        _, command_counts, prefix_counts = self._rates[-1]
+        command_counts[command] += 1
+        prefix_counts.update(prefixes)
+
+    def _keys(self, argv: list[str]) -> list[str]:
+        spec = command_table.lookup(self._table, argv)
+        return key_args(spec, argv) if spec else []
+
+    async def _run(self):
+        conn = self._conn
+        deadline = self.started_at + self.max_seconds
+        try:
+            while time.monotonic() < deadline:
+                raw = await conn.read_response(timeout=MONITOR_READ_TIMEOUT_SECONDS)
+                if raw is None:
+                    continue
+                parsed = parse_monitor_line(str(raw))
+                if parsed is None:
+                    continue
+                self.seen += 1
+                line, argv = parsed
+                if self.commands and line["command"] not in self.commands:
+                    continue
+                keys = self._keys(argv)
+                if self.prefix and not any(k.startswith(self.prefix) for k in keys):
+                    continue
+                self.matched += 1
+                self._count(line["command"], {key_prefix(key) for key in keys})
+                if self.matched % self.sample_rate:
+                    continue
+                try:
+                    self.queue.put_nowait(line)
+                except asyncio.QueueFull:
+                    self.dropped += 1
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logging.warning(f"MONITOR for '{self.config['name']}' failed: {e}")
+            self.error = str(e)
+        finally:
+            self.finished = True
+            # MONITOR cannot be turned off; closing the connection ends it
+            try:
+                await conn.disconnect()
+            except Exception:
+                pass
+
+
+class MonitorRegistry:
+    """At most one MONITOR session per browser session."""
+
+    def __init__(self):
+        self._sessions: dict[str, MonitorSession] = {}
+
+    async def start(self, owner: str, session: MonitorSession) -> MonitorSession:
+        self.stop(owner)
+        await session.start()
+        self._sessions[owner] = session
+        return session
+
+    def stop(self, owner: str):
+        session = self._sessions.pop(owner, None)
+        if session:
+            session.stop()
+
+
+monitors = MonitorRegistry()
\ No newline at end of file
@@ -0,0 +1,184 @@
+import redis.asyncio as aioredis
+import asyncio
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING, Optional, TypedDict
+from redis_browser.backend.latency import TimedConnection
+
+if TYPE_CHECKING:
+    from redis_browser.states.connection_state import RedisConfig
+
+DEFAULT_MAX_CONNECTIONS = 10
+IDLE_TIMEOUT_SECONDS = 300
+SOCKET_TIMEOUT_SECONDS = 5
+# How long a command waits for a free pooled connection before failing
+POOL_WAIT_SECONDS = 10
+
+
+class PoolStats(TypedDict):
+    id: str
+    name: str
+    address: str
+    in_use: int
+    idle: int
+    max_connections: int
+    checkouts: int
+    idle_seconds: int
+
+
+class _PoolEntry:
+    def __init__(self, config: "RedisConfig"):
+        self.name = config["name"]
+        self.max_connections = _max_connections(config)
+        self.address = pool_address(config)
+        # Blocking, so a burst beyond max_connections queues instead of failing
+        self.pool = aioredis.BlockingConnectionPool(
+            connection_class=TimedConnection,
+            timeout=POOL_WAIT_SECONDS,
+            latency_key=self.address,
+            host=config["host"],
+            port=config["port"],
+            password=config["password"] if config["password"] else None,
+            db=config["db"],
+            socket_timeout=SOCKET_TIMEOUT_SECONDS,
+            decode_responses=True,
+            max_connections=self.max_connections,
+        )
+        self.client = aioredis.Redis(connection_pool=self.pool)
+        self.checkouts = 0
+        self.last_used = time.monotonic()
+
+    def in_use(self) -> int:
+        return len(getattr(self.pool, "_in_use_connections", ()))
+
+    def idle(self) -> int:
+        return len(getattr(self.pool, "_available_connections", ()))
+
+
+def pool_address(config: "RedisConfig") -> str:
+    return f"{config['host']}:{config['port']}/{config['db']}"
+
+
+def _max_connections(config: "RedisConfig") -> int:
+    return max(1, int(config.get("max_connections") or DEFAULT_MAX_CONNECTIONS))
+
+
+def _fingerprint(config: "RedisConfig") -> tuple:
+    return (
+        config["host"],
+        config["port"],
+        config["password"],
+        config["db"],
+        _max_connections(config),
+    )
+
+
+class PoolRegistry:
+    """Process-wide connection pools shared by every session, keyed by config id
+    and connection settings."""
+
+    def __init__(self, idle_timeout: float = IDLE_TIMEOUT_SECONDS):
+        self.idle_timeout = idle_timeout
+        self._entries: dict[tuple[str, tuple], _PoolEntry] = {}
+        self._lock = threading.Lock()
+        self._closing: set[asyncio.Task] = set()
+
+    def get_client(self, config: "RedisConfig") -> aioredis.Redis:
+        entry_key = (config["id"], _fingerprint(config))
+        with self._lock:
+            self._evict_idle_locked()
+            entry = self._entries.get(entry_key)
+            if entry is None:
+                entry = _PoolEntry(config)
+                self._entries[entry_key] = entry
+            entry.name = config["name"]
+            entry.checkouts += 1
+            entry.last_used = time.monotonic()
+            return entry.client
+
+    def invalidate(
+        self, config: "RedisConfig", replacement: Optional["RedisConfig"] = None
+    ):
+        """Closes the pool for exactly this version of a config, unless
+        `replacement` would reuse it; sessions holding another version of the
+        same config id keep theirs."""
+        entry_key = (config["id"], _fingerprint(config))
+        if replacement and entry_key == (replacement["id"], _fingerprint(replacement)):
+            return
+        with self._lock:
+            entry = self._entries.pop(entry_key, None)
+        if entry is not None:
+            self._close_entry(entry)
+
+    def evict_idle(self):
+        with self._lock:
+            self._evict_idle_locked()
+
+    def stats(self, configs: list["RedisConfig"]) -> list[PoolStats]:
+        """Stats for the pools of `configs` only, not every session's."""
+        keys = {(config["id"], _fingerprint(config)) for config in configs}
+        now = time.monotonic()
+        with self._lock:
+            return [
+                {
+                    "id": entry_key[0],
+                    "name": entry.name,
+                    "address": entry.address,
+                    "in_use": entry.in_use(),
+                    "idle": entry.idle(),
+                    "max_connections": entry.max_connections,
+                    "checkouts": entry.checkouts,
+                    "idle_seconds": int(now - entry.last_used),
+                }
+                for entry_key, entry in self._entries.items()
+                if entry_key in keys
+            ]
+
+    def _evict_idle_locked(self):
+        now = time.monotonic()
+        for entry_key, entry in list(self._entries.items()):
+            if entry.in_use() == 0 and now - entry.last_used > self.idle_timeout:
+                logging.info(f"Evicting idle Redis pool for '{entry.name}'")
+                del self._entries[entry_key]
+                self._close_entry(entry)
+
+    def _close_entry(self, entry: _PoolEntry):
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        task = loop.create_task(self._disconnect(entry))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    @staticmethod
+    async def _disconnect(entry: _PoolEntry):
+        try:
+            await entry.pool.disconnect(inuse_connections=False)
+        except Exception as e:
+            logging.warning(f"Error closing Redis pool for '{entry.name}': {e}")
+
+
+registry = PoolRegistry()
+
+
+def get_client(config: "RedisConfig") -> aioredis.Redis:
+    """Returns a pooled asyncio client for the given connection config."""
+    return registry.get_client(config)
+
+
+def dedicated_client(config: "RedisConfig") -> aioredis.Redis:
+    """Returns a client on its own connection, outside the shared pool.
+
+    For commands whose connection state must not leak to other sessions,
+    or that hold a connection for long; `aclose()` disconnects it.
+    """
+    pool = get_client(config).connection_pool
+    return aioredis.Redis.from_pool(
+        aioredis.ConnectionPool(
+            connection_class=pool.connection_class,
+            max_connections=1,
+            **pool.connection_kwargs,
+        )
+    )
\ No newline at end of file
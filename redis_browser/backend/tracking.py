@@ -0,0 +1,354 @@
+import redis.asyncio as aioredis
+import asyncio
+import collections
+import copy
+import logging
+import time
+from typing import TYPE_CHECKING, Optional
+from redis_browser.backend.key_values import KeyDescription, describe_key
+from redis_browser.backend.keyspace_listener import (
+    LISTEN_TIMEOUT_SECONDS,
+    RECONNECT_DELAY_SECONDS,
+    RESYNC_EVENT,
+    Subscription,
+)
+from redis_browser.backend.pool_registry import SOCKET_TIMEOUT_SECONDS, get_client
+
+if TYPE_CHECKING:
+    from redis_browser.states.connection_state import RedisConfig
+
+# How the details view learns that a watched key changed
+WATCH_MODES = ["keyspace", "tracking"]
+DEFAULT_WATCH_MODE = "keyspace"
+INVALIDATE_CHANNEL = "__redis__:invalidate"
+INVALIDATE_EVENT = "invalidate"
+# Descriptions kept per server, least recently used dropped first
+TRACKING_CACHE_SIZE = 256
+# A server nobody watches keeps tracking (and its cache) this long, then stops
+TRACKING_IDLE_SECONDS = 120
+
+
+def uses_tracking(config: "RedisConfig") -> bool:
+    return config.get("watch_mode") == "tracking"
+
+
+def tracking_prefixes(config: "RedisConfig") -> list[str]:
+    raw = config.get("tracking_prefixes") or ""
+    return [prefix.strip() for prefix in raw.split(",") if prefix.strip()]
+
+
+def tracks_key(config: "RedisConfig", key: str) -> bool:
+    """Whether tracking reports changes to `key`.
+
+    In BCAST mode the server only invalidates keys under the configured
+    prefixes, so other keys must be watched through keyspace events.
+    """
+    prefixes = tracking_prefixes(config)
+    return uses_tracking(config) and (
+        not prefixes or any(key.startswith(prefix) for prefix in prefixes)
+    )
+
+
+class _TrackedServer:
+    """CLIENT TRACKING for one server: a redirect target plus a cached reader.
+
+    Keys are read through a dedicated reader connection with tracking
+    redirected to a connection subscribed to __redis__:invalidate, so the
+    server reports changes to keys we have read (or, in BCAST mode, to any
+    key under the configured prefixes) without notify-keyspace-events.
+    Descriptions are cached until invalidated, including after the last
+    watcher leaves, so reopening a key is free while the server is tracked.
+    """
+
+    def __init__(self, config: "RedisConfig"):
+        self.config = config
+        self.name = config["name"]
+        self.prefixes = tracking_prefixes(config)
+        self._subscribers: dict[str, set[Subscription]] = {}
+        self._cache: collections.OrderedDict[str, tuple[tuple, KeyDescription]] = (
+            collections.OrderedDict()
+        )
+        # Bumped on every invalidation so in-flight reads are not cached stale
+        self._generation = 0
+        self._last_used = time.monotonic()
+        self._idle_timer: Optional[asyncio.Task] = None
+        self._redirect_id: Optional[int] = None
+        self._listen_conn = None
+        self._reader: Optional[aioredis.Redis] = None
+        self._task: Optional[asyncio.Task] = None
+        self._lock = asyncio.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def is_idle(self) -> bool:
+        return not self._subscribers
+
+    async def ensure_started(self):
+        async with self._lock:
+            self._last_used = time.monotonic()
+            if self._listen_conn is None:
+                await self._start()
+            if self.is_idle:
+                self._stop_when_idle()
+
+    async def add(self, sub: Subscription):
+        async with self._lock:
+            if self._listen_conn is None:
+                await self._start()
+            self._subscribers.setdefault(sub.channel, set()).add(sub)
+            sub.listener = self
+
+    async def remove(self, sub: Subscription):
+        async with self._lock:
+            subscribers = self._subscribers.get(sub.channel)
+            if not subscribers or sub not in subscribers:
+                return
+            subscribers.discard(sub)
+            if not subscribers:
+                del self._subscribers[sub.channel]
+            if self.is_idle:
+                self._last_used = time.monotonic()
+                self._stop_when_idle()
+
+    async def describe(
+        self, key: str, page_size: int, stream_reverse: bool
+    ) -> KeyDescription:
+        params = (page_size, stream_reverse)
+        cached = self._cache.get(key)
+        if cached and cached[0] == params:
+            self.hits += 1
+            self._cache.move_to_end(key)
+            return copy.deepcopy(cached[1])
+        self.misses += 1
+        generation = self._generation
+        description = await describe_key(self._reader, key, page_size, stream_reverse)
+        # Cached only if the server will invalidate it, and nothing did mid-read
+        covered = not self.prefixes or key.startswith(tuple(self.prefixes))
+        if covered and self._generation == generation:
+            self._cache[key] = (params, copy.deepcopy(description))
+            self._cache.move_to_end(key)
+            while len(self._cache) > TRACKING_CACHE_SIZE:
+                self._cache.popitem(last=False)
+        return description
+
+    def _invalidate(self, keys: Optional[list[str]]):
+        self._generation += 1
+        if keys is None:
+            # A null key list means the server flushed its tracking table
+            self._cache.clear()
+            keys = list(self._subscribers)
+        for key in keys:
+            self._cache.pop(key, None)
+            for sub in list(self._subscribers.get(key, ())):
+                sub.deliver(key, INVALIDATE_EVENT)
+
+    def _stop_when_idle(self):
+        if self._idle_timer is None or self._idle_timer.done():
+            self._idle_timer = asyncio.create_task(self._idle_stop())
+
+    async def _idle_stop(self):
+        while True:
+            remaining = self._last_used + TRACKING_IDLE_SECONDS - time.monotonic()
+            if remaining > 0:
+                await asyncio.sleep(remaining)
+                continue
+            async with self._lock:
+                if self.is_idle and self._listen_conn is not None:
+                    logging.info(f"Stopping idle tracking for '{self.name}'")
+                    await self._shutdown()
+                return
+
+    async def _start(self):
+        pool = get_client(self.config).connection_pool
+        kwargs = dict(pool.connection_kwargs)
+        conn = pool.connection_class(**kwargs)
+        await conn.connect()
+        await conn.send_command("CLIENT", "ID")
+        self._redirect_id = await conn.read_response()
+        await conn.send_command("SUBSCRIBE", INVALIDATE_CHANNEL)
+        await conn.read_response()
+        self._listen_conn = conn
+        self._reader = aioredis.Redis(
+            connection_pool=aioredis.BlockingConnectionPool(
+                connection_class=pool.connection_class,
+                max_connections=1,
+                timeout=SOCKET_TIMEOUT_SECONDS,
+                redis_connect_func=self._on_reader_connect,
+                **kwargs,
+            )
+        )
+        self._cache.clear()
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def _on_reader_connect(self, connection):
+        """Re-enables tracking whenever the reader (re)connects."""
+        await connection.on_connect()
+        args = ["CLIENT", "TRACKING", "ON", "REDIRECT", self._redirect_id]
+        if self.prefixes:
+            args.append("BCAST")
+            for prefix in self.prefixes:
+                args.extend(["PREFIX", prefix])
+        await connection.send_command(*args)
+        await connection.read_response()
+        # Reads made before this connection existed are no longer tracked
+        self._cache.clear()
+
+    async def _run(self):
+        while self._listen_conn is not None:
+            conn = self._listen_conn
+            try:
+                msg = await conn.read_response(timeout=LISTEN_TIMEOUT_SECONDS)
+                if msg is None:
+                    # Quiet server; a PING surfaces a dead socket as an error
+                    await conn.send_command("PING")
+                    continue
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if self._listen_conn is not conn:
+                    return
+                logging.warning(f"Tracking listener for '{self.name}' lost: {e}")
+                if not await self._reconnect():
+                    return
+                continue
+            if isinstance(msg, list) and msg and msg[0] == "message":
+                self._invalidate(msg[2])
+
+    async def _reconnect(self) -> bool:
+        while True:
+            await asyncio.sleep(RECONNECT_DELAY_SECONDS)
+            async with self._lock:
+                if self.is_idle:
+                    await self._close_connections()
+                    return False
+                await self._close_connections()
+                try:
+                    await self._start()
+                except Exception as e:
+                    logging.warning(f"Tracking listener reconnect failed: {e}")
+                    continue
+                for subscribers in self._subscribers.values():
+                    for sub in subscribers:
+                        sub.deliver("", RESYNC_EVENT)
+                logging.info(f"Tracking listener for '{self.name}' reconnected")
+                return True
+
+    async def _shutdown(self):
+        if self._task and self._task is not asyncio.current_task():
+            self._task.cancel()
+        self._task = None
+        await self._close_connections()
+
+    async def _close_connections(self):
+        conn, reader = self._listen_conn, self._reader
+        self._listen_conn = None
+        self._reader = None
+        self._cache.clear()
+        try:
+            if conn is not None:
+                await conn.disconnect()
+            if reader is not None:
+                await reader.connection_pool.disconnect()
+        except Exception:
+            pass
+
+
+class TrackingDispatcher:
+    """Routes CLIENT TRACKING invalidations from shared per-server readers to sessions."""
+
+    def __init__(self):
+        self._servers: dict[tuple, _TrackedServer] = {}
+        self._owned: dict[tuple[str, str], Subscription] = {}
+        self._closing: set[asyncio.Task] = set()
+        # Subscriptions made ahead of a read, not yet taken over by a consumer
+        self._unclaimed: set[Subscription] = set()
+
+    @staticmethod
+    def _server_key(config: "RedisConfig") -> tuple:
+        return (
+            config["host"],
+            config["port"],
+            config["password"],
+            config["db"],
+            tuple(tracking_prefixes(config)),
+        )
+
+    def _server(self, config: "RedisConfig") -> _TrackedServer:
+        server_key = self._server_key(config)
+        server = self._servers.get(server_key)
+        if server is None:
+            server = _TrackedServer(config)
+            self._servers[server_key] = server
+        return server
+
+    async def describe(
+        self,
+        config: "RedisConfig",
+        key: str,
+        page_size: int,
+        stream_reverse: bool = True,
+    ) -> KeyDescription:
+        """Describes a key through the tracked reader, from cache when still valid."""
+        server = self._server(config)
+        await server.ensure_started()
+        return await server.describe(key, page_size, stream_reverse)
+
+    async def subscribe(
+        self,
+        owner: str,
+        config: "RedisConfig",
+        key: str,
+        slot: str = "default",
+        maxsize: int = 0,
+        reuse: bool = False,
+    ) -> Subscription:
+        """Subscribes `owner` to invalidations of `key`, replacing its previous one in `slot`.
+
+        With `reuse`, an unclaimed subscription to the same key already in
+        `slot` (made before the key was read) is handed over instead, once.
+        """
+        current = self._owned.get((owner, slot))
+        if (
+            reuse
+            and current in self._unclaimed
+            and current.channel == key
+            and not current.closed
+        ):
+            self._unclaimed.discard(current)
+            return current
+        if current:
+            await self.release(current)
+        sub = Subscription(owner, key, False, maxsize)
+        self._owned[(owner, slot)] = sub
+        if not reuse:
+            self._unclaimed.add(sub)
+        await self._server(config).add(sub)
+        return sub
+
+    def close_owner(self, owner: str, slot: str = "default"):
+        sub = self._owned.pop((owner, slot), None)
+        if sub:
+            sub.close()
+            # Its consumer releases it too, but may not have picked it up yet
+            try:
+                task = asyncio.get_running_loop().create_task(self.release(sub))
+            except RuntimeError:
+                return
+            self._closing.add(task)
+            task.add_done_callback(self._closing.discard)
+
+    async def release(self, sub: Subscription):
+        sub.close()
+        self._unclaimed.discard(sub)
+        for key, owned in list(self._owned.items()):
+            if owned is sub:
+                del self._owned[key]
+        server = sub.listener
+        if server is not None:
+            # An idle server stops itself later, keeping its cache until then
+            await server.remove(sub)
+
+
+tracker = TrackingDispatcher()
\ No newline at end of file
@@ -1,5 +1,11 @@
 import reflex as rx
+from redis_browser.components.latency_panel import latency_panel
+from redis_browser.components.monitor_panel import monitor_panel
+from redis_browser.components.script_panel import script_panel
 from redis_browser.states.command_state import CommandState
+from redis_browser.states.latency_state import LatencyState
+from redis_browser.states.monitor_state import MonitorState
+from redis_browser.states.script_state import ScriptState
 
 
 def log_entry(entry: dict):
@@ -13,7 +19,11 @@ def log_entry(entry: dict):
             rx.el.span(">", class_name="text-slate-400 mx-2 font-bold select-none"),
             rx.el.span(
                 entry["command"],
-                class_name="font-mono text-xs text-indigo-600 font-semibold break-all",
+                class_name="font-mono text-xs text-indigo-600 font-semibold break-all flex-1",
+            ),
+            rx.el.span(
+                entry["latency"],
+                class_name="text-[10px] text-slate-400 font-mono ml-2 whitespace-nowrap",
             ),
             class_name="flex items-start mb-1",
         ),
@@ -25,10 +35,85 @@ def log_entry(entry: dict):
                 "text-xs font-mono text-slate-600 ml-[85px] whitespace-pre-wrap break-all",
             ),
         ),
+        rx.cond(
+            entry["has_more"],
+            rx.el.button(
+                "Show more",
+                on_click=CommandState.load_more_output(entry["id"]),
+                class_name="ml-[85px] mt-1 text-[10px] font-bold text-indigo-500 hover:text-indigo-700",
+            ),
+        ),
         class_name="py-2 border-b border-slate-50 last:border-0",
     )
 
 
+def execute_button(label: str):
+    return rx.el.button(
+        rx.cond(
+            CommandState.is_executing,
+            rx.el.span(
+                class_name="animate-spin h-3 w-3 border-2 border-slate-400 border-t-transparent rounded-full"
+            ),
+            label,
+        ),
+        type="submit",
+        disabled=CommandState.is_executing,
+        class_name="px-3 py-1 bg-slate-800 text-white text-xs font-bold rounded hover:bg-slate-700 disabled:opacity-50 disabled:cursor-not-allowed transition-all flex items-center justify-center min-w-[70px]",
+    )
+
+
+def command_form():
+    return rx.el.form(
+        rx.el.div(
+            rx.icon(
+                "terminal",
+                class_name="h-4 w-4 text-slate-400 absolute left-3 top-1/2 -translate-y-1/2",
+            ),
+            rx.el.input(
+                placeholder="Enter Redis command (e.g., SET mykey 'hello')",
+                name="command",
+                class_name="w-full pl-9 pr-24 py-2.5 text-sm font-mono border-t border-slate-200 focus:outline-none focus:bg-slate-50 transition-colors placeholder:text-slate-300",
+                default_value="",
+                key=f"command_input_{CommandState.next_log_id}",
+            ),
+            rx.el.div(
+                execute_button("Execute"),
+                class_name="absolute right-2 top-1/2 -translate-y-1/2",
+            ),
+            class_name="relative",
+        ),
+        on_submit=CommandState.execute_command,
+        class_name="bg-white z-10",
+    )
+
+
+def batch_form():
+    """Multi-line script, one command per line, sent in a single round trip."""
+    return rx.el.form(
+        rx.el.textarea(
+            placeholder="One command per line; lines starting with # are ignored",
+            name="script",
+            class_name="w-full h-24 px-3 py-2 text-xs font-mono border-t border-slate-200 focus:outline-none focus:bg-slate-50 resize-none placeholder:text-slate-300",
+        ),
+        rx.el.div(
+            rx.el.label(
+                rx.el.input(
+                    type="checkbox",
+                    checked=CommandState.batch_atomic,
+                    on_change=CommandState.toggle_batch_atomic,
+                    class_name="mr-1.5",
+                ),
+                "MULTI/EXEC",
+                class_name="flex items-center text-[10px] font-bold text-slate-400",
+            ),
+            execute_button("Run batch"),
+            class_name="flex items-center justify-end gap-3 px-2 pb-2",
+        ),
+        on_submit=CommandState.execute_batch,
+        class_name="bg-white z-10",
+    )
+
+
 def command_console():
     return rx.el.div(
         rx.el.div(
@@ -37,62 +122,96 @@ def command_console():
                     "Console & Logs",
                     class_name="text-xs font-bold text-slate-500 uppercase tracking-wider",
                 ),
-                rx.el.button(
-                    rx.icon("trash-2", class_name="h-3.5 w-3.5"),
-                    "Clear",
-                    on_click=CommandState.clear_logs,
-                    class_name="text-[10px] flex items-center gap-1 text-slate-400 hover:text-red-500 transition-colors",
-                ),
-                class_name="flex items-center justify-between px-4 py-2 bg-slate-50 border-b border-slate-100",
-            ),
-            rx.el.div(
-                rx.cond(
-                    CommandState.logs.length() > 0,
-                    rx.el.div(
-                        rx.foreach(CommandState.logs, log_entry),
-                        class_name="p-4 flex flex-col-reverse justify-end min-h-full",
+                rx.el.div(
+                    rx.cond(
+                        CommandState.spilled_count > 0,
+                        rx.el.span(
+                            "+" + CommandState.spilled_count.to_string() + " older",
+                            title="Older entries are kept on the server; download the log to see them",
+                            class_name="text-[10px] text-slate-400 font-mono",
+                        ),
+                    ),
+                    rx.el.button(
+                        rx.icon("download", class_name="h-3.5 w-3.5"),
+                        "Log",
+                        on_click=CommandState.download_log,
+                        class_name="text-[10px] flex items-center gap-1 text-slate-400 hover:text-indigo-600 transition-colors",
+                    ),
+                    rx.el.button(
+                        rx.icon("file-code", class_name="h-3.5 w-3.5"),
+                        "Lua",
+                        on_click=ScriptState.toggle_panel,
+                        class_name=rx.cond(
+                            ScriptState.show_panel,
+                            "text-[10px] flex items-center gap-1 text-indigo-600 font-bold",
+                            "text-[10px] flex items-center gap-1 text-slate-400 hover:text-indigo-600 transition-colors",
+                        ),
+                    ),
+                    rx.el.button(
+                        rx.icon("activity", class_name="h-3.5 w-3.5"),
+                        "Monitor",
+                        on_click=MonitorState.toggle_panel,
+                        class_name=rx.cond(
+                            MonitorState.show_panel,
+                            "text-[10px] flex items-center gap-1 text-indigo-600 font-bold",
+                            "text-[10px] flex items-center gap-1 text-slate-400 hover:text-indigo-600 transition-colors",
+                        ),
+                    ),
+                    rx.el.button(
+                        rx.icon("gauge", class_name="h-3.5 w-3.5"),
+                        "Latency",
+                        on_click=LatencyState.toggle_panel,
+                        class_name=rx.cond(
+                            LatencyState.show_panel,
+                            "text-[10px] flex items-center gap-1 text-indigo-600 font-bold",
+                            "text-[10px] flex items-center gap-1 text-slate-400 hover:text-indigo-600 transition-colors",
+                        ),
                     ),
-                    rx.el.div(
-                        rx.el.p(
-                            "No commands executed yet.",
-                            class_name="text-xs text-slate-300 italic text-center mt-10",
+                    rx.el.button(
+                        rx.icon("list-ordered", class_name="h-3.5 w-3.5"),
+                        "Batch",
+                        on_click=CommandState.toggle_batch_mode,
+                        class_name=rx.cond(
+                            CommandState.batch_mode,
+                            "text-[10px] flex items-center gap-1 text-indigo-600 font-bold",
+                            "text-[10px] flex items-center gap-1 text-slate-400 hover:text-indigo-600 transition-colors",
                         ),
-                        class_name="h-full",
                     ),
+                    rx.el.button(
+                        rx.icon("trash-2", class_name="h-3.5 w-3.5"),
+                        "Clear",
+                        on_click=CommandState.clear_logs,
+                        class_name="text-[10px] flex items-center gap-1 text-slate-400 hover:text-red-500 transition-colors",
+                    ),
+                    class_name="flex items-center gap-3",
                 ),
-                class_name="flex-1 overflow-y-auto bg-white min-h-0",
+                class_name="flex items-center justify-between px-4 py-2 bg-slate-50 border-b border-slate-100",
             ),
-            class_name="flex-1 flex flex-col min-h-0 overflow-hidden",
-        ),
-        rx.el.form(
             rx.el.div(
-                rx.icon(
-                    "terminal",
-                    class_name="h-4 w-4 text-slate-400 absolute left-3 top-1/2 -translate-y-1/2",
-                ),
-                rx.el.input(
-                    placeholder="Enter Redis command (e.g., SET mykey 'hello')",
-                    name="command",
-                    class_name="w-full pl-9 pr-24 py-2.5 text-sm font-mono border-t border-slate-200 focus:outline-none focus:bg-slate-50 transition-colors placeholder:text-slate-300",
-                    default_value="",
-                    key=f"command_input_{CommandState.logs.length()}",
-                ),
-                rx.el.button(
+                rx.el.div(
                     rx.cond(
-                        CommandState.is_executing,
-                        rx.el.span(
-                            class_name="animate-spin h-3 w-3 border-2 border-slate-400 border-t-transparent rounded-full"
+                        CommandState.logs.length() > 0,
+                        rx.el.div(
+                            rx.foreach(CommandState.logs, log_entry),
+                            class_name="p-4 flex flex-col-reverse justify-end min-h-full",
+                        ),
+                        rx.el.div(
+                            rx.el.p(
+                                "No commands executed yet.",
+                                class_name="text-xs text-slate-300 italic text-center mt-10",
+                            ),
+                            class_name="h-full",
                         ),
-                        "Execute",
                     ),
-                    type="submit",
-                    disabled=CommandState.is_executing,
-                    class_name="absolute right-2 top-1/2 -translate-y-1/2 px-3 py-1 bg-slate-800 text-white text-xs font-bold rounded hover:bg-slate-700 disabled:opacity-50 disabled:cursor-not-allowed transition-all flex items-center justify-center min-w-[70px]",
+                    class_name="flex-1 overflow-y-auto bg-white min-h-0",
                 ),
-                class_name="relative",
+                rx.cond(ScriptState.show_panel, script_panel()),
+                rx.cond(MonitorState.show_panel, monitor_panel()),
+                rx.cond(LatencyState.show_panel, latency_panel()),
+                class_name="flex-1 flex min-h-0",
             ),
-            on_submit=CommandState.execute_command,
-            class_name="bg-white z-10",
+            class_name="flex-1 flex flex-col min-h-0 overflow-hidden",
         ),
+        rx.cond(CommandState.batch_mode, batch_form(), command_form()),
         class_name="h-64 border-t border-slate-200 flex flex-col bg-white",
     )
\ No newline at end of file
@@ -99,7 +99,51 @@ def config_modal():
                             ),
                             class_name="flex gap-4",
                         ),
-                        class_name="mb-8",
+                        class_name="mb-4",
+                    ),
+                    rx.el.div(
+                        rx.el.label(
+                            "Max Pooled Connections",
+                            class_name="block text-xs font-bold text-slate-500 mb-1",
+                        ),
+                        rx.el.input(
+                            type="number",
+                            min="1",
+                            name="max_connections",
+                            default_value=ConnectionState.form_max_connections.to_string(),
+                            class_name="w-24 px-3 py-2 rounded border border-slate-200 focus:outline-none focus:ring-2 focus:ring-indigo-500 text-sm shadow-sm",
+                        ),
+                        class_name="mb-4",
+                    ),
+                    rx.el.div(
+                        rx.el.div(
+                            rx.el.label(
+                                "Change Detection",
+                                class_name="block text-xs font-bold text-slate-500 mb-1",
+                            ),
+                            rx.el.select(
+                                rx.el.option("Keyspace events", value="keyspace"),
+                                rx.el.option("Client tracking", value="tracking"),
+                                name="watch_mode",
+                                default_value=ConnectionState.form_watch_mode,
+                                class_name="w-full px-3 py-2 rounded border border-slate-200 focus:outline-none focus:ring-2 focus:ring-indigo-500 text-sm shadow-sm bg-white",
+                            ),
+                            class_name="w-40",
+                        ),
+                        rx.el.div(
+                            rx.el.label(
+                                "Tracking Prefixes (BCAST)",
+                                class_name="block text-xs font-bold text-slate-500 mb-1",
+                            ),
+                            rx.el.input(
+                                placeholder="user:, session:",
+                                name="tracking_prefixes",
+                                default_value=ConnectionState.form_tracking_prefixes,
+                                class_name="w-full px-3 py-2 rounded border border-slate-200 focus:outline-none focus:ring-2 focus:ring-indigo-500 text-sm shadow-sm",
+                            ),
+                            class_name="flex-1",
+                        ),
+                        class_name="flex gap-4 mb-8",
                     ),
                     rx.el.div(
                         rx.el.button(
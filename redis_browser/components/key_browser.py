@@ -1,9 +1,41 @@
 import reflex as rx
-from redis_browser.states.key_browser_state import KeyBrowserState, TreeItem
+from redis_browser.states.key_browser_state import (
+    SEARCH_MODES,
+    TREE_ROW_HEIGHT,
+    KeyBrowserState,
+    TreeItem,
+)
+
+
+def load_more_node(item: TreeItem):
+    """Renders the "Load more" row that pages in the rest of a lazy folder."""
+    padding_left = f"{item['level'] * 1.5}rem"
+    is_loading = KeyBrowserState.loading_folders.contains(item["full_path"])
+    return rx.el.div(
+        rx.icon(
+            rx.cond(is_loading, "loader-circle", "chevrons-down"),
+            class_name=rx.cond(
+                is_loading,
+                "h-4 w-4 text-indigo-400 mr-2 animate-spin",
+                "h-4 w-4 text-indigo-400 mr-2",
+            ),
+        ),
+        rx.el.span(
+            item["label"],
+            class_name="text-xs font-semibold text-indigo-600 select-none",
+        ),
+        class_name="flex items-center h-8 px-3 cursor-pointer hover:bg-slate-50 transition-colors",
+        style={"padding_left": f"calc({padding_left} + 12px)"},
+        on_click=KeyBrowserState.load_folder(item["full_path"]),
+    )
 
 
 def tree_node(item: TreeItem):
-    """Renders a single node in the tree (folder or key)."""
+    """Renders a single node in the tree (folder, key, or load-more row)."""
+    return rx.cond(item["type"] == "more", load_more_node(item), key_node(item))
+
+
+def key_node(item: TreeItem):
     padding_left = f"{item['level'] * 1.5}rem"
     is_selected = KeyBrowserState.selected_key == item["full_path"]
     return rx.el.div(
@@ -28,6 +60,11 @@ def tree_node(item: TreeItem):
                 item["type"] == "folder",
                 rx.el.span(
                     item["children_count"],
+                    rx.cond(
+                        KeyBrowserState.pending_folders.contains(item["full_path"]),
+                        "+",
+                        "",
+                    ),
                     class_name="ml-2 px-1.5 py-0.5 text-[10px] font-bold bg-slate-100 text-slate-500 rounded-full",
                 ),
             ),
@@ -35,8 +72,8 @@ def tree_node(item: TreeItem):
         ),
         class_name=rx.cond(
             is_selected,
-            "flex items-center py-1.5 px-3 bg-indigo-50 border-r-2 border-indigo-500 cursor-pointer hover:bg-indigo-100 transition-colors",
-            "flex items-center py-1.5 px-3 border-r-2 border-transparent cursor-pointer hover:bg-slate-50 transition-colors",
+            "flex items-center h-8 px-3 bg-indigo-50 border-r-2 border-indigo-500 cursor-pointer hover:bg-indigo-100 transition-colors",
+            "flex items-center h-8 px-3 border-r-2 border-transparent cursor-pointer hover:bg-slate-50 transition-colors",
         ),
         style={
             "padding_left": rx.cond(
@@ -51,6 +88,38 @@ def tree_node(item: TreeItem):
     )
 
 
+SCAN_COUNT_OPTIONS = ["100", "500", "1000", "5000"]
+TREE_VIEWPORT_ID = "key-tree-viewport"
+
+
+def scan_progress_bar():
+    """Live "scanned X / DBSIZE Y" progress with cancel and resume controls."""
+    is_paused = ~KeyBrowserState.is_loading_keys & (KeyBrowserState.scan_cursor != 0)
+    return rx.cond(
+        KeyBrowserState.is_loading_keys | is_paused,
+        rx.el.div(
+            rx.el.span(
+                f"Scanned {KeyBrowserState.key_count} / {KeyBrowserState.db_size}",
+                class_name="text-[11px] font-mono text-slate-500",
+            ),
+            rx.cond(
+                KeyBrowserState.is_loading_keys,
+                rx.el.button(
+                    "Cancel",
+                    on_click=KeyBrowserState.cancel_scan,
+                    class_name="ml-auto text-[11px] font-bold text-red-500 hover:text-red-600",
+                ),
+                rx.el.button(
+                    "Resume",
+                    on_click=KeyBrowserState.resume_scan,
+                    class_name="ml-auto text-[11px] font-bold text-indigo-600 hover:text-indigo-700",
+                ),
+            ),
+            class_name="flex items-center px-4 py-1.5 border-b border-slate-100 bg-slate-50",
+        ),
+    )
+
+
 def key_browser():
     return rx.el.div(
         rx.el.div(
@@ -60,13 +129,49 @@ def key_browser():
                     class_name="absolute left-3 top-1/2 -translate-y-1/2 h-4 w-4 text-slate-400",
                 ),
                 rx.el.input(
-                    placeholder="Filter keys...",
-                    on_change=KeyBrowserState.set_filter_query,
-                    class_name="w-full pl-9 pr-3 py-1.5 text-sm border border-slate-200 rounded-md focus:outline-none focus:border-indigo-500 focus:ring-1 focus:ring-indigo-500 bg-slate-50",
+                    placeholder=rx.match(
+                        KeyBrowserState.search_mode,
+                        ("glob", "Search server (glob, e.g. user:*)"),
+                        ("regex", "Search server (regex, e.g. ^user:\\d+$)"),
+                        "Filter loaded keys...",
+                    ),
+                    on_change=KeyBrowserState.set_filter_query.debounce(300),
+                    class_name="w-full pl-9 pr-20 py-1.5 text-sm border border-slate-200 rounded-md focus:outline-none focus:border-indigo-500 focus:ring-1 focus:ring-indigo-500 bg-slate-50",
                     default_value=KeyBrowserState.filter_query,
                 ),
+                rx.el.select(
+                    rx.foreach(
+                        SEARCH_MODES,
+                        lambda mode: rx.el.option(mode.upper(), value=mode),
+                    ),
+                    value=KeyBrowserState.search_mode,
+                    on_change=KeyBrowserState.set_search_mode,
+                    title="Search mode",
+                    class_name="absolute right-1.5 top-1/2 -translate-y-1/2 text-[10px] font-bold text-slate-500 bg-white border border-slate-200 rounded px-1",
+                ),
                 class_name="relative flex-1",
             ),
+            rx.el.button(
+                rx.icon(
+                    "layers",
+                    class_name=rx.cond(
+                        KeyBrowserState.lazy_mode,
+                        "h-4 w-4 text-indigo-600",
+                        "h-4 w-4 text-slate-600",
+                    ),
+                ),
+                on_click=KeyBrowserState.toggle_lazy_mode,
+                title=rx.cond(
+                    KeyBrowserState.lazy_mode,
+                    "Lazy mode: folders load on expand",
+                    "Enable lazy mode for large databases",
+                ),
+                class_name=rx.cond(
+                    KeyBrowserState.lazy_mode,
+                    "p-2 rounded-md border border-indigo-200 bg-indigo-50 ml-2",
+                    "p-2 hover:bg-slate-100 rounded-md border border-slate-200 bg-white ml-2",
+                ),
+            ),
             rx.el.button(
                 rx.icon(
                     "refresh-cw",
@@ -83,9 +188,10 @@ def key_browser():
             ),
             class_name="p-3 border-b border-slate-100 flex items-center bg-white sticky top-0 z-10",
         ),
+        scan_progress_bar(),
         rx.el.div(
             rx.cond(
-                KeyBrowserState.is_loading_keys,
+                KeyBrowserState.is_loading_keys & (KeyBrowserState.key_count == 0),
                 rx.el.div(
                     rx.el.div(
                         class_name="h-8 w-8 border-2 border-indigo-200 border-t-indigo-600 rounded-full animate-spin mb-4"
@@ -97,10 +203,13 @@ def key_browser():
                     class_name="flex flex-col items-center justify-center h-full py-12",
                 ),
                 rx.cond(
-                    KeyBrowserState.keys.length() > 0,
+                    KeyBrowserState.flat_tree.length() > 0,
                     rx.el.div(
                         rx.foreach(KeyBrowserState.flat_tree, tree_node),
-                        class_name="py-2",
+                        style={
+                            "height": f"{KeyBrowserState.tree_row_count * TREE_ROW_HEIGHT}px",
+                            "padding_top": f"{KeyBrowserState.window_start * TREE_ROW_HEIGHT}px",
+                        },
                     ),
                     rx.el.div(
                         rx.icon("search-x", class_name="h-12 w-12 text-slate-200 mb-2"),
@@ -109,16 +218,51 @@ def key_browser():
                     ),
                 ),
             ),
+            id=TREE_VIEWPORT_ID,
+            on_scroll=rx.call_script(
+                f"document.getElementById('{TREE_VIEWPORT_ID}').scrollTop",
+                callback=KeyBrowserState.set_tree_scroll,
+            ).throttle(100),
             class_name="flex-1 overflow-y-auto overflow-x-hidden bg-white custom-scrollbar",
         ),
         rx.el.div(
-            rx.el.span(
-                f"{KeyBrowserState.keys.length()} keys found",
-                class_name="text-xs font-medium text-slate-500",
+            rx.cond(
+                (KeyBrowserState.search_mode != "local")
+                & (KeyBrowserState.filter_query != ""),
+                rx.el.span(
+                    f"{KeyBrowserState.search_match_count} matches",
+                    rx.cond(KeyBrowserState.is_searching, " (searching…)", ""),
+                    class_name="text-xs font-medium text-slate-500",
+                ),
+                rx.el.span(
+                    f"{KeyBrowserState.key_count} keys found",
+                    class_name="text-xs font-medium text-slate-500",
+                ),
+            ),
+            rx.cond(
+                KeyBrowserState.is_searching,
+                rx.el.button(
+                    "Stop",
+                    on_click=KeyBrowserState.cancel_search,
+                    class_name="ml-2 text-[11px] font-bold text-red-500 hover:text-red-600",
+                ),
+            ),
+            rx.el.label(
+                "SCAN COUNT",
+                rx.el.select(
+                    rx.foreach(
+                        SCAN_COUNT_OPTIONS,
+                        lambda option: rx.el.option(option, value=option),
+                    ),
+                    value=KeyBrowserState.scan_count.to_string(),
+                    on_change=KeyBrowserState.set_scan_count,
+                    class_name="ml-1 text-xs font-mono bg-white border border-slate-200 rounded px-1",
+                ),
+                class_name="text-[10px] font-bold text-slate-400 ml-auto",
             ),
             rx.el.span(
                 f"Namespace: {KeyBrowserState.delimiter}",
-                class_name="text-xs text-slate-400 ml-auto font-mono bg-slate-100 px-1.5 rounded",
+                class_name="text-xs text-slate-400 ml-3 font-mono bg-slate-100 px-1.5 rounded",
             ),
             class_name="h-8 flex items-center px-4 border-t border-slate-100 bg-slate-50",
         ),
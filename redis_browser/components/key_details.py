@@ -1,5 +1,6 @@
 import reflex as rx
-from redis_browser.states.key_details_state import KeyDetailsState
+from redis_browser.backend.key_values import PAGE_SIZE_OPTIONS, ZSET_QUERY_MODES
+from redis_browser.states.key_details_state import STRING_TAIL_ID, KeyDetailsState
 
 
 def type_badge(ktype: str):
@@ -10,6 +11,7 @@ def type_badge(ktype: str):
         ("list", "bg-emerald-100 text-emerald-700"),
         ("set", "bg-orange-100 text-orange-700"),
         ("zset", "bg-indigo-100 text-indigo-700"),
+        ("stream", "bg-rose-100 text-rose-700"),
         "bg-slate-100 text-slate-700",
     )
     return rx.el.span(
@@ -18,29 +20,148 @@ def type_badge(ktype: str):
     )
 
 
+def meta_chip(icon_name: str, label: str, value):
+    return rx.el.div(
+        rx.icon(icon_name, class_name="h-4 w-4 text-slate-400"),
+        rx.el.span(label, class_name="text-xs font-bold text-slate-400 uppercase"),
+        rx.el.span(value, class_name="text-sm font-semibold text-slate-600"),
+        class_name="flex items-center gap-2 bg-slate-50 px-3 py-1.5 rounded-full border border-slate-100",
+    )
+
+
+def watch_status():
+    return rx.el.div(
+        rx.el.button(
+            rx.cond(
+                KeyDetailsState.watch_paused,
+                rx.icon("play", class_name="h-3.5 w-3.5"),
+                rx.icon("pause", class_name="h-3.5 w-3.5"),
+            ),
+            rx.cond(KeyDetailsState.watch_paused, "Resume", "Live"),
+            on_click=KeyDetailsState.toggle_watch_pause,
+            class_name="flex items-center gap-1.5 text-xs font-bold text-slate-500 hover:text-indigo-600",
+        ),
+        rx.cond(
+            KeyDetailsState.pending_changes > 0,
+            rx.el.span(
+                "paused — ",
+                KeyDetailsState.pending_changes,
+                " changes pending",
+                class_name="text-xs font-semibold text-amber-600",
+            ),
+        ),
+        rx.el.span(
+            KeyDetailsState.watch_via,
+            " · ",
+            KeyDetailsState.watch_events,
+            " events · ",
+            KeyDetailsState.watch_refreshes,
+            " refreshes · ",
+            KeyDetailsState.watch_coalesced,
+            " coalesced · ",
+            KeyDetailsState.watch_dropped,
+            " dropped",
+            class_name="text-[10px] text-slate-400",
+        ),
+        class_name="flex items-center gap-3 px-3 py-1.5",
+    )
+
+
+STRING_VIEWPORT_ID = "string-value-viewport"
+
+
+def string_view_toggle():
+    return rx.el.div(
+        rx.foreach(
+            ["utf-8", "hex"],
+            lambda view: rx.el.button(
+                view.upper(),
+                on_click=KeyDetailsState.set_string_view(view),
+                class_name=rx.cond(
+                    KeyDetailsState.string_view == view,
+                    "px-2 py-0.5 text-[10px] font-bold rounded bg-indigo-600 text-white",
+                    "px-2 py-0.5 text-[10px] font-bold rounded text-slate-500 hover:bg-slate-100",
+                ),
+            ),
+        ),
+        class_name="flex items-center gap-1",
+    )
+
+
 def string_handler():
     return rx.el.div(
         rx.el.div(
-            rx.el.label(
-                "Value",
-                class_name="text-xs font-bold text-slate-400 uppercase mb-2 block",
-            ),
             rx.el.div(
-                rx.el.pre(
-                    KeyDetailsState.string_value,
-                    class_name="text-sm font-mono whitespace-pre-wrap break-all text-slate-700 bg-slate-50 p-4 rounded-xl border border-slate-100",
+                rx.el.label(
+                    "Value",
+                    class_name="text-xs font-bold text-slate-400 uppercase",
+                ),
+                rx.el.div(
+                    rx.el.span(
+                        KeyDetailsState.string_loaded,
+                        " / ",
+                        KeyDetailsState.value_length,
+                        " bytes",
+                        class_name="text-[10px] text-slate-400",
+                    ),
+                    rx.cond(
+                        KeyDetailsState.string_is_binary,
+                        rx.el.span(
+                            "BINARY",
+                            class_name="text-[10px] font-bold text-amber-600",
+                        ),
+                    ),
+                    string_view_toggle(),
+                    class_name="flex items-center gap-3",
+                ),
+                class_name="flex items-center justify-between mb-2",
+            ),
+            rx.el.pre(
+                KeyDetailsState.string_value,
+                # Later chunks are appended here in place, not re-sent whole
+                rx.el.span(
+                    id=STRING_TAIL_ID,
+                    key=KeyDetailsState.string_render_id,
+                    custom_attrs={"data-render": KeyDetailsState.string_render_id},
+                ),
+                id=STRING_VIEWPORT_ID,
+                on_scroll=rx.call_script(
+                    f"(e => e.scrollTop + e.clientHeight >= e.scrollHeight - 200)"
+                    f"(document.getElementById('{STRING_VIEWPORT_ID}'))",
+                    callback=KeyDetailsState.load_string_on_scroll,
+                ).throttle(200),
+                class_name="text-sm font-mono whitespace-pre-wrap break-all text-slate-700 bg-slate-50 p-4 rounded-xl border border-slate-100 max-h-[60vh] overflow-y-auto",
+            ),
+            rx.cond(
+                KeyDetailsState.is_loading_more,
+                rx.el.p(
+                    "Loading…",
+                    class_name="text-xs text-slate-400 mt-2",
+                ),
+            ),
+            rx.cond(
+                KeyDetailsState.string_capped,
+                rx.el.button(
+                    rx.icon("download", class_name="h-3.5 w-3.5 mr-1.5"),
+                    "Load full value",
+                    on_click=KeyDetailsState.load_more_string(True),
+                    class_name="mt-2 flex items-center text-xs font-bold text-indigo-600 hover:text-indigo-700",
                 ),
-                class_name="relative",
             ),
             class_name="mb-6",
         ),
-        rx.el.button(
-            rx.icon("pencil", class_name="h-4 w-4 mr-2"),
-            "Edit Value",
-            on_click=lambda: KeyDetailsState.open_edit_modal(
-                "", KeyDetailsState.string_value
+        rx.cond(
+            KeyDetailsState.can_edit_string,
+            rx.el.button(
+                rx.icon("pencil", class_name="h-4 w-4 mr-2"),
+                "Edit Value",
+                on_click=KeyDetailsState.open_string_editor,
+                class_name="w-full flex items-center justify-center px-4 py-2 bg-indigo-600 text-white rounded-lg font-bold text-sm hover:bg-indigo-700 transition-all",
+            ),
+            rx.el.p(
+                "Editing needs the full value loaded and shown as UTF-8.",
+                class_name="text-xs text-slate-400 text-center",
             ),
-            class_name="w-full flex items-center justify-center px-4 py-2 bg-indigo-600 text-white rounded-lg font-bold text-sm hover:bg-indigo-700 transition-all",
         ),
     )
 
@@ -74,16 +195,8 @@ def hash_row(field: str, value: str):
 def hash_handler():
     return rx.el.div(
         rx.el.div(
-            rx.el.div(
-                rx.el.h4("Fields", class_name="text-sm font-bold text-slate-700"),
-                rx.el.button(
-                    rx.icon("plus", class_name="h-4 w-4 mr-1.5"),
-                    "Add Field",
-                    on_click=lambda: KeyDetailsState.open_edit_modal(),
-                    class_name="flex items-center text-xs font-bold text-indigo-600 hover:text-indigo-700",
-                ),
-                class_name="flex items-center justify-between mb-4",
-            ),
+            section_header("Fields", "Add Field"),
+            staging_bar(),
             rx.el.div(
                 rx.el.table(
                     rx.el.thead(
@@ -110,10 +223,536 @@ def hash_handler():
                 ),
                 class_name="border border-slate-100 rounded-xl overflow-hidden",
             ),
+            value_pager(),
         )
     )
 
 
+TH_CLASS = (
+    "px-4 py-2 text-left text-[10px] font-bold text-slate-400 uppercase tracking-wider"
+)
+TD_CLASS = "px-4 py-2 text-sm font-mono text-slate-500 break-all"
+
+
+def value_table(headers: list[str], body: rx.Component):
+    return rx.el.div(
+        rx.el.table(
+            rx.el.thead(
+                rx.el.tr(
+                    *[rx.el.th(header, class_name=TH_CLASS) for header in headers],
+                    class_name="bg-slate-50",
+                )
+            ),
+            rx.el.tbody(body),
+            class_name="w-full table-auto",
+        ),
+        class_name="border border-slate-100 rounded-xl overflow-hidden",
+    )
+
+
+def value_pager():
+    """Loaded/total counts with load-more, jump-to-offset and page size controls."""
+    return rx.el.div(
+        rx.el.span(
+            f"{KeyDetailsState.loaded_count} of {KeyDetailsState.page_total} loaded",
+            class_name="text-xs text-slate-400 font-mono",
+        ),
+        rx.cond(
+            KeyDetailsState.has_more_values,
+            rx.el.button(
+                rx.cond(KeyDetailsState.is_loading_more, "Loading...", "Load more"),
+                on_click=KeyDetailsState.load_more_values,
+                disabled=KeyDetailsState.is_loading_more,
+                class_name="text-xs font-bold text-indigo-600 hover:text-indigo-700 disabled:opacity-50",
+            ),
+        ),
+        rx.cond(
+            KeyDetailsState.can_jump,
+            rx.el.form(
+                rx.el.input(
+                    type=rx.cond(
+                        KeyDetailsState.key_type == "stream", "text", "number"
+                    ),
+                    min="0",
+                    name="offset",
+                    placeholder=rx.cond(
+                        KeyDetailsState.key_type == "stream", "Entry ID", "Offset"
+                    ),
+                    class_name="w-28 px-2 py-1 text-xs border border-slate-200 rounded",
+                ),
+                rx.el.button(
+                    "Go",
+                    type="submit",
+                    class_name="px-2 py-1 text-xs font-bold text-slate-600 hover:bg-slate-100 rounded",
+                ),
+                on_submit=KeyDetailsState.jump_to_offset,
+                class_name="flex items-center gap-1",
+            ),
+        ),
+        rx.el.select(
+            rx.foreach(
+                [str(size) for size in PAGE_SIZE_OPTIONS],
+                lambda size: rx.el.option(f"{size} / page", value=size),
+            ),
+            value=KeyDetailsState.page_size.to_string(),
+            on_change=KeyDetailsState.set_page_size,
+            class_name="ml-auto text-xs bg-white border border-slate-200 rounded px-1",
+        ),
+        class_name="flex items-center gap-3 mt-3",
+    )
+
+
+def list_handler():
+    return rx.el.div(
+        value_table(
+            ["Index", "Value"],
+            rx.foreach(
+                KeyDetailsState.list_value,
+                lambda value, i: rx.el.tr(
+                    rx.el.td(
+                        KeyDetailsState.value_offset + i,
+                        class_name="px-4 py-2 text-xs font-mono text-slate-400 w-16",
+                    ),
+                    rx.el.td(value, class_name=TD_CLASS),
+                    class_name="border-b border-slate-50 last:border-0",
+                ),
+            ),
+        ),
+        value_pager(),
+    )
+
+
+def section_header(title: str, add_label: str):
+    return rx.el.div(
+        rx.el.h4(title, class_name="text-sm font-bold text-slate-700"),
+        rx.el.button(
+            rx.icon("plus", class_name="h-4 w-4 mr-1.5"),
+            add_label,
+            on_click=lambda: KeyDetailsState.open_edit_modal(),
+            class_name="flex items-center text-xs font-bold text-indigo-600 hover:text-indigo-700",
+        ),
+        class_name="flex items-center justify-between mb-4",
+    )
+
+
+def staged_edit_row(edit: rx.Var):
+    return rx.el.div(
+        rx.el.span(
+            rx.cond(edit["op"] == "delete", "−", "+"),
+            class_name=rx.cond(
+                edit["op"] == "delete",
+                "w-4 font-bold text-red-500",
+                "w-4 font-bold text-emerald-600",
+            ),
+        ),
+        rx.el.span(edit["field"], class_name="font-mono text-slate-600 truncate"),
+        rx.cond(
+            edit["value"] != "",
+            rx.el.span(edit["value"], class_name="font-mono text-slate-400 truncate"),
+        ),
+        rx.el.button(
+            rx.icon("x", class_name="h-3 w-3"),
+            on_click=KeyDetailsState.unstage_edit(edit["field"]),
+            class_name="ml-auto p-1 text-slate-400 hover:text-slate-600",
+        ),
+        class_name="flex items-center gap-2 text-xs",
+    )
+
+
+def staging_bar():
+    """Staged-edit toggle plus the pending batch with commit and discard."""
+    return rx.el.div(
+        rx.el.div(
+            rx.el.label(
+                rx.el.input(
+                    type="checkbox",
+                    checked=KeyDetailsState.staging,
+                    on_change=KeyDetailsState.toggle_staging,
+                    class_name="mr-2",
+                ),
+                "Stage edits",
+                class_name="flex items-center text-xs font-bold text-slate-500",
+            ),
+            rx.cond(
+                KeyDetailsState.staged_edits.length() > 0,
+                rx.el.div(
+                    rx.el.label(
+                        rx.el.input(
+                            type="checkbox",
+                            checked=KeyDetailsState.atomic_commit,
+                            on_change=KeyDetailsState.toggle_atomic_commit,
+                            class_name="mr-1.5",
+                        ),
+                        "MULTI/EXEC",
+                        class_name="flex items-center text-[10px] font-bold text-slate-400",
+                    ),
+                    rx.el.button(
+                        "Discard",
+                        on_click=KeyDetailsState.discard_staged_edits,
+                        class_name="px-2 py-1 text-xs font-medium text-slate-500 hover:bg-slate-100 rounded",
+                    ),
+                    rx.el.button(
+                        rx.cond(
+                            KeyDetailsState.is_committing,
+                            "Committing...",
+                            "Commit "
+                            + KeyDetailsState.staged_edits.length().to_string()
+                            + " changes",
+                        ),
+                        on_click=KeyDetailsState.commit_staged_edits,
+                        disabled=KeyDetailsState.is_committing,
+                        class_name="px-3 py-1 text-xs font-bold text-white bg-indigo-600 rounded hover:bg-indigo-700 disabled:opacity-50",
+                    ),
+                    class_name="flex items-center gap-2",
+                ),
+            ),
+            class_name="flex items-center justify-between",
+        ),
+        rx.cond(
+            KeyDetailsState.staged_edits.length() > 0,
+            rx.el.div(
+                rx.foreach(KeyDetailsState.staged_edits, staged_edit_row),
+                class_name="mt-2 max-h-40 overflow-y-auto flex flex-col gap-1",
+            ),
+        ),
+        class_name="mb-4 px-3 py-2 bg-slate-50 border border-slate-100 rounded-xl",
+    )
+
+
+def row_button(icon_name: str, on_click, danger: bool = False):
+    return rx.el.button(
+        rx.icon(icon_name, class_name="h-3.5 w-3.5"),
+        on_click=on_click,
+        class_name=(
+            "p-1.5 hover:bg-red-50 text-slate-400 hover:text-red-600 rounded"
+            if danger
+            else "p-1.5 hover:bg-indigo-50 text-slate-400 hover:text-indigo-600 rounded"
+        ),
+    )
+
+
+def set_handler():
+    return rx.el.div(
+        section_header("Members", "Add Member"),
+        staging_bar(),
+        value_table(
+            ["Member", ""],
+            rx.foreach(
+                KeyDetailsState.set_value,
+                lambda member: rx.el.tr(
+                    rx.el.td(member, class_name=TD_CLASS),
+                    rx.el.td(
+                        row_button(
+                            "trash-2",
+                            lambda: KeyDetailsState.delete_member(member),
+                            danger=True,
+                        ),
+                        class_name="px-4 py-2 w-12",
+                    ),
+                    class_name="border-b border-slate-50 last:border-0",
+                ),
+            ),
+        ),
+        value_pager(),
+    )
+
+
+INPUT_CLASS = "px-2 py-1 text-xs border border-slate-200 rounded bg-white"
+
+
+def zset_query_bar():
+    """Server-side BYSCORE/BYLEX/REV range query and ZRANK lookup."""
+    return rx.el.div(
+        rx.el.form(
+            rx.el.select(
+                rx.foreach(
+                    ZSET_QUERY_MODES,
+                    lambda mode: rx.el.option(mode.upper(), value=mode),
+                ),
+                name="mode",
+                default_value=KeyDetailsState.zset_mode,
+                class_name=INPUT_CLASS,
+            ),
+            rx.el.input(
+                name="min",
+                placeholder="min",
+                default_value=KeyDetailsState.zset_min,
+                class_name=f"w-20 {INPUT_CLASS}",
+            ),
+            rx.el.input(
+                name="max",
+                placeholder="max",
+                default_value=KeyDetailsState.zset_max,
+                class_name=f"w-20 {INPUT_CLASS}",
+            ),
+            rx.el.label(
+                rx.el.input(
+                    type="checkbox",
+                    name="reverse",
+                    default_checked=KeyDetailsState.zset_reverse,
+                    class_name="mr-1",
+                ),
+                "REV",
+                class_name="flex items-center text-[10px] font-bold text-slate-500",
+            ),
+            rx.el.button(
+                "Query",
+                type="submit",
+                class_name="px-2 py-1 text-xs font-bold text-white bg-indigo-600 rounded hover:bg-indigo-700",
+            ),
+            rx.cond(
+                KeyDetailsState.zset_query_active,
+                rx.el.button(
+                    "Clear",
+                    type="button",
+                    on_click=KeyDetailsState.clear_zset_query,
+                    class_name="px-2 py-1 text-xs font-medium text-slate-500 hover:bg-slate-100 rounded",
+                ),
+            ),
+            on_submit=KeyDetailsState.run_zset_query,
+            class_name="flex flex-wrap items-center gap-2",
+        ),
+        rx.el.div(
+            rx.el.form(
+                rx.el.input(
+                    name="member",
+                    placeholder="Member",
+                    class_name=f"w-32 {INPUT_CLASS}",
+                ),
+                rx.el.button(
+                    "Find rank",
+                    type="submit",
+                    class_name="px-2 py-1 text-xs font-bold text-slate-600 hover:bg-slate-100 rounded",
+                ),
+                on_submit=KeyDetailsState.lookup_member,
+                class_name="flex items-center gap-2",
+            ),
+            rx.el.span(
+                KeyDetailsState.zset_lookup,
+                class_name="text-xs font-mono text-slate-500",
+            ),
+            rx.el.button(
+                rx.icon("chart-column", class_name="h-3.5 w-3.5 mr-1.5"),
+                rx.cond(
+                    KeyDetailsState.is_building_histogram,
+                    "Building...",
+                    "Score histogram",
+                ),
+                on_click=KeyDetailsState.build_zset_histogram,
+                disabled=KeyDetailsState.is_building_histogram,
+                class_name="ml-auto flex items-center text-xs font-bold text-slate-500 hover:text-indigo-600",
+            ),
+            class_name="flex flex-wrap items-center gap-3 mt-2",
+        ),
+        rx.cond(
+            KeyDetailsState.zset_histogram.length() > 0,
+            rx.el.div(
+                rx.foreach(
+                    KeyDetailsState.zset_histogram,
+                    lambda bucket: rx.el.div(
+                        rx.el.span(
+                            bucket["label"],
+                            class_name="w-40 text-[10px] font-mono text-slate-400 truncate",
+                        ),
+                        rx.el.div(
+                            rx.el.div(
+                                class_name="h-2.5 bg-indigo-400 rounded-sm",
+                                style={"width": bucket["percent"].to_string() + "%"},
+                            ),
+                            class_name="flex-1",
+                        ),
+                        rx.el.span(
+                            bucket["count"],
+                            class_name="text-[10px] font-mono text-slate-500",
+                        ),
+                        class_name="flex items-center gap-2",
+                    ),
+                ),
+                class_name="mt-3 flex flex-col gap-1",
+            ),
+        ),
+        class_name="mb-4 px-3 py-2 bg-slate-50 border border-slate-100 rounded-xl",
+    )
+
+
+def zset_handler():
+    return rx.el.div(
+        section_header("Members", "Add Member"),
+        zset_query_bar(),
+        staging_bar(),
+        value_table(
+            [
+                rx.cond(KeyDetailsState.zset_query_active, "#", "Rank"),
+                "Member",
+                "Score",
+                "",
+            ],
+            rx.foreach(
+                KeyDetailsState.zset_value,
+                lambda item, i: rx.el.tr(
+                    rx.el.td(
+                        KeyDetailsState.value_offset + i,
+                        class_name="px-4 py-2 text-xs font-mono text-slate-400 w-16",
+                    ),
+                    rx.el.td(item[0], class_name=TD_CLASS),
+                    rx.el.td(item[1], class_name=TD_CLASS),
+                    rx.el.td(
+                        rx.el.div(
+                            row_button(
+                                "pencil",
+                                lambda: KeyDetailsState.open_edit_modal(
+                                    item[0], "", item[1]
+                                ),
+                            ),
+                            row_button(
+                                "trash-2",
+                                lambda: KeyDetailsState.delete_member(item[0]),
+                                danger=True,
+                            ),
+                            class_name="flex items-center gap-1",
+                        ),
+                        class_name="px-4 py-2 w-20",
+                    ),
+                    class_name="border-b border-slate-50 last:border-0",
+                ),
+            ),
+        ),
+        value_pager(),
+    )
+
+
+def stream_info_chip(item: rx.Var):
+    return rx.el.div(
+        rx.el.span(
+            item[0], class_name="text-[10px] font-bold text-slate-400 uppercase"
+        ),
+        rx.el.span(item[1], class_name="text-xs font-mono text-slate-600"),
+        class_name="flex flex-col bg-slate-50 px-3 py-1.5 rounded-lg border border-slate-100",
+    )
+
+
+def stream_handler():
+    return rx.el.div(
+        rx.el.div(
+            rx.foreach(KeyDetailsState.stream_info, stream_info_chip),
+            class_name="flex flex-wrap gap-2 mb-4",
+        ),
+        rx.cond(
+            KeyDetailsState.stream_groups.length() > 0,
+            rx.el.div(
+                rx.el.h4(
+                    "Consumer Groups",
+                    class_name="text-sm font-bold text-slate-700 mb-2",
+                ),
+                value_table(
+                    ["Group", "Consumers", "Pending", "Last Delivered", "Lag"],
+                    rx.foreach(
+                        KeyDetailsState.stream_groups,
+                        lambda group: rx.el.tr(
+                            rx.el.td(group["name"], class_name=TD_CLASS),
+                            rx.el.td(group["consumers"], class_name=TD_CLASS),
+                            rx.el.td(group["pending"], class_name=TD_CLASS),
+                            rx.el.td(group["last_delivered_id"], class_name=TD_CLASS),
+                            rx.el.td(group["lag"], class_name=TD_CLASS),
+                            class_name="border-b border-slate-50 last:border-0",
+                        ),
+                    ),
+                ),
+                class_name="mb-4",
+            ),
+        ),
+        rx.el.div(
+            rx.el.h4("Entries", class_name="text-sm font-bold text-slate-700"),
+            rx.el.div(
+                rx.el.button(
+                    rx.icon("arrow-up-down", class_name="h-3.5 w-3.5 mr-1.5"),
+                    rx.cond(
+                        KeyDetailsState.stream_reverse, "Newest first", "Oldest first"
+                    ),
+                    on_click=KeyDetailsState.toggle_stream_order,
+                    class_name="flex items-center text-xs font-bold text-slate-500 hover:text-indigo-600",
+                ),
+                rx.el.button(
+                    rx.icon(
+                        "radio",
+                        class_name=rx.cond(
+                            KeyDetailsState.stream_tailing,
+                            "h-3.5 w-3.5 mr-1.5 text-emerald-500 animate-pulse",
+                            "h-3.5 w-3.5 mr-1.5",
+                        ),
+                    ),
+                    rx.cond(KeyDetailsState.stream_tailing, "Tailing", "Live tail"),
+                    on_click=KeyDetailsState.toggle_stream_tail,
+                    class_name="flex items-center text-xs font-bold text-slate-500 hover:text-indigo-600",
+                ),
+                class_name="flex items-center gap-4",
+            ),
+            class_name="flex items-center justify-between mb-2",
+        ),
+        value_table(
+            ["ID", "Fields"],
+            rx.foreach(
+                KeyDetailsState.stream_value,
+                lambda entry: rx.el.tr(
+                    rx.el.td(
+                        entry["id"],
+                        class_name="px-4 py-2 text-xs font-mono text-slate-400 whitespace-nowrap",
+                    ),
+                    rx.el.td(entry["fields"], class_name=TD_CLASS),
+                    class_name="border-b border-slate-50 last:border-0",
+                ),
+            ),
+        ),
+        value_pager(),
+    )
+
+
+def member_form(with_score: bool):
+    fields = [
+        rx.el.label(
+            "Member",
+            class_name="block text-xs font-bold text-slate-500 mb-1",
+        ),
+        rx.el.input(
+            name="field",
+            default_value=KeyDetailsState.edit_field_name,
+            placeholder="Member",
+            class_name="w-full p-2 border border-slate-200 rounded mb-4 text-sm font-mono",
+        ),
+    ]
+    if with_score:
+        fields += [
+            rx.el.label(
+                "Score",
+                class_name="block text-xs font-bold text-slate-500 mb-1",
+            ),
+            rx.el.input(
+                name="score",
+                default_value=KeyDetailsState.edit_score.to_string(),
+                placeholder="0",
+                class_name="w-40 p-2 border border-slate-200 rounded mb-6 text-sm font-mono",
+            ),
+        ]
+    return rx.el.form(
+        rx.el.div(*fields, class_name="mb-2"),
+        rx.el.div(
+            rx.el.button(
+                "Cancel",
+                type="button",
+                on_click=KeyDetailsState.set_show_edit_modal(False),
+                class_name="px-4 py-2 text-sm font-medium text-slate-600 hover:bg-slate-100 rounded",
+            ),
+            rx.el.button(
+                rx.cond(KeyDetailsState.staging, "Stage", "Save Member"),
+                type="submit",
+                class_name="px-4 py-2 text-sm font-bold text-white bg-indigo-600 rounded-lg",
+            ),
+            class_name="flex justify-end gap-3",
+        ),
+        on_submit=KeyDetailsState.set_member,
+    )
+
+
 def edit_modal():
     return rx.el.div(
         rx.el.div(
@@ -136,7 +775,7 @@ def edit_modal():
                         rx.el.form(
                             rx.el.textarea(
                                 name="value",
-                                default_value=KeyDetailsState.string_value,
+                                default_value=KeyDetailsState.edit_field_value,
                                 class_name="w-full h-40 p-4 border border-slate-200 rounded-lg focus:ring-2 focus:ring-indigo-500 outline-none text-sm font-mono mb-6 shadow-sm",
                             ),
                             rx.el.div(
@@ -190,7 +829,9 @@ def edit_modal():
                                     class_name="px-4 py-2 text-sm font-medium text-slate-600 hover:bg-slate-100 rounded",
                                 ),
                                 rx.el.button(
-                                    "Save Field",
+                                    rx.cond(
+                                        KeyDetailsState.staging, "Stage", "Save Field"
+                                    ),
                                     type="submit",
                                     class_name="px-4 py-2 text-sm font-bold text-white bg-indigo-600 rounded-lg",
                                 ),
@@ -199,6 +840,8 @@ def edit_modal():
                             on_submit=KeyDetailsState.set_hash_field,
                         ),
                     ),
+                    ("set", member_form(with_score=False)),
+                    ("zset", member_form(with_score=True)),
                     rx.el.p("Edit modal not yet available for this type."),
                 ),
                 class_name="bg-white rounded-2xl p-8 w-[500px] shadow-2xl",
@@ -260,7 +903,19 @@ def key_details_panel():
                             ),
                             class_name="flex items-center gap-2 bg-slate-50 px-3 py-1.5 rounded-full border border-slate-100",
                         ),
-                        class_name="px-6 py-4",
+                        meta_chip("ruler", "Length:", KeyDetailsState.value_length),
+                        rx.cond(
+                            KeyDetailsState.encoding != "",
+                            meta_chip("binary", "Enc:", KeyDetailsState.encoding),
+                        ),
+                        rx.cond(
+                            KeyDetailsState.memory_usage > 0,
+                            meta_chip(
+                                "memory-stick", "Mem:", KeyDetailsState.memory_display
+                            ),
+                        ),
+                        watch_status(),
+                        class_name="px-6 py-4 flex flex-wrap items-center gap-2",
                     ),
                     rx.el.div(
                         rx.cond(
@@ -276,6 +931,20 @@ def key_details_panel():
                                     KeyDetailsState.key_type,
                                     ("string", string_handler()),
                                     ("hash", hash_handler()),
+                                    ("list", list_handler()),
+                                    ("set", set_handler()),
+                                    ("zset", zset_handler()),
+                                    ("stream", stream_handler()),
+                                    (
+                                        "none",
+                                        rx.el.div(
+                                            rx.el.p(
+                                                "This key no longer exists.",
+                                                class_name="text-slate-400 italic",
+                                            ),
+                                            class_name="p-8 text-center",
+                                        ),
+                                    ),
                                     rx.el.div(
                                         rx.el.p(
                                             "Handler for type "
@@ -0,0 +1,110 @@
+import reflex as rx
+from redis_browser.states.latency_state import LatencyRow, LatencyState
+
+HEADER_CLASS = "text-[10px] font-bold text-slate-400 uppercase text-right px-1.5"
+CELL_CLASS = "text-[11px] font-mono text-slate-600 text-right px-1.5 whitespace-nowrap"
+
+
+def latency_row(row: LatencyRow):
+    return rx.el.tr(
+        rx.el.td(
+            rx.el.div(
+                row["command"],
+                class_name=rx.cond(
+                    row["command"] == "(all)",
+                    "text-[11px] font-mono font-bold text-slate-700",
+                    "text-[11px] font-mono text-indigo-600",
+                ),
+            ),
+            rx.cond(
+                LatencyState.all_connections,
+                rx.el.div(row["connection"], class_name="text-[9px] text-slate-400"),
+            ),
+            class_name="px-1.5 py-1",
+        ),
+        rx.el.td(row["count"], class_name=CELL_CLASS),
+        rx.el.td(row["p50"], class_name=CELL_CLASS),
+        rx.el.td(row["p95"], class_name=CELL_CLASS),
+        rx.el.td(row["p99"], class_name=CELL_CLASS),
+        rx.el.td(row["max"], class_name=CELL_CLASS),
+        rx.el.td(row["server"], class_name=CELL_CLASS + " text-slate-400"),
+        class_name="border-b border-slate-50",
+    )
+
+
+def latency_panel():
+    """Rolling client-side latency percentiles per command, next to the console."""
+    return rx.el.div(
+        rx.el.div(
+            rx.el.label(
+                rx.el.input(
+                    type="checkbox",
+                    checked=LatencyState.all_connections,
+                    on_change=LatencyState.toggle_all_connections,
+                    class_name="mr-1.5",
+                ),
+                "All connections",
+                class_name="flex items-center text-[10px] font-bold text-slate-400",
+            ),
+            rx.el.div(
+                rx.el.button(
+                    rx.icon(
+                        "refresh-cw",
+                        class_name=rx.cond(
+                            LatencyState.is_loading,
+                            "h-3.5 w-3.5 animate-spin",
+                            "h-3.5 w-3.5",
+                        ),
+                    ),
+                    on_click=LatencyState.refresh_latency,
+                    title="Refresh",
+                    class_name="text-slate-400 hover:text-indigo-600",
+                ),
+                rx.el.button(
+                    rx.icon("download", class_name="h-3.5 w-3.5"),
+                    on_click=LatencyState.export_latency,
+                    title="Export JSON",
+                    class_name="text-slate-400 hover:text-indigo-600",
+                ),
+                rx.el.button(
+                    rx.icon("rotate-ccw", class_name="h-3.5 w-3.5"),
+                    on_click=LatencyState.reset_latency,
+                    title="Reset",
+                    class_name="text-slate-400 hover:text-red-500",
+                ),
+                class_name="flex items-center gap-2",
+            ),
+            class_name="flex items-center justify-between px-3 py-1.5 border-b border-slate-100",
+        ),
+        rx.el.div(
+            rx.cond(
+                LatencyState.rows.length() > 0,
+                rx.el.table(
+                    rx.el.thead(
+                        rx.el.tr(
+                            rx.el.th("Command", class_name=HEADER_CLASS + " text-left"),
+                            rx.el.th("n", class_name=HEADER_CLASS),
+                            rx.el.th("p50", class_name=HEADER_CLASS),
+                            rx.el.th("p95", class_name=HEADER_CLASS),
+                            rx.el.th("p99", class_name=HEADER_CLASS),
+                            rx.el.th("max", class_name=HEADER_CLASS),
+                            rx.el.th(
+                                "server",
+                                title="Server-side mean from INFO commandstats",
+                                class_name=HEADER_CLASS,
+                            ),
+                        ),
+                        class_name="sticky top-0 bg-white",
+                    ),
+                    rx.el.tbody(rx.foreach(LatencyState.rows, latency_row)),
+                    class_name="w-full",
+                ),
+                rx.el.p(
+                    "No commands timed in the last 5 minutes.",
+                    class_name="text-xs text-slate-300 italic text-center mt-10",
+                ),
+            ),
+            class_name="flex-1 overflow-y-auto min-h-0",
+        ),
+        class_name="w-[30rem] border-l border-slate-100 flex flex-col min-h-0 bg-white",
+    )
\ No newline at end of file
@@ -0,0 +1,121 @@
+import reflex as rx
+from redis_browser.backend.monitor import MonitorLine, RateRow
+from redis_browser.states.monitor_state import MonitorState
+
+FIELD_CLASS = "px-2 py-1 text-[11px] font-mono border border-slate-200 rounded focus:outline-none focus:ring-1 focus:ring-indigo-500"
+
+
+def rate_row(row: RateRow):
+    return rx.el.div(
+        rx.el.span(row["name"], class_name="truncate"),
+        rx.el.span(row["ops_per_sec"], class_name="text-slate-400"),
+        class_name="flex justify-between gap-2 text-[11px] font-mono text-slate-600",
+    )
+
+
+def rate_list(title: str, rows):
+    return rx.el.div(
+        rx.el.p(
+            title, class_name="text-[10px] font-bold text-slate-400 uppercase mb-1"
+        ),
+        rx.foreach(rows, rate_row),
+        class_name="flex-1 min-w-0",
+    )
+
+
+def monitor_line(line: MonitorLine):
+    return rx.el.div(
+        rx.el.span(line["time"], class_name="text-slate-400 mr-2"),
+        rx.el.span(line["command"], class_name="text-indigo-600 font-semibold mr-2"),
+        rx.el.span(line["args"], class_name="text-slate-600 break-all"),
+        title=line["client"],
+        class_name="text-[11px] font-mono py-0.5",
+    )
+
+
+def monitor_form():
+    return rx.el.form(
+        rx.el.label(
+            "1 in",
+            rx.el.input(
+                name="sample_rate",
+                type="number",
+                min=1,
+                default_value=MonitorState.sample_rate.to_string(),
+                class_name=FIELD_CLASS + " w-14 ml-1",
+            ),
+            class_name="flex items-center text-[10px] font-bold text-slate-400",
+        ),
+        rx.el.label(
+            rx.el.input(
+                name="max_seconds",
+                type="number",
+                min=1,
+                default_value=MonitorState.max_seconds.to_string(),
+                class_name=FIELD_CLASS + " w-14 mr-1",
+            ),
+            "s",
+            class_name="flex items-center text-[10px] font-bold text-slate-400",
+        ),
+        rx.el.input(
+            name="prefix",
+            placeholder="key prefix",
+            default_value=MonitorState.prefix_filter,
+            class_name=FIELD_CLASS + " w-24",
+        ),
+        rx.el.input(
+            name="commands",
+            placeholder="GET,SET",
+            default_value=MonitorState.command_filter,
+            class_name=FIELD_CLASS + " w-24",
+        ),
+        rx.cond(
+            MonitorState.is_running,
+            rx.el.button(
+                "Stop",
+                type="button",
+                on_click=MonitorState.stop_monitor,
+                class_name="px-3 py-1 bg-red-600 text-white text-xs font-bold rounded hover:bg-red-700",
+            ),
+            rx.el.button(
+                "Start",
+                type="submit",
+                class_name="px-3 py-1 bg-slate-800 text-white text-xs font-bold rounded hover:bg-slate-700",
+            ),
+        ),
+        on_submit=MonitorState.start_monitor,
+        class_name="flex items-center gap-2 px-3 py-1.5 border-b border-slate-100",
+    )
+
+
+def monitor_panel():
+    """Sampled MONITOR tail with backend-computed ops/sec, next to the console."""
+    return rx.el.div(
+        monitor_form(),
+        rx.el.div(
+            rx.el.span(
+                f"seen {MonitorState.seen} · matched {MonitorState.matched}",
+            ),
+            rx.cond(
+                MonitorState.dropped > 0,
+                rx.el.span(
+                    f"dropped {MonitorState.dropped}", class_name="text-amber-600"
+                ),
+            ),
+            rx.cond(
+                MonitorState.is_running,
+                rx.el.span(f"{MonitorState.remaining_seconds}s left"),
+            ),
+            class_name="flex items-center gap-3 px-3 py-1 text-[10px] font-mono text-slate-400",
+        ),
+        rx.el.div(
+            rate_list("Commands / s", MonitorState.command_rates),
+            rate_list("Prefixes / s", MonitorState.prefix_rates),
+            class_name="flex gap-4 px-3 py-1 border-b border-slate-100",
+        ),
+        rx.el.div(
+            rx.foreach(MonitorState.lines, monitor_line),
+            class_name="flex-1 overflow-y-auto min-h-0 px-3 py-1",
+        ),
+        class_name="w-[34rem] border-l border-slate-100 flex flex-col min-h-0 bg-white",
+    )
\ No newline at end of file
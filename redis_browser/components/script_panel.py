@@ -0,0 +1,142 @@
+import reflex as rx
+from redis_browser.backend.lua_scripts import SavedScript
+from redis_browser.states.script_state import ScriptRunRow, ScriptState
+
+FIELD_CLASS = "w-full px-2 py-1 text-[11px] font-mono border border-slate-200 rounded focus:outline-none focus:ring-1 focus:ring-indigo-500"
+
+
+def script_item(script: SavedScript):
+    return rx.el.div(
+        rx.el.span(
+            script["name"],
+            on_click=ScriptState.select_script(script["name"]),
+            class_name=rx.cond(
+                ScriptState.script_name == script["name"],
+                "flex-1 truncate text-[11px] font-bold text-indigo-600 cursor-pointer",
+                "flex-1 truncate text-[11px] text-slate-600 cursor-pointer hover:text-indigo-600",
+            ),
+        ),
+        rx.el.button(
+            rx.icon("x", class_name="h-3 w-3"),
+            on_click=ScriptState.delete_script(script["name"]),
+            class_name="text-slate-300 hover:text-red-500",
+        ),
+        class_name="flex items-center gap-1 py-0.5",
+    )
+
+
+def run_row(row: ScriptRunRow):
+    return rx.el.div(
+        rx.el.span(row["key"], class_name="text-slate-400 mr-2"),
+        rx.el.span(
+            row["output"],
+            class_name=rx.cond(
+                row["status"] == "error", "text-red-500", "text-slate-600"
+            ),
+        ),
+        class_name="text-[11px] font-mono truncate",
+    )
+
+
+def script_result():
+    return rx.cond(
+        ScriptState.result_status != "",
+        rx.el.div(
+            rx.el.div(
+                rx.el.span(ScriptState.result_latency),
+                rx.el.span(ScriptState.result_sha[:12], title=ScriptState.result_sha),
+                rx.cond(
+                    ScriptState.reloaded,
+                    rx.el.span("reloaded after NOSCRIPT", class_name="text-amber-600"),
+                ),
+                class_name="flex items-center gap-3 text-[10px] font-mono text-slate-400",
+            ),
+            rx.el.pre(
+                ScriptState.result,
+                class_name=rx.cond(
+                    ScriptState.result_status == "error",
+                    "text-xs font-mono text-red-500 whitespace-pre-wrap break-all",
+                    "text-xs font-mono text-slate-600 whitespace-pre-wrap break-all",
+                ),
+            ),
+            rx.foreach(ScriptState.run_rows, run_row),
+            class_name="flex-1 overflow-y-auto min-h-0 border-t border-slate-100 pt-1",
+        ),
+    )
+
+
+def script_panel():
+    """Named Lua scripts run by EVALSHA, once or pipelined across keys."""
+    return rx.el.div(
+        rx.el.div(
+            rx.el.button(
+                rx.icon("plus", class_name="h-3 w-3"),
+                "New",
+                on_click=ScriptState.new_script,
+                class_name="flex items-center gap-1 text-[10px] font-bold text-slate-400 hover:text-indigo-600 mb-1",
+            ),
+            rx.foreach(ScriptState.scripts, script_item),
+            class_name="w-32 border-r border-slate-100 px-2 py-1.5 overflow-y-auto",
+        ),
+        rx.el.form(
+            rx.el.div(
+                rx.el.input(
+                    placeholder="Script name",
+                    default_value=ScriptState.script_name,
+                    on_blur=ScriptState.set_script_name,
+                    class_name=FIELD_CLASS,
+                ),
+                rx.el.button(
+                    "Save",
+                    type="button",
+                    on_click=ScriptState.save_script,
+                    class_name="px-2 py-1 text-[10px] font-bold text-slate-500 hover:bg-slate-100 rounded",
+                ),
+                class_name="flex items-center gap-2",
+            ),
+            rx.el.textarea(
+                name="source",
+                placeholder="return redis.call('GET', KEYS[1])",
+                default_value=ScriptState.script_source,
+                on_blur=ScriptState.set_script_source,
+                class_name=FIELD_CLASS + " h-20 resize-none",
+            ),
+            rx.el.div(
+                rx.el.input(
+                    name="keys",
+                    placeholder="KEYS (space or comma separated)",
+                    class_name=FIELD_CLASS,
+                ),
+                rx.el.input(
+                    name="args",
+                    placeholder="ARGV",
+                    class_name=FIELD_CLASS,
+                ),
+                class_name="flex gap-2",
+            ),
+            rx.el.div(
+                rx.el.label(
+                    rx.el.input(
+                        type="checkbox",
+                        checked=ScriptState.per_key,
+                        on_change=ScriptState.toggle_per_key,
+                        class_name="mr-1.5",
+                    ),
+                    "Once per key (pipelined)",
+                    class_name="flex items-center text-[10px] font-bold text-slate-400",
+                ),
+                rx.el.button(
+                    rx.cond(ScriptState.is_running, "Running...", "Run"),
+                    type="submit",
+                    disabled=ScriptState.is_running,
+                    class_name="px-3 py-1 bg-slate-800 text-white text-xs font-bold rounded hover:bg-slate-700 disabled:opacity-50",
+                ),
+                class_name="flex items-center justify-between",
+            ),
+            script_result(),
+            key=f"script_editor_{ScriptState.editor_version}",
+            on_submit=ScriptState.run_script,
+            class_name="flex-1 flex flex-col gap-1.5 px-3 py-1.5 min-w-0 min-h-0",
+        ),
+        class_name="w-[36rem] border-l border-slate-100 flex min-h-0 bg-white",
+    )
\ No newline at end of file
@@ -1,4 +1,5 @@
 import reflex as rx
+from redis_browser.backend.pool_registry import PoolStats
 from redis_browser.states.connection_state import ConnectionState, RedisConfig
 
 
@@ -44,6 +45,51 @@ def connection_item(config: RedisConfig):
     )
 
 
+def pool_stats_row(stats: PoolStats):
+    return rx.el.div(
+        rx.el.div(
+            rx.el.span(
+                stats["name"],
+                class_name="text-[11px] font-semibold text-slate-600 truncate",
+            ),
+            rx.el.span(
+                f"{stats['in_use']} in use / {stats['idle']} idle / {stats['max_connections']} max",
+                class_name="text-[10px] text-slate-400 font-mono",
+            ),
+            class_name="flex flex-col min-w-0",
+        ),
+        rx.el.span(
+            f"{stats['checkouts']} checkouts",
+            class_name="text-[10px] text-slate-400 font-mono ml-auto",
+        ),
+        class_name="flex items-center gap-2 py-1",
+    )
+
+
+def pool_stats_panel():
+    return rx.el.div(
+        rx.el.div(
+            rx.el.h2(
+                "Connection Pools",
+                class_name="text-[10px] font-bold text-slate-400 uppercase tracking-widest",
+            ),
+            rx.el.button(
+                rx.icon("refresh-cw", class_name="h-3 w-3"),
+                on_click=ConnectionState.refresh_pool_stats,
+                title="Refresh Pool Stats",
+                class_name="p-1 hover:bg-slate-200 rounded text-slate-400",
+            ),
+            class_name="flex items-center justify-between mb-1",
+        ),
+        rx.cond(
+            ConnectionState.pool_stats.length() > 0,
+            rx.foreach(ConnectionState.pool_stats, pool_stats_row),
+            rx.el.p("No open pools", class_name="text-[10px] text-slate-300 italic"),
+        ),
+        class_name="px-6 py-3 border-t border-slate-100",
+    )
+
+
 def sidebar():
     return rx.el.aside(
         rx.el.div(
@@ -81,6 +127,7 @@ def sidebar():
                 ),
                 class_name="flex-1",
             ),
+            pool_stats_panel(),
             rx.el.div(
                 rx.cond(
                     ConnectionState.is_connected,
@@ -1,17 +1,41 @@
 import reflex as rx
-import redis
 import logging
 import datetime
 import shlex
+import time
 from typing import Any, Optional, TypedDict
-from redis_browser.states.connection_state import ConnectionState
+from redis_browser.backend.command_batch import parse_script, run_batch
+from redis_browser.backend.command_info import (
+    WriteEffect,
+    changes_connection,
+    command_table,
+)
+from redis_browser.backend.console_output import outputs
+from redis_browser.backend.latency import format_latency
+from redis_browser.backend.pool_registry import dedicated_client, get_client
+from redis_browser.states.connection_state import ConnectionState, client_connected
+
+# Entries kept in (and synced to) the browser; older ones spill to the backend
+LOG_BUFFER_SIZE = 200
+SPILLED_LOG_LIMIT = 5000
+SPILLED_LOG_BYTES = 4 * 1024 * 1024
+_NO_REPLY = object()
 
 
 class LogEntry(TypedDict):
+    id: int
     timestamp: str
     command: str
     output: str
     status: str
+    # Time to reply; empty for entries that never reached the server
+    latency: str
+    # Further pages of the reply can be loaded from the backend
+    has_more: bool
+
+
+def _entry_bytes(entry: LogEntry) -> int:
+    return len(entry["command"]) + len(entry["output"])
 
 
 class CommandState(rx.State):
@@ -20,14 +44,120 @@ class CommandState(rx.State):
     is_executing: bool = False
     command_history: list[str] = []
     history_index: int = -1
+    # Multi-line scripts sent as one pipeline, optionally wrapped in MULTI/EXEC
+    batch_mode: bool = False
+    batch_atomic: bool = False
+    spilled_count: int = 0
+    _spilled_logs: list[LogEntry] = []
+    _spilled_bytes: int = 0
+    # Never reset, so it also serves as the console input's remount key
+    next_log_id: int = 0
 
     @rx.event
     def set_command_input(self, value: str):
         self.command_input = value
 
+    @rx.event
+    def toggle_batch_mode(self):
+        self.batch_mode = not self.batch_mode
+
+    @rx.event
+    def toggle_batch_atomic(self):
+        self.batch_atomic = not self.batch_atomic
+
+    def _add_log(
+        self,
+        command: str,
+        status: str,
+        output: str = "",
+        latency: str = "",
+        reply: Any = _NO_REPLY,
+    ):
+        """Adds an entry to the ring buffer, rendering `reply` a page at a time."""
+        owner = self.router.session.client_token
+        entry_id = self.next_log_id
+        self.next_log_id += 1
+        has_more = False
+        if reply is not _NO_REPLY:
+            output, has_more = outputs.open(owner, entry_id, reply)
+            outputs.clear_closed(client_connected)
+        self.logs.insert(
+            0,
+            {
+                "id": entry_id,
+                "timestamp": datetime.datetime.now().strftime("%H:%M:%S"),
+                "command": command,
+                "output": output,
+                "status": status,
+                "latency": latency,
+                "has_more": has_more,
+            },
+        )
+        if len(self.logs) > LOG_BUFFER_SIZE:
+            spilled = self.logs[LOG_BUFFER_SIZE:]
+            self.logs = self.logs[:LOG_BUFFER_SIZE]
+            outputs.discard(owner, [entry["id"] for entry in spilled])
+            spilled = [{**entry, "has_more": False} for entry in spilled]
+            self._spilled_logs = spilled + self._spilled_logs
+            self._spilled_bytes += sum(_entry_bytes(entry) for entry in spilled)
+            while self._spilled_logs and (
+                len(self._spilled_logs) > SPILLED_LOG_LIMIT
+                or self._spilled_bytes > SPILLED_LOG_BYTES
+            ):
+                self._spilled_bytes -= _entry_bytes(self._spilled_logs.pop())
+            self.spilled_count = len(self._spilled_logs)
+
+    async def _refresh_after(self, effect: WriteEffect):
+        """Refreshes only the tree entries and open key that commands wrote."""
+        from redis_browser.states.key_browser_state import KeyBrowserState
+        from redis_browser.states.key_details_state import KeyDetailsState
+
+        # Flushes emit no key events and name no keys
+        if effect["rescan"]:
+            yield KeyBrowserState.scan_keys
+        elif effect["keys"]:
+            yield KeyBrowserState.refresh_keys(effect["keys"])
+        selected_key = (await self.get_state(KeyBrowserState)).selected_key
+        if selected_key and (
+            effect["unknown"] or effect["rescan"] or selected_key in effect["keys"]
+        ):
+            yield KeyDetailsState.fetch_key_details(selected_key)
+
     @rx.event
     def clear_logs(self):
         self.logs = []
+        self._spilled_logs = []
+        self._spilled_bytes = 0
+        self.spilled_count = 0
+        outputs.clear(self.router.session.client_token)
+
+    @rx.event
+    def load_more_output(self, entry_id: int):
+        for i, entry in enumerate(self.logs):
+            if entry["id"] == entry_id:
+                break
+        else:
+            return
+        page = outputs.more(self.router.session.client_token, entry_id)
+        if page is None:
+            text, has_more = "(output no longer available)", False
+        else:
+            text, has_more = page
+        self.logs[i] = {
+            **entry,
+            "output": f"{entry['output']}\n{text}",
+            "has_more": has_more,
+        }
+
+    @rx.event
+    def download_log(self):
+        """Exports the whole log, spilled entries included, oldest first."""
+        lines = []
+        for entry in reversed(self.logs + self._spilled_logs):
+            latency = f" ({entry['latency']})" if entry["latency"] else ""
+            lines.append(f"[{entry['timestamp']}] > {entry['command']}{latency}")
+            lines.append(entry["output"])
+        return rx.download(data="\n".join(lines), filename="redis-console.log")
 
     @rx.event(background=True)
     async def execute_command(self, form_data: dict[str, Any]):
@@ -42,15 +172,7 @@ class CommandState(rx.State):
             connection_state = await self.get_state(ConnectionState)
             config = connection_state.active_config
             if not config or not connection_state.is_connected:
-                self.logs.insert(
-                    0,
-                    {
-                        "timestamp": datetime.datetime.now().strftime("%H:%M:%S"),
-                        "command": cmd_str,
-                        "output": "Error: No active connection.",
-                        "status": "error",
-                    },
-                )
+                self._add_log(cmd_str, "error", "Error: No active connection.")
                 self.command_input = ""
                 self.is_executing = False
                 return
@@ -62,67 +184,81 @@ class CommandState(rx.State):
                 return
             command_name = parts[0]
             args = parts[1:]
-            r = redis.Redis(
-                host=config["host"],
-                port=config["port"],
-                password=config["password"] if config["password"] else None,
-                db=config["db"],
-                socket_timeout=5,
-                decode_responses=True,
-            )
-            result = r.execute_command(command_name, *args)
-            formatted_output = str(result)
-            if result is None:
-                formatted_output = "(nil)"
-            elif isinstance(result, list):
-                pass
+            # SELECT, MULTI, SUBSCRIBE and the like run on a throwaway
+            # connection so the shared pool never hands their state on
+            dedicated = changes_connection(parts)
+            r = dedicated_client(config) if dedicated else get_client(config)
+            try:
+                started = time.perf_counter()
+                result = await r.execute_command(command_name, *args)
+                elapsed = int((time.perf_counter() - started) * 1_000_000)
+            finally:
+                if dedicated:
+                    await r.aclose()
+            latency = format_latency(elapsed)
+            effect = await command_table.write_effect(config, [parts])
             async with self:
-                self.logs.insert(
-                    0,
-                    {
-                        "timestamp": datetime.datetime.now().strftime("%H:%M:%S"),
-                        "command": cmd_str,
-                        "output": formatted_output,
-                        "status": "success",
-                    },
-                )
-                read_only = [
-                    "get",
-                    "hget",
-                    "lrange",
-                    "smembers",
-                    "zrange",
-                    "ttl",
-                    "type",
-                    "info",
-                    "ping",
-                    "scan",
-                    "keys",
-                ]
-                if command_name.lower() not in read_only:
-                    from redis_browser.states.key_browser_state import KeyBrowserState
-
-                    yield KeyBrowserState.scan_keys
-                    from redis_browser.states.key_details_state import KeyDetailsState
-
-                    selected_key = await self.get_state(KeyBrowserState)
-                    if selected_key.selected_key:
-                        yield KeyDetailsState.fetch_key_details(
-                            selected_key.selected_key
-                        )
+                self._add_log(cmd_str, "success", latency=latency, reply=result)
+                async for event in self._refresh_after(effect):
+                    yield event
         except Exception as e:
             logging.exception(f"Error executing Redis command: {e}")
             async with self:
-                self.logs.insert(
-                    0,
-                    {
-                        "timestamp": datetime.datetime.now().strftime("%H:%M:%S"),
-                        "command": cmd_str,
-                        "output": f"Error: {str(e)}",
-                        "status": "error",
-                    },
-                )
+                self._add_log(cmd_str, "error", f"Error: {str(e)}")
         finally:
             async with self:
                 self.command_input = ""
+                self.is_executing = False
+
+    @rx.event(background=True)
+    async def execute_batch(self, form_data: dict[str, Any]):
+        """Runs a pasted script, one command per line, in a single round trip."""
+        script = form_data.get("script", "")
+        commands, parse_errors = parse_script(script)
+        async with self:
+            if not commands and not parse_errors:
+                return
+            mode = "MULTI/EXEC" if self.batch_atomic else "pipeline"
+            summary = f"BATCH ({len(commands)} commands, {mode})"
+            if parse_errors:
+                # Nothing is sent unless the whole script parses
+                self._add_log(summary, "error", "\n".join(parse_errors))
+                return
+            connection_state = await self.get_state(ConnectionState)
+            config = connection_state.active_config
+            if not config or not connection_state.is_connected:
+                self._add_log(summary, "error", "Error: No active connection.")
+                return
+            atomic = self.batch_atomic
+            self.is_executing = True
+        try:
+            started = time.perf_counter()
+            results = await run_batch(get_client(config), commands, atomic)
+            total = int((time.perf_counter() - started) * 1_000_000)
+            effect = await command_table.write_effect(config, commands)
+            async with self:
+                errors = 0
+                for parts, (reply, micros) in zip(commands, results):
+                    failed = isinstance(reply, Exception)
+                    errors += failed
+                    self._add_log(
+                        shlex.join(parts),
+                        "error" if failed else "success",
+                        latency=format_latency(micros),
+                        reply=reply,
+                    )
+                self._add_log(
+                    summary,
+                    "error" if errors else "success",
+                    f"{len(results) - errors} succeeded, {errors} failed",
+                    format_latency(total),
+                )
+                async for event in self._refresh_after(effect):
+                    yield event
+        except Exception as e:
+            logging.exception(f"Error executing Redis batch: {e}")
+            async with self:
+                self._add_log(summary, "error", f"Error: {str(e)}")
+        finally:
+            async with self:
                 self.is_executing = False
\ No newline at end of file
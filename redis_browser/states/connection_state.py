@@ -1,7 +1,24 @@
 import reflex as rx
-import redis
 import logging
 from typing import TypedDict, Optional
+from reflex.utils.prerequisites import get_app
+from redis_browser.backend.command_info import command_table
+from redis_browser.backend.pool_registry import (
+    DEFAULT_MAX_CONNECTIONS,
+    PoolStats,
+    get_client,
+    registry,
+)
+from redis_browser.backend.tracking import DEFAULT_WATCH_MODE
+
+
+def client_connected(token: str) -> bool:
+    """Whether a browser tab is still connected under this session token."""
+    try:
+        namespace = get_app().app.event_namespace
+    except Exception:
+        return True
+    return namespace is None or token in namespace.token_to_sid
 
 
 class RedisConfig(TypedDict):
@@ -11,6 +28,9 @@ class RedisConfig(TypedDict):
     port: int
     password: str
     db: int
+    max_connections: int
+    watch_mode: str
+    tracking_prefixes: str
 
 
 class ConnectionState(rx.State):
@@ -22,6 +42,9 @@ class ConnectionState(rx.State):
             "port": 6379,
             "password": "",
             "db": 0,
+            "max_connections": DEFAULT_MAX_CONNECTIONS,
+            "watch_mode": DEFAULT_WATCH_MODE,
+            "tracking_prefixes": "",
         }
     ]
     form_name: str = ""
@@ -29,12 +52,16 @@ class ConnectionState(rx.State):
     form_port: int = 6379
     form_password: str = ""
     form_db: int = 0
+    form_max_connections: int = DEFAULT_MAX_CONNECTIONS
+    form_watch_mode: str = DEFAULT_WATCH_MODE
+    form_tracking_prefixes: str = ""
     selected_id: str = ""
     is_connected: bool = False
     is_connecting: bool = False
     error_message: str = ""
     show_config_modal: bool = False
     editing_id: str = ""
+    pool_stats: list[PoolStats] = []
 
     @rx.var
     def active_config(self) -> Optional[RedisConfig]:
@@ -57,6 +84,9 @@ class ConnectionState(rx.State):
         self.form_port = 6379
         self.form_password = ""
         self.form_db = 0
+        self.form_max_connections = DEFAULT_MAX_CONNECTIONS
+        self.form_watch_mode = DEFAULT_WATCH_MODE
+        self.form_tracking_prefixes = ""
 
     @rx.event
     def select_connection(self, config_id: str):
@@ -75,12 +105,21 @@ class ConnectionState(rx.State):
                 self.form_port = config["port"]
                 self.form_password = config["password"]
                 self.form_db = config["db"]
+                self.form_max_connections = config.get(
+                    "max_connections", DEFAULT_MAX_CONNECTIONS
+                )
+                self.form_watch_mode = config.get("watch_mode", DEFAULT_WATCH_MODE)
+                self.form_tracking_prefixes = config.get("tracking_prefixes", "")
                 self.show_config_modal = True
                 break
 
     @rx.event
     def delete_config(self, config_id: str):
+        for config in self.configs:
+            if config["id"] == config_id:
+                registry.invalidate(config)
         self.configs = [c for c in self.configs if c["id"] != config_id]
+        self.pool_stats = registry.stats(self.configs)
         if self.selected_id == config_id:
             self.selected_id = ""
             self.is_connected = False
@@ -96,8 +135,16 @@ class ConnectionState(rx.State):
             "port": int(form_data.get("port", 6379)),
             "password": form_data.get("password", ""),
             "db": int(form_data.get("db", 0)),
+            "max_connections": int(
+                form_data.get("max_connections") or DEFAULT_MAX_CONNECTIONS
+            ),
+            "watch_mode": form_data.get("watch_mode") or DEFAULT_WATCH_MODE,
+            "tracking_prefixes": form_data.get("tracking_prefixes", "").strip(),
         }
         if self.editing_id:
+            for config in self.configs:
+                if config["id"] == self.editing_id:
+                    registry.invalidate(config, new_config)
             self.configs = [
                 new_config if c["id"] == self.editing_id else c for c in self.configs
             ]
@@ -106,6 +153,12 @@ class ConnectionState(rx.State):
         self.show_config_modal = False
         self.editing_id = ""
         self.reset_form()
+        self.pool_stats = registry.stats(self.configs)
+
+    @rx.event
+    def refresh_pool_stats(self):
+        registry.evict_idle()
+        self.pool_stats = registry.stats(self.configs)
 
     @rx.event(background=True)
     async def connect_redis(self):
@@ -117,17 +170,16 @@ class ConnectionState(rx.State):
             self.error_message = ""
             config = self.active_config
         try:
-            r = redis.Redis(
-                host=config["host"],
-                port=config["port"],
-                password=config["password"] if config["password"] else None,
-                db=config["db"],
-                socket_timeout=5,
-                decode_responses=True,
-            )
-            r.ping()
+            r = get_client(config)
+            await r.ping()
+            try:
+                await command_table.load(config)
+            except Exception as e:
+                # Without it every console command refreshes the open key
+                logging.warning(f"COMMAND INFO failed for '{config['name']}': {e}")
             async with self:
                 self.is_connected = True
+                self.pool_stats = registry.stats(self.configs)
                 yield rx.toast(
                     f"Successfully connected to {config['name']}", position="top-right"
                 )
@@ -147,7 +199,10 @@ class ConnectionState(rx.State):
     @rx.event
     def disconnect_redis(self):
         self.is_connected = False
+        from redis_browser.states.key_browser_state import KeyBrowserState
         from redis_browser.states.key_details_state import KeyDetailsState
 
+        yield KeyBrowserState.cancel_scan
+        yield KeyBrowserState.stop_key_events
         yield KeyDetailsState.stop_watching
         yield rx.toast("Disconnected from Redis server")
\ No newline at end of file
@@ -1,88 +1,327 @@
 import reflex as rx
-import redis
+import asyncio
 import logging
-from typing import TypedDict, Optional, Any
-from redis_browser.states.connection_state import ConnectionState
+import re
+import time
+from typing import Optional, Any
+from redis_browser.backend.key_trie import KeyTrie, TreeItem
+from redis_browser.backend.keyspace_listener import (
+    FLUSH_EVENTS,
+    KEYEVENT_NOTIFY_FLAGS,
+    REMOVAL_EVENTS,
+    RESYNC_EVENT,
+    dispatcher,
+    keyevent_name,
+    keyevent_pattern,
+)
+from redis_browser.backend.pool_registry import get_client
+from redis_browser.backend.tracking import uses_tracking
+from redis_browser.states.connection_state import ConnectionState, client_connected
 
+DEFAULT_SCAN_COUNT = 500
+# A scan publishes what it has found every SCAN_BATCH_KEYS keys or
+# SCAN_BATCH_SECONDS, whichever comes first.
+SCAN_BATCH_KEYS = 1000
+SCAN_BATCH_SECONDS = 0.25
+# Each run pauses after this many new keys; resume_scan picks up the cursor.
+MAX_KEYS_PER_SCAN = 10000
+# Lazy mode samples this many keys to discover the top level, then pages
+# each folder's subtree in LAZY_PAGE_SIZE keys at a time when expanded.
+LAZY_SAMPLE_KEYS = 2000
+LAZY_PAGE_SIZE = 500
+LAZY_PAGE_SECONDS = 2.0
 
-class TreeItem(TypedDict):
-    id: str
-    label: str
-    level: int
-    type: str
-    has_children: bool
-    expanded: bool
-    children_count: int
-    full_path: str
+
+# The tree renders fixed-height rows and only ships TREE_WINDOW_ROWS of them,
+# starting TREE_OVERSCAN_ROWS above the first row in the viewport.
+TREE_ROW_HEIGHT = 32
+TREE_WINDOW_ROWS = 80
+TREE_OVERSCAN_ROWS = 20
+# Key events are applied to the tree in batches at most this often.
+KEY_EVENT_FLUSH_SECONDS = 0.25
+# Key events queued beyond this are dropped, and the tree is rescanned instead
+KEY_EVENT_QUEUE_SIZE = 10000
+KEY_EVENT_SLOT = "key_browser"
+SEARCH_MODES = ["local", "glob", "regex"]
+_REGEX_META = set(".^$*+?{}[]\\|()")
+
+
+def glob_escape(text: str) -> str:
+    """Escapes glob metacharacters so text matches literally in SCAN MATCH."""
+    return "".join("\\" + c if c in "*?[]\\" else c for c in text)
+
+
+def _has_top_level_alternation(regex: str) -> bool:
+    """Whether a `|` outside any group or character class splits the regex."""
+    depth, in_class, escaped = 0, False, False
+    for c in regex:
+        if escaped:
+            escaped = False
+        elif c == "\\":
+            escaped = True
+        elif in_class:
+            in_class = c != "]"
+        elif c == "[":
+            in_class = True
+        elif c == "(":
+            depth += 1
+        elif c == ")":
+            depth -= 1
+        elif c == "|" and depth == 0:
+            return True
+    return False
+
+
+def search_match_pattern(mode: str, query: str) -> str:
+    """Builds the server-side SCAN MATCH pattern for a search query.
+
+    Glob queries without wildcards become substring matches. Regex queries
+    push their literal ^prefix down to the server and post-filter the rest;
+    a top-level alternation (`^user|session`) anchors only its first branch,
+    so it scans everything.
+    """
+    if mode == "glob":
+        if any(c in query for c in "*?["):
+            return query
+        return f"*{glob_escape(query)}*"
+    if query.startswith("^") and not _has_top_level_alternation(query):
+        prefix = ""
+        for c in query[1:]:
+            if c in _REGEX_META:
+                # A quantifier makes the preceding literal optional or repeated
+                if c in "*?{":
+                    prefix = prefix[:-1]
+                break
+            prefix += c
+        return glob_escape(prefix) + "*"
+    return "*"
 
 
 class KeyBrowserState(rx.State):
-    keys: list[str] = []
-    expanded_paths: list[str] = []
+    key_count: int = 0
+    flat_tree: list[TreeItem] = []
     selected_key: str = ""
     filter_query: str = ""
     is_loading_keys: bool = False
     delimiter: str = ":"
+    scan_count: int = DEFAULT_SCAN_COUNT
+    scan_cursor: int = 0
+    db_size: int = 0
+    lazy_mode: bool = False
+    pending_folders: list[str] = []
+    loading_folders: list[str] = []
+    search_mode: str = "local"
+    is_searching: bool = False
+    search_match_count: int = 0
+    tree_row_count: int = 0
+    window_start: int = 0
 
-    @rx.var
-    def flat_tree(self) -> list[TreeItem]:
-        """
-        Computes the flat list of visible tree items based on keys, filter, and expansion state.
+    # Backend-only: generation counter to cancel superseded scans
+    _scan_generation: int = 0
+    # Backend-only: saved SCAN MATCH cursor per lazily loaded folder
+    _folder_cursors: dict[str, int] = {}
+    # Backend-only: the last scan reached cursor 0, so the tree covers every key
+    _scan_complete: bool = False
+    # Backend-only: keys brought in by scans and folder loads; key events may
+    # grow the tree up to this (or MAX_KEYS_PER_SCAN), never past it
+    _loaded_key_count: int = 0
+    # Backend-only: every scanned key lives here, never in a synced var; the
+    # client only sees key_count and the flat_tree window.
+    _trie: KeyTrie = KeyTrie()
+    _expanded_paths: set[str] = set()
+    _filtered_trie: Optional[KeyTrie] = None
+    _filtered_query: str = ""
+    # Backend-only: server-side search results and the generation that owns them
+    _search_trie: Optional[KeyTrie] = None
+    _search_generation: int = 0
+    # Backend-only: every visible row; flat_tree is the window sent to the client
+    _visible_rows: list[TreeItem] = []
+    _scroll_row: int = 0
+
+    def _refresh_tree(self):
+        """Re-emits flat_tree from the trie for the current filter and expansion."""
+        trie = self._trie
+        if self._search_trie is not None:
+            trie = self._search_trie
+        elif self.filter_query:
+            if self._filtered_trie is None or self._filtered_query != self.filter_query:
+                self._filtered_trie = self._trie.filtered(self.filter_query)
+                self._filtered_query = self.filter_query
+            trie = self._filtered_trie
+        self._visible_rows = trie.visible_rows(
+            self._expanded_paths, set(self.pending_folders)
+        )
+        self.tree_row_count = len(self._visible_rows)
+        self._update_window(force=True)
+
+    def _update_window(self, force: bool = False):
+        max_start = max(0, self.tree_row_count - TREE_WINDOW_ROWS)
+        start = min(max(0, self._scroll_row - TREE_OVERSCAN_ROWS), max_start)
+        # Small scrolls stay inside the overscan; skip the re-send
+        if not force and abs(start - self.window_start) < TREE_OVERSCAN_ROWS // 2:
+            return
+        self.window_start = start
+        self.flat_tree = self._visible_rows[start : start + TREE_WINDOW_ROWS]
+
+    @rx.event
+    def set_tree_scroll(self, scroll_top: float):
+        self._scroll_row = int((scroll_top or 0) // TREE_ROW_HEIGHT)
+        self._update_window()
+
+    def _covers_key(self, key: str) -> bool:
+        """Whether a new key falls inside what was scanned or loaded.
+
+        A partial scan cannot tell whether it would have reached the key,
+        and in lazy mode only fully loaded folders are complete, so keys
+        elsewhere are left for the next scan or folder load.
         """
-        filtered_keys = [k for k in self.keys if self.filter_query.lower() in k.lower()]
-        filtered_keys.sort()
-        tree_root = {}
-        for key in filtered_keys:
-            parts = key.split(self.delimiter)
-            current_level = tree_root
-            for i, part in enumerate(parts):
-                is_last = i == len(parts) - 1
-                if part not in current_level:
-                    current_level[part] = {
-                        "__children__": {},
-                        "__count__": 0,
-                        "__is_key__": False,
-                        "__path__": self.delimiter.join(parts[: i + 1]),
-                    }
-                node = current_level[part]
-                node["__count__"] += 1
-                if is_last:
-                    node["__is_key__"] = True
-                current_level = node["__children__"]
-        visible_items: list[TreeItem] = []
-
-        def traverse(node_dict: dict, level: int):
-            sorted_parts = sorted(node_dict.keys())
-            for part in sorted_parts:
-                info = node_dict[part]
-                full_path = info["__path__"]
-                is_folder = bool(info["__children__"])
-                is_key = info["__is_key__"]
-                type_ = "folder" if is_folder else "key"
-                is_expanded = full_path in self.expanded_paths
-                item: TreeItem = {
-                    "id": full_path,
-                    "label": part,
-                    "level": level,
-                    "type": type_,
-                    "has_children": is_folder,
-                    "expanded": is_expanded,
-                    "children_count": info["__count__"] if is_folder else 0,
-                    "full_path": full_path,
-                }
-                visible_items.append(item)
-                if is_folder and is_expanded:
-                    traverse(info["__children__"], level + 1)
-
-        traverse(tree_root, 0)
-        return visible_items
+        if len(self._trie) >= max(MAX_KEYS_PER_SCAN, self._loaded_key_count):
+            return False
+        if self._scan_complete:
+            return True
+        if not self.lazy_mode:
+            return False
+        parts = key.split(self.delimiter)
+        return any(
+            self._folder_cursors.get(self.delimiter.join(parts[:depth])) == 0
+            for depth in range(1, len(parts))
+        )
+
+    def _apply_key_events(self, events: list[tuple[str, str]]):
+        """Applies keyevent (channel, key) pairs to the tree in place."""
+        changed = False
+        for channel, key in events:
+            if keyevent_name(channel) in REMOVAL_EVENTS:
+                if self._trie.remove(key):
+                    changed = True
+                    self._filter_keys([key], remove=True)
+                if self._search_trie is not None:
+                    self._search_trie.remove(key)
+            elif self._covers_key(key) and self._trie.insert(key):
+                changed = True
+                self._filter_keys([key])
+        if not changed:
+            return
+        self.key_count = len(self._trie)
+        self._refresh_tree()
+
+    def _add_keys(self, keys: list[str]):
+        added = self._trie.update(keys)
+        if added:
+            self._loaded_key_count += added
+            self.key_count = len(self._trie)
+            self._filter_keys(keys)
+        self._refresh_tree()
+
+    def _filter_keys(self, keys: list[str], remove: bool = False):
+        """Mirrors trie changes into the filtered trie rather than rebuilding it."""
+        if self._filtered_trie is None:
+            return
+        query = self._filtered_query.lower()
+        for key in keys:
+            if query in key.lower():
+                if remove:
+                    self._filtered_trie.remove(key)
+                else:
+                    self._filtered_trie.insert(key)
 
     @rx.event
     def toggle_expand(self, path: str):
-        if path in self.expanded_paths:
-            self.expanded_paths = [p for p in self.expanded_paths if p != path]
+        if path in self._expanded_paths:
+            self._expanded_paths.discard(path)
         else:
-            self.expanded_paths.append(path)
+            self._expanded_paths.add(path)
+            if (
+                self.lazy_mode
+                and self._search_trie is None
+                and path not in self._folder_cursors
+            ):
+                self._refresh_tree()
+                return KeyBrowserState.load_folder(path)
+        self._refresh_tree()
+
+    @rx.event
+    def remove_key(self, key: str):
+        """Drops a key the app itself deleted without waiting for its notification."""
+        self._apply_key_events([("del", key)])
+        if self.selected_key == key:
+            self.selected_key = ""
+
+    @rx.event(background=True)
+    async def refresh_keys(self, keys: list[str]):
+        """Re-checks keys a console command wrote, adding or dropping them in the tree."""
+        async with self:
+            connection_state = await self.get_state(ConnectionState)
+            config = connection_state.active_config
+            if not config:
+                return
+        try:
+            pipe = get_client(config).pipeline(transaction=False)
+            for key in keys:
+                pipe.exists(key)
+            exists = await pipe.execute()
+            async with self:
+                self._apply_key_events(
+                    [
+                        ("new" if found else "del", key)
+                        for key, found in zip(keys, exists)
+                    ]
+                )
+        except Exception as e:
+            logging.exception(f"Error refreshing keys: {e}")
+
+    @rx.event
+    def toggle_lazy_mode(self):
+        self.lazy_mode = not self.lazy_mode
+        return KeyBrowserState.scan_keys
+
+    @rx.event(background=True)
+    async def load_folder(self, path: str):
+        """Pages in the next slice of a folder's subtree with SCAN MATCH."""
+        async with self:
+            if path in self.loading_folders:
+                return
+            cursor = self._folder_cursors.get(path, 0)
+            count = self.scan_count
+            pattern = glob_escape(path + self.delimiter) + "*"
+            generation = self._scan_generation
+            connection_state = await self.get_state(ConnectionState)
+            config = connection_state.active_config
+            if not config:
+                return
+            self.loading_folders.append(path)
+        try:
+            r = get_client(config)
+            found: list[str] = []
+            seen: set[str] = set()
+            deadline = time.monotonic() + LAZY_PAGE_SECONDS
+            while True:
+                cursor, page = await r.scan(cursor=cursor, match=pattern, count=count)
+                for key in page:
+                    if key not in seen:
+                        seen.add(key)
+                        found.append(key)
+                if (
+                    cursor == 0
+                    or len(found) >= LAZY_PAGE_SIZE
+                    or time.monotonic() >= deadline
+                ):
+                    break
+            async with self:
+                if self._scan_generation != generation:
+                    return
+                self._folder_cursors[path] = cursor
+                pending = [p for p in self.pending_folders if p != path]
+                if cursor != 0:
+                    pending.append(path)
+                self.pending_folders = pending
+                self._add_keys(found)
+        except Exception as e:
+            logging.exception(f"Error loading folder '{path}': {e}")
+            yield rx.toast(f"Failed to load '{path}': {str(e)}")
+        finally:
+            async with self:
+                self.loading_folders = [p for p in self.loading_folders if p != path]
 
     @rx.event
     def select_key(self, key: str):
@@ -93,43 +332,252 @@ class KeyBrowserState(rx.State):
 
     @rx.event
     def set_filter_query(self, query: str):
+        """Filters locally, or starts a server-side search superseding any in flight."""
         self.filter_query = query
+        self._search_generation += 1
+        if self.search_mode == "local" or not query:
+            self._search_trie = None
+            self.is_searching = False
+            self._refresh_tree()
+            return
+        if self.search_mode == "regex":
+            try:
+                re.compile(query)
+            except re.error as e:
+                self.is_searching = False
+                return rx.toast(f"Invalid regex: {e}")
+        self._search_trie = KeyTrie(self.delimiter)
+        self.search_match_count = 0
+        self.is_searching = True
+        self._refresh_tree()
+        return KeyBrowserState.run_search(self._search_generation)
+
+    @rx.event
+    def set_search_mode(self, mode: str):
+        self.search_mode = mode if mode in SEARCH_MODES else "local"
+        return KeyBrowserState.set_filter_query(self.filter_query)
+
+    @rx.event
+    def cancel_search(self):
+        self._search_generation += 1
+        self.is_searching = False
 
     @rx.event(background=True)
-    async def scan_keys(self):
+    async def run_search(self, generation: int):
+        """Streams SCAN MATCH results for the current query into the search trie."""
         async with self:
-            self.is_loading_keys = True
-            self.keys = []
-            self.expanded_paths = []
+            if self._search_generation != generation:
+                return
+            mode = self.search_mode
+            query = self.filter_query
+            count = self.scan_count
+            connection_state = await self.get_state(ConnectionState)
+            config = connection_state.active_config
+            if not config:
+                self.is_searching = False
+                return
+        pattern = search_match_pattern(mode, query)
+        regex = re.compile(query) if mode == "regex" else None
+        try:
+            r = get_client(config)
+            cursor = 0
+            batch: list[str] = []
+            seen: set[str] = set()
+            last_flush = time.monotonic()
+            while True:
+                cursor, page = await r.scan(cursor=cursor, match=pattern, count=count)
+                for key in page:
+                    if key in seen or (regex and not regex.search(key)):
+                        continue
+                    seen.add(key)
+                    batch.append(key)
+                done = cursor == 0 or len(seen) >= MAX_KEYS_PER_SCAN
+                if (
+                    done
+                    or len(batch) >= SCAN_BATCH_KEYS
+                    or time.monotonic() - last_flush >= SCAN_BATCH_SECONDS
+                ):
+                    async with self:
+                        if self._search_generation != generation:
+                            return
+                        self._search_trie.update(batch)
+                        self.search_match_count = len(self._search_trie)
+                        self._refresh_tree()
+                    batch = []
+                    last_flush = time.monotonic()
+                if done:
+                    break
+        except Exception as e:
+            logging.exception(f"Error searching keys: {e}")
+            yield rx.toast(f"Search failed: {str(e)}")
+        finally:
+            async with self:
+                if self._search_generation == generation:
+                    self.is_searching = False
+
+    @rx.event
+    def set_scan_count(self, value: str):
+        self.scan_count = max(10, int(value or DEFAULT_SCAN_COUNT))
+
+    def _start_scan(self, keep_view: bool):
+        self.key_count = 0
+        self._trie = KeyTrie(self.delimiter)
+        self._filtered_trie = None
+        if not keep_view:
+            self._expanded_paths = set()
             self.selected_key = ""
+        self.scan_cursor = 0
+        self.db_size = 0
+        self.pending_folders = []
+        self._folder_cursors = {}
+        self._scan_complete = False
+        self._loaded_key_count = 0
+        self._refresh_tree()
+        self.is_loading_keys = True
+        self._scan_generation += 1
+        events = [
+            KeyBrowserState.watch_key_events,
+            KeyBrowserState.stream_scan(self._scan_generation),
+        ]
+        if keep_view and self.lazy_mode:
+            # Expanded folders were filled by folder loads; page them in again
+            events.extend(
+                KeyBrowserState.load_folder(path)
+                for path in sorted(self._expanded_paths)
+            )
+        return events
+
+    @rx.event
+    def scan_keys(self):
+        """Starts a fresh scan from cursor 0, streaming batches into the tree."""
+        return self._start_scan(keep_view=False)
+
+    @rx.event
+    def rescan_keys(self):
+        """Rebuilds the tree from a fresh scan, keeping expanded folders and selection."""
+        return self._start_scan(keep_view=True)
+
+    @rx.event
+    def stop_key_events(self):
+        dispatcher.close_owner(self.router.session.client_token, KEY_EVENT_SLOT)
+
+    @rx.event(background=True)
+    async def watch_key_events(self):
+        """Keeps the tree current from __keyevent@<db>__:* notifications.
+
+        Events are drained and applied in batches. A lost subscription, an
+        overflowing queue or a FLUSHDB/FLUSHALL falls back to a full rescan.
+        A later call replaces this watcher; it also stops once its tab
+        is no longer connected.
+        """
+        async with self:
+            owner = self.router.session.client_token
             connection_state = await self.get_state(ConnectionState)
             config = connection_state.active_config
             if not config:
-                self.is_loading_keys = False
                 return
+            if uses_tracking(config):
+                # Key events need notify-keyspace-events; the tree then only
+                # updates on rescans
+                dispatcher.close_owner(owner, KEY_EVENT_SLOT)
+                return
+        sub = None
         try:
-            r = redis.Redis(
-                host=config["host"],
-                port=config["port"],
-                password=config["password"] if config["password"] else None,
-                db=config["db"],
-                socket_timeout=5,
-                decode_responses=True,
+            sub = await dispatcher.subscribe(
+                owner,
+                config,
+                keyevent_pattern(config["db"]),
+                is_pattern=True,
+                slot=KEY_EVENT_SLOT,
+                notify_flags=KEYEVENT_NOTIFY_FLAGS,
+                maxsize=KEY_EVENT_QUEUE_SIZE,
             )
-            keys = []
-            count = 0
-            limit = 10000
-            for key in r.scan_iter(match="*", count=100):
-                keys.append(key)
-                count += 1
-                if count >= limit:
+            while True:
+                msg = await sub.next_event()
+                if msg is None:
+                    break
+                await asyncio.sleep(KEY_EVENT_FLUSH_SECONDS)
+                events = [msg, *sub.drain()]
+                closed = None in events
+                events = [event for event in events if event is not None]
+                if sub.dropped or any(
+                    data == RESYNC_EVENT or keyevent_name(channel) in FLUSH_EVENTS
+                    for channel, data in events
+                ):
+                    yield KeyBrowserState.rescan_keys
                     break
+                async with self:
+                    self._apply_key_events(events)
+                if closed or not client_connected(owner):
+                    break
+        except Exception as e:
+            logging.exception(f"Key event watcher error: {e}")
+        finally:
+            if sub:
+                await dispatcher.release(sub)
+
+    @rx.event
+    def resume_scan(self):
+        """Continues a cancelled or capped scan from the saved cursor."""
+        if self.is_loading_keys or self.scan_cursor == 0:
+            return
+        self.is_loading_keys = True
+        self._scan_generation += 1
+        return KeyBrowserState.stream_scan(self._scan_generation)
+
+    @rx.event
+    def cancel_scan(self):
+        self._scan_generation += 1
+        self.is_loading_keys = False
+
+    @rx.event(background=True)
+    async def stream_scan(self, generation: int):
+        async with self:
+            if self._scan_generation != generation:
+                return
+            cursor = self.scan_cursor
+            count = self.scan_count
+            limit = LAZY_SAMPLE_KEYS if self.lazy_mode else MAX_KEYS_PER_SCAN
+            connection_state = await self.get_state(ConnectionState)
+            config = connection_state.active_config
+            if not config:
+                self.is_loading_keys = False
+                return
+        try:
+            r = get_client(config)
+            db_size = await r.dbsize()
             async with self:
-                self.keys = keys
+                self.db_size = db_size
+            batch: list[str] = []
+            seen: set[str] = set()
+            last_flush = time.monotonic()
+            while True:
+                cursor, page = await r.scan(cursor=cursor, match="*", count=count)
+                for key in page:
+                    if key not in seen:
+                        seen.add(key)
+                        batch.append(key)
+                done = cursor == 0 or len(seen) >= limit
+                if (
+                    done
+                    or len(batch) >= SCAN_BATCH_KEYS
+                    or time.monotonic() - last_flush >= SCAN_BATCH_SECONDS
+                ):
+                    async with self:
+                        if self._scan_generation != generation:
+                            return
+                        self._add_keys(batch)
+                        self.scan_cursor = cursor
+                        self._scan_complete = cursor == 0
+                    batch = []
+                    last_flush = time.monotonic()
+                if done:
+                    break
         except Exception as e:
             logging.exception(f"Error scanning keys: {e}")
             async with self:
                 yield rx.toast(f"Failed to scan keys: {str(e)}")
         finally:
             async with self:
-                self.is_loading_keys = False
\ No newline at end of file
+                if self._scan_generation == generation:
+                    self.is_loading_keys = False
\ No newline at end of file
@@ -1,9 +1,89 @@
 import reflex as rx
-import redis
 import asyncio
+import json
 import logging
+import time
 from typing import Any, Optional, Union
-from redis_browser.states.connection_state import ConnectionState
+from redis_browser.backend.batch_edits import (
+    StagedEdit,
+    commit_edits,
+    stage_edit,
+)
+from redis_browser.backend.key_values import (
+    DEFAULT_PAGE_SIZE,
+    OFFSET_PAGED_TYPES,
+    STRING_CHUNK_BYTES,
+    STRING_FULL_CHUNK_BYTES,
+    STRING_FULL_LOAD_LIMIT,
+    HistogramBin,
+    KeyDescription,
+    StreamEntry,
+    StreamGroup,
+    ZsetQuery,
+    change_scope,
+    describe_key,
+    fetch_stream_window,
+    fetch_string_chunk,
+    fetch_value_page,
+    has_more,
+    hex_dump,
+    is_text,
+    query_zset,
+    refresh_list_window,
+    tail_stream,
+    utf8_boundary,
+    zset_histogram,
+)
+from redis_browser.backend.keyspace_listener import (
+    Subscription,
+    dispatcher,
+    keyspace_channel,
+)
+from redis_browser.backend.pool_registry import dedicated_client, get_client
+from redis_browser.backend.tracking import tracker, tracks_key
+from redis_browser.states.connection_state import ConnectionState, client_connected
+
+WATCH_SLOT = "key_details"
+# Notifications beyond this many unread are dropped; the next refresh covers them
+WATCH_QUEUE_SIZE = 1000
+# Quiet period after the last change before the view refreshes
+WATCH_DEBOUNCE_SECONDS = 0.2
+# A watched key refreshes at most once per interval, however hot it is
+WATCH_MIN_INTERVAL_SECONDS = 1.0
+# A live tail that has seen no new entries for this long stops by itself
+STREAM_TAIL_MAX_IDLE_SECONDS = 600
+# Element later string chunks are appended to, so each is sent only once
+STRING_TAIL_ID = "string-value-tail"
+
+
+async def _coalesce_changes(
+    sub: Subscription, first: tuple[str, str], last_refresh: float
+) -> tuple[list[tuple[str, str]], bool]:
+    """Gathers a burst of notifications into one batch (trailing-edge debounce).
+
+    The batch closes once the key has been quiet for the debounce period, or
+    after the minimum interval for a key that never goes quiet, but never
+    sooner than the minimum interval since the previous refresh. Returns the
+    batch and whether the subscription was closed meanwhile.
+    """
+    events = [first]
+    started = last_event = time.monotonic()
+    not_before = last_refresh + WATCH_MIN_INTERVAL_SECONDS
+    while True:
+        quiet_at = last_event + WATCH_DEBOUNCE_SECONDS
+        fire_at = max(not_before, min(quiet_at, started + WATCH_MIN_INTERVAL_SECONDS))
+        timeout = fire_at - time.monotonic()
+        if timeout <= 0:
+            return events, False
+        try:
+            msg = await asyncio.wait_for(sub.next_event(), timeout)
+        except asyncio.TimeoutError:
+            return events, False
+        for item in [msg, *sub.drain()]:
+            if item is None:
+                return events, True
+            events.append(item)
+        last_event = time.monotonic()
 
 
 class KeyDetailsState(rx.State):
@@ -17,18 +97,297 @@ class KeyDetailsState(rx.State):
     set_value: list[str] = []
     hash_value: dict[str, str] = {}
     zset_value: list[tuple[str, float]] = []
+    stream_value: list[StreamEntry] = []
+    stream_info: dict[str, str] = {}
+    stream_groups: list[StreamGroup] = []
+    stream_reverse: bool = True
+    stream_tailing: bool = False
+    zset_mode: str = "rank"
+    zset_min: str = ""
+    zset_max: str = ""
+    zset_reverse: bool = False
+    zset_total: int = 0
+    zset_lookup: str = ""
+    zset_histogram: list[HistogramBin] = []
+    is_building_histogram: bool = False
     is_loading: bool = False
     show_edit_modal: bool = False
     edit_field_name: str = ""
     edit_field_value: str = ""
     edit_score: float = 0.0
+    page_size: int = DEFAULT_PAGE_SIZE
+    value_length: int = 0
+    value_offset: int = 0
+    has_more_values: bool = False
+    is_loading_more: bool = False
+    encoding: str = ""
+    memory_usage: int = 0
+    string_view: str = "utf-8"
+    string_loaded: int = 0
+    string_is_binary: bool = False
+    # Bumped on every full re-render; remounts the tail and voids stale appends
+    string_render_id: int = 0
+    staging: bool = False
+    staged_edits: list[StagedEdit] = []
+    atomic_commit: bool = False
+    is_committing: bool = False
+    watch_paused: bool = False
+    watch_via: str = ""
+    pending_changes: int = 0
+    watch_events: int = 0
+    watch_refreshes: int = 0
+    watch_dropped: int = 0
 
     # Backend-only: generation counter to cancel stale watchers
     _watch_generation: int = 0
+    # Backend-only: offset (list/zset), scan cursor (hash/set) or exclusive
+    # entry ID (stream) of the next page
+    _next_position: Union[int, str] = 0
+    # Backend-only: generation counter to cancel a stale stream tail
+    _tail_generation: int = 0
+    # Backend-only: key the watch metrics were collected for
+    _watch_key: str = ""
+    # Backend-only: raw bytes of the loaded prefix of a string value, kept only
+    # up to STRING_FULL_LOAD_LIMIT; a full load past it lives on the client
+    _string_bytes: bytes = b""
+    # Backend-only: how many loaded bytes the client has rendered
+    _string_shown: int = 0
+    # Backend-only: loaded bytes past those, short of a whole character or hex line
+    _string_pending: bytes = b""
+    # Backend-only: a character cut off at the end of the loaded bytes
+    _string_cut: bytes = b""
 
     @rx.event
     def set_show_edit_modal(self, show: bool):
         self.show_edit_modal = show
+        return self._flush_pending()
+
+    @rx.event
+    def toggle_watch_pause(self):
+        self.watch_paused = not self.watch_paused
+        return self._flush_pending()
+
+    def _flush_pending(self):
+        """Refreshes once for the changes held back while paused."""
+        if (
+            not self.pending_changes
+            or self.watch_paused
+            or self.show_edit_modal
+            or not self.key_name
+        ):
+            return None
+        self.pending_changes = 0
+        self.watch_refreshes += 1
+        return KeyDetailsState.fetch_key_details(self.key_name, show_loading=False)
+
+    @rx.var
+    def watch_coalesced(self) -> int:
+        return max(0, self.watch_events - self.watch_refreshes - self.pending_changes)
+
+    @rx.var
+    def loaded_count(self) -> int:
+        if self.key_type == "hash":
+            return len(self.hash_value)
+        if self.key_type == "list":
+            return len(self.list_value)
+        if self.key_type == "set":
+            return len(self.set_value)
+        if self.key_type == "zset":
+            return len(self.zset_value)
+        if self.key_type == "stream":
+            return len(self.stream_value)
+        return 0
+
+    @rx.var
+    def can_jump(self) -> bool:
+        return self.key_type in OFFSET_PAGED_TYPES or self.key_type == "stream"
+
+    @rx.var
+    def zset_query_active(self) -> bool:
+        return self.zset_mode != "rank" or self.zset_reverse
+
+    @rx.var
+    def page_total(self) -> int:
+        """Size of what is being paged: the whole value, or a zset query's matches."""
+        if self.key_type == "zset" and self.zset_query_active:
+            return self.zset_total
+        return self.value_length
+
+    def _zset_query(self) -> ZsetQuery:
+        return {
+            "mode": self.zset_mode,
+            "min": self.zset_min,
+            "max": self.zset_max,
+            "reverse": self.zset_reverse,
+        }
+
+    def _reset_zset_query(self):
+        self.zset_mode = "rank"
+        self.zset_min = ""
+        self.zset_max = ""
+        self.zset_reverse = False
+        self.zset_lookup = ""
+        self.zset_histogram = []
+
+    @rx.var
+    def string_complete(self) -> bool:
+        return self.string_loaded >= self.value_length
+
+    @rx.var
+    def string_capped(self) -> bool:
+        """Scrolling has reached the load limit but the value continues."""
+        return (
+            self.string_loaded >= STRING_FULL_LOAD_LIMIT
+            and self.string_loaded < self.value_length
+        )
+
+    @rx.var
+    def can_edit_string(self) -> bool:
+        # Saving a partial or non-UTF-8 preview would corrupt the value
+        return (
+            self.string_loaded >= self.value_length
+            and not self.string_is_binary
+            and self.string_view == "utf-8"
+        )
+
+    def _string_text(self, start: int, data: bytes) -> str:
+        if self.string_view == "hex":
+            return hex_dump(data, base=start)
+        return data.decode("utf-8", errors="replace")
+
+    def _take_string_bytes(self, data: bytes) -> str:
+        """Records a loaded chunk, returning the text of what it completes.
+
+        Renders up to a whole character or hex line until the value is complete.
+        """
+        start = self._string_shown
+        room = STRING_FULL_LOAD_LIMIT - len(self._string_bytes)
+        if room > 0:
+            self._string_bytes += data[:room]
+        self.string_loaded += len(data)
+        if not self.string_is_binary:
+            checked = self._string_cut + data
+            self.string_is_binary = not is_text(checked)
+            self._string_cut = checked[utf8_boundary(checked) :]
+        pending = self._string_pending + data
+        if self.string_loaded >= self.value_length:
+            end = len(pending)
+        elif self.string_view == "hex":
+            end = len(pending) - self.string_loaded % 16
+        else:
+            end = utf8_boundary(pending)
+        self._string_pending = pending[end:]
+        self._string_shown += end
+        return self._string_text(start, pending[:end])
+
+    def _set_string_bytes(self, data: bytes):
+        self._string_bytes = b""
+        self._string_shown = 0
+        self._string_pending = b""
+        self._string_cut = b""
+        self.string_loaded = 0
+        self.string_is_binary = False
+        self.string_value = self._take_string_bytes(data)
+        self.string_render_id += 1
+
+    def _append_string_bytes(self, data: bytes) -> Optional[rx.event.EventSpec]:
+        """Adds a chunk, returning a script that appends only its rendering."""
+        start = self._string_shown
+        text = self._take_string_bytes(data)
+        if not text:
+            return None
+        if start and self.string_view == "hex":
+            text = "\n" + text
+        return rx.call_script(
+            f"(e => e && e.dataset.render === '{self.string_render_id}' && "
+            f"e.insertAdjacentText('beforeend', {json.dumps(text)}))"
+            f"(document.getElementById('{STRING_TAIL_ID}'))"
+        )
+
+    def _set_page(self, key_type: str, page, offset: int, next_position: int):
+        """Replaces the loaded collection value with a single page."""
+        self.list_value = page if key_type == "list" else []
+        self.set_value = page if key_type == "set" else []
+        self.hash_value = page if key_type == "hash" else {}
+        self.zset_value = page if key_type == "zset" else []
+        self.stream_value = page if key_type == "stream" else []
+        self.value_offset = offset
+        self._next_position = next_position
+        self.has_more_values = has_more(key_type, next_position, self.page_total)
+
+    def _set_ttl(self, pttl: int):
+        self.ttl = (pttl + 500) // 1000 if pttl > 0 else pttl
+
+    def _clear_value(self):
+        """Empties the view after the watched key was deleted or expired."""
+        self.key_type = "none"
+        self.ttl = -2
+        self.encoding = ""
+        self.memory_usage = 0
+        self._set_string_bytes(b"")
+        self.value_length = 0
+        self.stream_info = {}
+        self.stream_groups = []
+        self._set_page("none", None, 0, 0)
+
+    def _apply_description(self, description: KeyDescription):
+        self.key_type = description["type"]
+        self._set_ttl(description["pttl"])
+        self.encoding = description["encoding"]
+        self.memory_usage = description["memory_usage"]
+        self.value_length = description["length"]
+        self.stream_info = description["stream_info"]
+        self.stream_groups = description["stream_groups"]
+        data = description["string_bytes"]
+        self.string_view = "hex" if data and not is_text(data) else "utf-8"
+        self._set_string_bytes(data)
+        self.pending_changes = 0
+        self._set_page(
+            description["type"], description["page"], 0, description["next_position"]
+        )
+
+    def _append_page(self, page, next_position: int):
+        if self.key_type == "list":
+            self.list_value.extend(page)
+        elif self.key_type == "set":
+            self.set_value.extend(page)
+        elif self.key_type == "hash":
+            self.hash_value.update(page)
+        elif self.key_type == "zset":
+            self.zset_value.extend(page)
+        elif self.key_type == "stream":
+            self.stream_value.extend(page)
+        self._next_position = next_position
+        self.has_more_values = has_more(self.key_type, next_position, self.page_total)
+
+    def _add_stream_entries(self, entries: list[StreamEntry]):
+        """Merges entries newer than the last known ID into the loaded window.
+
+        They only show if the window is at the newest end of the stream; the
+        window never grows past its current size or one page.
+        """
+        if not entries:
+            return
+        last_id = self.stream_info.get("Last ID", "")
+        self.value_length += len(entries)
+        self.stream_info["Last ID"] = entries[-1]["id"]
+        cap = max(self.page_size, len(self.stream_value))
+        if self.stream_reverse:
+            if self.stream_value and self.stream_value[0]["id"] != last_id:
+                return
+            window = list(reversed(entries)) + self.stream_value
+            if len(window) > cap:
+                window = window[:cap]
+                self._next_position = window[-1]["id"]
+                self.has_more_values = True
+            self.stream_value = window
+        elif not self.has_more_values:
+            window = self.stream_value + entries
+            if len(window) > cap:
+                window = window[:cap]
+                self._next_position = window[-1]["id"]
+                self.has_more_values = True
+            self.stream_value = window
 
     @rx.var
     def ttl_display(self) -> str:
@@ -47,11 +406,25 @@ class KeyDetailsState(rx.State):
         parts.append(f"{seconds}s")
         return " ".join(parts)
 
+    @rx.var
+    def memory_display(self) -> str:
+        size = float(self.memory_usage)
+        for unit in ("B", "KB", "MB"):
+            if size < 1024:
+                return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+            size /= 1024
+        return f"{size:.1f} GB"
+
     @rx.event(background=True)
     async def fetch_key_details(self, key: str, show_loading: bool = True):
         async with self:
             if show_loading:
                 self.is_loading = True
+            if key != self.key_name:
+                self.staged_edits = []
+                self._reset_zset_query()
+                self.stream_tailing = False
+                self._tail_generation += 1
             self.key_name = key
             connection_state = await self.get_state(ConnectionState)
             config = connection_state.active_config
@@ -60,35 +433,30 @@ class KeyDetailsState(rx.State):
                     self.is_loading = False
                 return
         try:
-            r = redis.Redis(
-                host=config["host"],
-                port=config["port"],
-                password=config["password"] if config["password"] else None,
-                db=config["db"],
-                decode_responses=True,
-            )
-            k_type = r.type(key)
-            ttl = r.ttl(key)
-            s_val, l_val, set_val, h_val, z_val = ("", [], [], {}, [])
-            if k_type == "string":
-                s_val = r.get(key) or ""
-            elif k_type == "list":
-                l_val = r.lrange(key, 0, -1)
-            elif k_type == "set":
-                set_val = list(r.smembers(key))
-                set_val.sort()
-            elif k_type == "hash":
-                h_val = r.hgetall(key)
-            elif k_type == "zset":
-                z_val = r.zrange(key, 0, -1, withscores=True)
             async with self:
-                self.key_type = k_type
-                self.ttl = ttl
-                self.string_value = s_val
-                self.list_value = l_val
-                self.set_value = set_val
-                self.hash_value = h_val
-                self.zset_value = z_val
+                page_size = self.page_size
+                stream_reverse = self.stream_reverse
+                owner = self.router.session.client_token
+            if tracks_key(config, key):
+                if show_loading:
+                    # Watch before reading, so a change in between still
+                    # invalidates; start_watching_key picks this one up
+                    await tracker.subscribe(
+                        owner, config, key, slot=WATCH_SLOT, maxsize=WATCH_QUEUE_SIZE
+                    )
+                description = await tracker.describe(
+                    config, key, page_size, stream_reverse
+                )
+            else:
+                description = await describe_key(
+                    get_client(config), key, page_size, stream_reverse
+                )
+            async with self:
+                self._apply_description(description)
+                rerun_query = self.key_type == "zset" and self.zset_query_active
+            if rerun_query:
+                # Keep showing the active range query rather than the first page
+                yield KeyDetailsState.run_zset_query({})
         except Exception as e:
             logging.exception(f"Error fetching key details: {e}")
             async with self:
@@ -104,90 +472,481 @@ class KeyDetailsState(rx.State):
             if gen is not None:
                 yield KeyDetailsState.start_watching_key(gen)
 
+    @rx.event
+    def set_page_size(self, value: str):
+        self.page_size = int(value or DEFAULT_PAGE_SIZE)
+        if self.key_name:
+            return KeyDetailsState.fetch_key_details(self.key_name, show_loading=False)
+
     @rx.event(background=True)
-    async def start_watching_key(self, generation: int):
-        """Subscribe to Redis keyspace notifications for the selected key."""
+    async def set_string_view(self, view: str):
+        """Re-renders the kept prefix: the first chunk in place, the rest appended."""
+        async with self:
+            self.string_view = view
+            data = self._string_bytes
+            self._set_string_bytes(data[:STRING_CHUNK_BYTES])
+            render_id = self.string_render_id
+        for start in range(STRING_CHUNK_BYTES, len(data), STRING_CHUNK_BYTES):
+            async with self:
+                if self.string_render_id != render_id:
+                    return
+                script = self._append_string_bytes(
+                    data[start : start + STRING_CHUNK_BYTES]
+                )
+            if script:
+                yield script
+
+    @rx.event
+    def load_string_on_scroll(self, near_bottom: bool):
+        if near_bottom and not self.is_loading_more:
+            return KeyDetailsState.load_more_string(False)
+
+    @rx.event(background=True)
+    async def load_more_string(self, full: bool = False):
+        """Appends GETRANGE chunks to the string preview.
+
+        Scrolling loads one chunk at a time up to STRING_FULL_LOAD_LIMIT;
+        `full` loads the rest of the value in larger chunks. Only the new
+        text is sent, appended to the preview by a script.
+        """
         async with self:
+            if self.is_loading_more or self.key_type != "string":
+                return
             key = self.key_name
+            length = self.value_length
+            start = self.string_loaded
+            if start >= length or (not full and start >= STRING_FULL_LOAD_LIMIT):
+                return
             connection_state = await self.get_state(ConnectionState)
             config = connection_state.active_config
-            if not config or not key:
+            if not config:
                 return
+            self.is_loading_more = True
+        try:
+            r = get_client(config)
+            chunk_size = STRING_FULL_CHUNK_BYTES if full else STRING_CHUNK_BYTES
+            chunks = []
+            position = start
+            while position < length:
+                chunk = await fetch_string_chunk(r, key, position, chunk_size)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                position += len(chunk)
+                if not full:
+                    break
+            script = None
+            async with self:
+                if self.key_name == key and self.string_loaded == start:
+                    script = self._append_string_bytes(b"".join(chunks))
+            if script:
+                yield script
+        except Exception as e:
+            logging.exception(f"Error loading string value: {e}")
+            yield rx.toast(f"Load failed: {str(e)}")
+        finally:
+            async with self:
+                self.is_loading_more = False
 
-        pubsub = None
-        r = None
+    @rx.event(background=True)
+    async def load_more_values(self):
+        """Appends the next page (by offset or cursor) to the loaded value."""
+        async with self:
+            if self.is_loading_more or not self.has_more_values:
+                return
+            key = self.key_name
+            k_type = self.key_type
+            position = self._next_position
+            page_size = self.page_size
+            reverse = self.stream_reverse
+            query = (
+                self._zset_query()
+                if k_type == "zset" and self.zset_query_active
+                else None
+            )
+            connection_state = await self.get_state(ConnectionState)
+            config = connection_state.active_config
+            if not config:
+                return
+            self.is_loading_more = True
         try:
-            r = redis.Redis(
-                host=config["host"],
-                port=config["port"],
-                password=config["password"] if config["password"] else None,
-                db=config["db"],
-                decode_responses=True,
+            r = get_client(config)
+            if query:
+                page, total = await query_zset(r, key, query, position, page_size)
+                next_position = position + len(page)
+            else:
+                page, next_position = await fetch_value_page(
+                    r, key, k_type, position, page_size, reverse
+                )
+            async with self:
+                if self.key_name == key and self._next_position == position:
+                    if query:
+                        self.zset_total = total
+                    self._append_page(page, next_position)
+        except Exception as e:
+            logging.exception(f"Error loading more values: {e}")
+            yield rx.toast(f"Load more failed: {str(e)}")
+        finally:
+            async with self:
+                self.is_loading_more = False
+
+    @rx.event(background=True)
+    async def jump_to_offset(self, form_data: dict):
+        """Loads the page starting at an index (list/zset) or entry ID (stream)."""
+        async with self:
+            key = self.key_name
+            k_type = self.key_type
+            page_size = self.page_size
+            length = self.page_total
+            reverse = self.stream_reverse
+            query = (
+                self._zset_query()
+                if k_type == "zset" and self.zset_query_active
+                else None
             )
-            # Enable keyspace notifications (KEA = keyspace events for all commands)
-            try:
-                r.config_set("notify-keyspace-events", "KEA")
-            except redis.ResponseError:
-                logging.warning(
-                    "Could not enable keyspace notifications via CONFIG SET. "
-                    "Ensure 'notify-keyspace-events KEA' is set in redis.conf."
+            connection_state = await self.get_state(ConnectionState)
+            config = connection_state.active_config
+            if not config or not self.can_jump:
+                return
+            self.is_loading_more = True
+        try:
+            r = get_client(config)
+            if k_type == "stream":
+                offset = 0
+                page, next_position = await fetch_stream_window(
+                    r,
+                    key,
+                    str(form_data.get("offset") or "").strip(),
+                    page_size,
+                    reverse,
+                    inclusive=True,
+                )
+            else:
+                offset = min(
+                    max(0, int(form_data.get("offset") or 0)), max(0, length - 1)
                 )
+                if query:
+                    page, total = await query_zset(r, key, query, offset, page_size)
+                    next_position = offset + len(page)
+                else:
+                    page, next_position = await fetch_value_page(
+                        r, key, k_type, offset, page_size
+                    )
+            async with self:
+                if self.key_name == key:
+                    if query:
+                        self.zset_total = total
+                    self._set_page(k_type, page, offset, next_position)
+        except Exception as e:
+            logging.exception(f"Error jumping to offset: {e}")
+            yield rx.toast(f"Jump failed: {str(e)}")
+        finally:
+            async with self:
+                self.is_loading_more = False
+
+    @rx.event(background=True)
+    async def run_zset_query(self, form_data: dict):
+        """Pages a sorted set by score, lex or reverse rank with ZRANGE ... LIMIT.
+
+        An empty `form_data` re-runs the current query.
+        """
+        async with self:
+            if form_data:
+                self.zset_mode = form_data.get("mode") or "rank"
+                self.zset_min = str(form_data.get("min", "")).strip()
+                self.zset_max = str(form_data.get("max", "")).strip()
+                self.zset_reverse = bool(form_data.get("reverse"))
+            key = self.key_name
+            query = self._zset_query()
+            page_size = self.page_size
+            connection_state = await self.get_state(ConnectionState)
+            config = connection_state.active_config
+            if not config or self.key_type != "zset":
+                return
+            self.is_loading_more = True
+        try:
+            page, total = await query_zset(get_client(config), key, query, 0, page_size)
+            async with self:
+                if self.key_name == key and self._zset_query() == query:
+                    self.zset_total = total
+                    self._set_page("zset", page, 0, len(page))
+        except Exception as e:
+            logging.exception(f"Error running sorted set query: {e}")
+            yield rx.toast(f"Query failed: {str(e)}")
+        finally:
+            async with self:
+                self.is_loading_more = False
 
-            pubsub = r.pubsub()
-            channel = f"__keyspace@{config['db']}__:{key}"
-            pubsub.subscribe(channel)
-            logging.info(f"Subscribed to keyspace notifications: {channel}")
+    @rx.event
+    def clear_zset_query(self):
+        self._reset_zset_query()
+        return KeyDetailsState.fetch_key_details(self.key_name, show_loading=False)
 
+    @rx.event(background=True)
+    async def lookup_member(self, form_data: dict):
+        """Finds a member's rank and score, then pages to it."""
+        member = str(form_data.get("member", ""))
+        async with self:
+            key = self.key_name
+            connection_state = await self.get_state(ConnectionState)
+            config = connection_state.active_config
+            if not config or not member:
+                return
+        try:
+            pipe = get_client(config).pipeline(transaction=False)
+            pipe.zrank(key, member)
+            pipe.zrevrank(key, member)
+            pipe.zscore(key, member)
+            rank, rev_rank, score = await pipe.execute()
+            async with self:
+                if rank is None:
+                    self.zset_lookup = f"'{member}' is not a member"
+                    return
+                self.zset_lookup = (
+                    f"'{member}': rank {rank} (reverse {rev_rank}), score {score:g}"
+                )
+                self.zset_mode = "rank"
+                self.zset_reverse = False
+            yield KeyDetailsState.jump_to_offset({"offset": rank})
+        except Exception as e:
+            logging.exception(f"Error looking up member: {e}")
+            yield rx.toast(f"Lookup failed: {str(e)}")
+
+    @rx.event(background=True)
+    async def build_zset_histogram(self):
+        async with self:
+            if self.is_building_histogram:
+                return
+            key = self.key_name
+            query = self._zset_query()
+            connection_state = await self.get_state(ConnectionState)
+            config = connection_state.active_config
+            if not config:
+                return
+            self.is_building_histogram = True
+        try:
+            bins = await zset_histogram(get_client(config), key, query)
+            async with self:
+                if self.key_name == key:
+                    self.zset_histogram = bins
+        except Exception as e:
+            logging.exception(f"Error building score histogram: {e}")
+            yield rx.toast(f"Histogram failed: {str(e)}")
+        finally:
+            async with self:
+                self.is_building_histogram = False
+
+    @rx.event
+    def toggle_stream_order(self):
+        self.stream_reverse = not self.stream_reverse
+        return KeyDetailsState.jump_to_offset({"offset": ""})
+
+    @rx.event
+    def toggle_stream_tail(self):
+        self.stream_tailing = not self.stream_tailing
+        self._tail_generation += 1
+        if self.stream_tailing:
+            return KeyDetailsState.follow_stream(self._tail_generation)
+
+    @rx.event(background=True)
+    async def follow_stream(self, generation: int):
+        """Live-tails the stream with XREAD BLOCK on its own connection."""
+        async with self:
+            key = self.key_name
+            owner = self.router.session.client_token
+            last_id = self.stream_info.get("Last ID") or "$"
+            page_size = self.page_size
+            connection_state = await self.get_state(ConnectionState)
+            config = connection_state.active_config
+            if not config or self.key_type != "stream":
+                self.stream_tailing = False
+                return
+        # Outside the shared pool, so idle tails never starve other commands;
+        # closed however the loop ends
+        r = dedicated_client(config)
+        try:
+            last_entry = time.monotonic()
             while True:
-                # Check if this watcher is still valid
+                entries = await tail_stream(r, key, last_id, page_size)
+                if entries:
+                    last_id = entries[-1]["id"]
+                    last_entry = time.monotonic()
+                idle = time.monotonic() - last_entry > STREAM_TAIL_MAX_IDLE_SECONDS
                 async with self:
-                    if self._watch_generation != generation:
+                    if (
+                        self._tail_generation != generation
+                        or self.key_name != key
+                        or not self.stream_tailing
+                    ):
                         break
-                    if not self.key_name or self.key_name != key:
+                    if idle or not client_connected(owner):
+                        self.stream_tailing = False
                         break
+                    self._add_stream_entries(entries)
+        except Exception as e:
+            logging.exception(f"Stream tail error for '{key}': {e}")
+            async with self:
+                if self._tail_generation == generation:
+                    self.stream_tailing = False
+            yield rx.toast(f"Live tail stopped: {str(e)}")
+        finally:
+            await r.aclose()
+
+    @rx.event(background=True)
+    async def start_watching_key(self, generation: int):
+        """Subscribe to keyspace notifications for the selected key via the shared listener."""
+        async with self:
+            key = self.key_name
+            owner = self.router.session.client_token
+            connection_state = await self.get_state(ConnectionState)
+            config = connection_state.active_config
+            if not config or not key or self._watch_generation != generation:
+                return
+            if self._watch_key != key:
+                self._watch_key = key
+                self.watch_events = 0
+                self.watch_refreshes = 0
+                self.watch_dropped = 0
+            self.pending_changes = 0
 
-                # Non-blocking check for pub/sub messages
-                msg = await asyncio.to_thread(
-                    pubsub.get_message,
-                    ignore_subscribe_messages=True,
-                    timeout=1.0,
+        sub = None
+        # Client tracking needs no notify-keyspace-events on the server; keys
+        # outside its BCAST prefixes still need keyspace events
+        source = tracker if tracks_key(config, key) else dispatcher
+        try:
+            if source is tracker:
+                sub = await tracker.subscribe(
+                    owner,
+                    config,
+                    key,
+                    slot=WATCH_SLOT,
+                    maxsize=WATCH_QUEUE_SIZE,
+                    reuse=True,
+                )
+                logging.info(f"Tracking invalidations for '{key}'")
+            else:
+                channel = keyspace_channel(config["db"], key)
+                sub = await dispatcher.subscribe(
+                    owner, config, channel, slot=WATCH_SLOT, maxsize=WATCH_QUEUE_SIZE
+                )
+                logging.info(f"Subscribed to keyspace notifications: {channel}")
+            async with self:
+                self.watch_via = (
+                    "client tracking" if source is tracker else "keyspace events"
                 )
-                if msg and msg.get("type") == "message":
-                    event = msg.get("data", "")
-                    logging.info(
-                        f"Keyspace event for '{key}': {event}"
+
+            last_refresh = 0.0
+            while True:
+                # Wakes only on a notification or when the subscription is replaced
+                msg = await sub.next_event()
+                if msg is None:
+                    break
+                events, closed = await _coalesce_changes(sub, msg, last_refresh)
+                # A closed tab would otherwise keep refetching a hot key forever
+                if not client_connected(owner):
+                    break
+                async with self:
+                    if self._watch_generation != generation or self.key_name != key:
+                        break
+                    # Anything lost to a full queue could be any kind of change
+                    scope = (
+                        "full"
+                        if sub.dropped > self.watch_dropped
+                        else change_scope([e for _, e in events], self.key_type)
                     )
-                    # Skip refresh while edit modal is open
-                    async with self:
-                        is_editing = self.show_edit_modal
-                    if not is_editing:
-                        yield KeyDetailsState.fetch_key_details(
-                            key, show_loading=False
-                        )
+                    self.watch_events += len(events)
+                    self.watch_dropped = sub.dropped
+                    # The live tail already delivers new stream entries
+                    if scope == "stream_tail" and self.stream_tailing:
+                        refresh = False
+                    # Hold changes back while paused or while the edit modal is open
+                    elif self.watch_paused or self.show_edit_modal:
+                        refresh = False
+                        self.pending_changes += len(events)
+                    else:
+                        refresh = True
+                        self.watch_refreshes += 1
+                        if scope == "gone":
+                            self._clear_value()
+                if refresh:
+                    last_refresh = time.monotonic()
+                    if scope == "full":
+                        yield KeyDetailsState.fetch_key_details(key, show_loading=False)
+                    elif scope != "gone":
+                        yield KeyDetailsState.apply_key_changes(key, scope)
+                if closed:
+                    break
 
         except Exception as e:
             logging.exception(f"Keyspace watcher error for '{key}': {e}")
         finally:
-            if pubsub:
-                try:
-                    pubsub.unsubscribe()
-                    pubsub.close()
-                except Exception:
-                    pass
-            if r:
-                try:
-                    r.close()
-                except Exception:
-                    pass
-            logging.info(
-                f"Keyspace watcher stopped for '{key}' (gen={generation})"
+            if sub:
+                await source.release(sub)
+            logging.info(f"Keyspace watcher stopped for '{key}' (gen={generation})")
+
+    @rx.event(background=True)
+    async def apply_key_changes(self, key: str, scope: str):
+        """Re-reads only what a batch of notifications changed (see change_scope)."""
+        async with self:
+            if self.key_name != key:
+                return
+            offset = self.value_offset
+            loaded = list(self.list_value)
+            old_length = self.value_length
+            page_size = self.page_size
+            last_id = self.stream_info.get("Last ID", "")
+            connection_state = await self.get_state(ConnectionState)
+            config = connection_state.active_config
+            if not config:
+                return
+        try:
+            r = get_client(config)
+            if scope == "ttl":
+                pttl = await r.pttl(key)
+                async with self:
+                    if self.key_name == key:
+                        self._set_ttl(pttl)
+                return
+            if scope == "stream_tail":
+                entries, more = await fetch_stream_window(
+                    r, key, last_id, page_size, reverse=False
+                )
+                if more or not last_id:
+                    # Too far behind to merge; start over from the newest page
+                    yield KeyDetailsState.fetch_key_details(key, show_loading=False)
+                    return
+                async with self:
+                    if (
+                        self.key_name == key
+                        and self.stream_info.get("Last ID", "") == last_id
+                    ):
+                        self._add_stream_entries(entries)
+                return
+            window, length = await refresh_list_window(
+                r, key, scope, offset, loaded, old_length, page_size
             )
+            async with self:
+                # Skip if the window moved or grew while the edges were read
+                if (
+                    self.key_name == key
+                    and self.value_offset == offset
+                    and len(self.list_value) == len(loaded)
+                ):
+                    self.value_length = length
+                    self._set_page("list", window, offset, offset + len(window))
+        except Exception as e:
+            logging.exception(f"Targeted refresh failed for '{key}': {e}")
+            yield KeyDetailsState.fetch_key_details(key, show_loading=False)
 
     @rx.event
     def stop_watching(self):
-        """Increment generation to signal any active watcher to stop."""
+        """Increment generation and close the subscription to stop any active watcher."""
         self._watch_generation += 1
+        self._tail_generation += 1
+        self.stream_tailing = False
         self.key_name = ""
+        dispatcher.close_owner(self.router.session.client_token, WATCH_SLOT)
+        tracker.close_owner(self.router.session.client_token, WATCH_SLOT)
 
     @rx.event(background=True)
     async def delete_key(self):
@@ -196,18 +955,13 @@ class KeyDetailsState(rx.State):
             connection_state = await self.get_state(ConnectionState)
             config = connection_state.active_config
         try:
-            r = redis.Redis(
-                host=config["host"],
-                port=config["port"],
-                password=config["password"],
-                db=config["db"],
-            )
-            r.delete(key)
+            r = get_client(config)
+            await r.delete(key)
             async with self:
                 self.key_name = ""
                 from redis_browser.states.key_browser_state import KeyBrowserState
 
-                yield KeyBrowserState.scan_keys
+                yield KeyBrowserState.remove_key(key)
                 yield rx.toast(f"Key '{key}' deleted")
         except Exception as e:
             logging.exception(f"Error deleting key: {e}")
@@ -221,14 +975,8 @@ class KeyDetailsState(rx.State):
             connection_state = await self.get_state(ConnectionState)
             config = connection_state.active_config
         try:
-            r = redis.Redis(
-                host=config["host"],
-                port=config["port"],
-                password=config["password"],
-                db=config["db"],
-                decode_responses=True,
-            )
-            r.set(key, new_val)
+            r = get_client(config)
+            await r.set(key, new_val)
             async with self:
                 self.show_edit_modal = False
                 yield KeyDetailsState.fetch_key_details(key)
@@ -236,6 +984,29 @@ class KeyDetailsState(rx.State):
             logging.exception(f"Error updating string value: {e}")
             yield rx.toast(f"Update failed: {str(e)}")
 
+    @rx.event(background=True)
+    async def open_string_editor(self):
+        """Opens the editor on the whole value, read again if only a prefix is kept."""
+        async with self:
+            key = self.key_name
+            length = self.value_length
+            data = self._string_bytes
+            connection_state = await self.get_state(ConnectionState)
+            config = connection_state.active_config
+        try:
+            if len(data) < length and config:
+                data = await fetch_string_chunk(get_client(config), key, 0, length)
+            async with self:
+                if self.key_name != key:
+                    return
+                self.edit_field_name = ""
+                self.edit_field_value = data.decode("utf-8", errors="replace")
+                self.edit_score = 0.0
+                self.show_edit_modal = True
+        except Exception as e:
+            logging.exception(f"Error reading string value: {e}")
+            yield rx.toast(f"Load failed: {str(e)}")
+
     @rx.event
     def open_edit_modal(self, field: str = "", value: str = "", score: float = 0.0):
         self.edit_field_name = field
@@ -243,46 +1014,105 @@ class KeyDetailsState(rx.State):
         self.edit_score = score
         self.show_edit_modal = True
 
-    @rx.event(background=True)
-    async def set_hash_field(self, form_data: dict):
+    async def _write_edits(self, edits: list[StagedEdit], atomic: bool = False):
+        """Writes edits in one pipeline, then refreshes the view once."""
         async with self:
-            field = form_data.get("field", self.edit_field_name)
-            value = form_data.get("value", "")
             key = self.key_name
+            k_type = self.key_type
             connection_state = await self.get_state(ConnectionState)
             config = connection_state.active_config
         try:
-            r = redis.Redis(
-                host=config["host"],
-                port=config["port"],
-                password=config["password"],
-                db=config["db"],
-                decode_responses=True,
-            )
-            r.hset(key, field, value)
+            results = await commit_edits(get_client(config), k_type, key, edits, atomic)
+            errors = [result for result in results if isinstance(result, Exception)]
             async with self:
                 self.show_edit_modal = False
-                yield KeyDetailsState.fetch_key_details(key)
+                if not errors:
+                    self.staged_edits = [e for e in self.staged_edits if e not in edits]
+            if errors:
+                yield rx.toast(
+                    f"{len(errors)} of {len(results)} writes failed: {errors[0]}"
+                )
+            yield KeyDetailsState.fetch_key_details(key, show_loading=False)
         except Exception as e:
-            logging.exception(f"Error setting hash field: {e}")
-            yield rx.toast(f"Hash update failed: {str(e)}")
+            logging.exception(f"Error writing {k_type} edits: {e}")
+            yield rx.toast(f"Update failed: {str(e)}")
+
+    async def _edit(self, edit: StagedEdit):
+        """Stages `edit` in staged mode, otherwise writes it immediately."""
+        async with self:
+            if self.staging:
+                self.staged_edits = stage_edit(self.staged_edits, edit)
+                self.show_edit_modal = False
+                return
+        async for event in self._write_edits([edit]):
+            yield event
+
+    @rx.event(background=True)
+    async def set_hash_field(self, form_data: dict):
+        async with self:
+            field = form_data.get("field", self.edit_field_name)
+        edit: StagedEdit = {
+            "op": "set",
+            "field": field,
+            "value": form_data.get("value", ""),
+        }
+        async for event in self._edit(edit):
+            yield event
 
     @rx.event(background=True)
     async def delete_hash_field(self, field: str):
+        async for event in self._edit({"op": "delete", "field": field, "value": ""}):
+            yield event
+
+    @rx.event(background=True)
+    async def set_member(self, form_data: dict):
+        """Adds a set member, or adds/rescores a sorted set member."""
         async with self:
-            key = self.key_name
-            connection_state = await self.get_state(ConnectionState)
-            config = connection_state.active_config
+            member = form_data.get("field", self.edit_field_name)
+            is_zset = self.key_type == "zset"
+        score = str(form_data.get("score", "0")).strip() if is_zset else ""
+        if is_zset:
+            try:
+                float(score)
+            except ValueError:
+                yield rx.toast(f"Invalid score: {score}")
+                return
+        async for event in self._edit({"op": "set", "field": member, "value": score}):
+            yield event
+
+    @rx.event(background=True)
+    async def delete_member(self, member: str):
+        async for event in self._edit({"op": "delete", "field": member, "value": ""}):
+            yield event
+
+    @rx.event
+    def toggle_staging(self):
+        self.staging = not self.staging
+
+    @rx.event
+    def toggle_atomic_commit(self):
+        self.atomic_commit = not self.atomic_commit
+
+    @rx.event
+    def unstage_edit(self, field: str):
+        self.staged_edits = [e for e in self.staged_edits if e["field"] != field]
+
+    @rx.event
+    def discard_staged_edits(self):
+        self.staged_edits = []
+
+    @rx.event(background=True)
+    async def commit_staged_edits(self):
+        """Commits every staged edit as one pipelined (optionally MULTI/EXEC) batch."""
+        async with self:
+            if self.is_committing or not self.staged_edits:
+                return
+            edits = list(self.staged_edits)
+            atomic = self.atomic_commit
+            self.is_committing = True
         try:
-            r = redis.Redis(
-                host=config["host"],
-                port=config["port"],
-                password=config["password"],
-                db=config["db"],
-                decode_responses=True,
-            )
-            r.hdel(key, field)
-            yield KeyDetailsState.fetch_key_details(key)
-        except Exception as e:
-            logging.exception(f"Error deleting hash field: {e}")
-            yield rx.toast(f"Field delete failed: {str(e)}")
\ No newline at end of file
+            async for event in self._write_edits(edits, atomic):
+                yield event
+        finally:
+            async with self:
+                self.is_committing = False
\ No newline at end of file
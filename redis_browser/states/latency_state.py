@@ -0,0 +1,104 @@
+import reflex as rx
+import json
+import logging
+from typing import TypedDict
+from redis_browser.backend.latency import format_latency, recorder
+from redis_browser.backend.pool_registry import get_client, pool_address
+from redis_browser.states.connection_state import ConnectionState
+
+
+class LatencyRow(TypedDict):
+    connection: str
+    command: str
+    count: int
+    p50: str
+    p95: str
+    p99: str
+    max: str
+    # Server-side mean from INFO commandstats; the gap to p50 is network and client
+    server: str
+
+
+class LatencyState(rx.State):
+    show_panel: bool = False
+    all_connections: bool = False
+    rows: list[LatencyRow] = []
+    is_loading: bool = False
+
+    @rx.event
+    def toggle_panel(self):
+        self.show_panel = not self.show_panel
+        if self.show_panel:
+            return LatencyState.refresh_latency
+
+    @rx.event
+    def toggle_all_connections(self):
+        self.all_connections = not self.all_connections
+        return LatencyState.refresh_latency
+
+    @rx.event(background=True)
+    async def refresh_latency(self):
+        async with self:
+            connection_state = await self.get_state(ConnectionState)
+            config = connection_state.active_config
+            is_connected = connection_state.is_connected
+            address = pool_address(config) if config else ""
+            self.is_loading = True
+            all_connections = self.all_connections
+        server_stats = {}
+        if config and is_connected:
+            try:
+                info = await get_client(config).info("commandstats")
+                server_stats = {
+                    name.removeprefix("cmdstat_"): stats.get("usec_per_call", 0)
+                    for name, stats in info.items()
+                    if isinstance(stats, dict)
+                }
+            except Exception as e:
+                logging.warning(f"INFO commandstats failed: {e}")
+        stats = recorder.stats(None if all_connections else address)
+        rows = []
+        for row in stats:
+            server_name = row["command"].lower().replace(" ", "|")
+            usec = (
+                server_stats.get(server_name) if row["connection"] == address else None
+            )
+            rows.append(
+                {
+                    "connection": row["connection"],
+                    "command": row["command"],
+                    "count": row["count"],
+                    "p50": format_latency(row["p50_us"]),
+                    "p95": format_latency(row["p95_us"]),
+                    "p99": format_latency(row["p99_us"]),
+                    "max": format_latency(row["max_us"]),
+                    "server": (
+                        format_latency(int(float(usec))) if usec is not None else "-"
+                    ),
+                }
+            )
+        async with self:
+            self.rows = rows
+            self.is_loading = False
+
+    @rx.event
+    async def reset_latency(self):
+        connection_state = await self.get_state(ConnectionState)
+        config = connection_state.active_config
+        if self.all_connections or not config:
+            recorder.reset()
+        else:
+            recorder.reset(pool_address(config))
+        self.rows = []
+
+    @rx.event
+    async def export_latency(self):
+        connection_state = await self.get_state(ConnectionState)
+        config = connection_state.active_config
+        connection = (
+            None if self.all_connections or not config else pool_address(config)
+        )
+        return rx.download(
+            data=json.dumps(recorder.export(connection), indent=2),
+            filename="redis-latency.json",
+        )
\ No newline at end of file
@@ -0,0 +1,120 @@
+import reflex as rx
+import asyncio
+import logging
+from typing import Any
+from redis_browser.backend.monitor import (
+    MONITOR_DEFAULT_SAMPLE,
+    MONITOR_DEFAULT_SECONDS,
+    MonitorLine,
+    MonitorSession,
+    RateRow,
+    monitors,
+)
+from redis_browser.states.connection_state import ConnectionState
+
+MONITOR_FLUSH_SECONDS = 0.5
+MONITOR_VISIBLE_LINES = 200
+
+
+class MonitorState(rx.State):
+    show_panel: bool = False
+    is_running: bool = False
+    sample_rate: int = MONITOR_DEFAULT_SAMPLE
+    max_seconds: int = MONITOR_DEFAULT_SECONDS
+    prefix_filter: str = ""
+    command_filter: str = ""
+    lines: list[MonitorLine] = []
+    command_rates: list[RateRow] = []
+    prefix_rates: list[RateRow] = []
+    seen: int = 0
+    matched: int = 0
+    dropped: int = 0
+    remaining_seconds: int = 0
+    _monitor_generation: int = 0
+
+    @rx.event
+    def toggle_panel(self):
+        self.show_panel = not self.show_panel
+        if not self.show_panel and self.is_running:
+            return MonitorState.stop_monitor
+
+    @rx.event
+    def stop_monitor(self):
+        monitors.stop(self.router.session.client_token)
+        self._monitor_generation += 1
+        self.is_running = False
+        self.remaining_seconds = 0
+
+    @rx.event(background=True)
+    async def start_monitor(self, form_data: dict[str, Any]):
+        """Runs MONITOR for a bounded time, forwarding samples and rates.
+
+        Filtering, sampling and ops/sec aggregation happen in the backend
+        session; this loop only moves the sampled lines and the current
+        rates into state twice a second.
+        """
+        async with self:
+            try:
+                self.sample_rate = max(1, int(form_data.get("sample_rate") or 1))
+                self.max_seconds = max(1, int(form_data.get("max_seconds") or 1))
+            except ValueError:
+                yield rx.toast("Sample rate and time limit must be numbers")
+                return
+            self.prefix_filter = form_data.get("prefix", "").strip()
+            self.command_filter = form_data.get("commands", "").strip()
+            connection_state = await self.get_state(ConnectionState)
+            config = connection_state.active_config
+            if not config or not connection_state.is_connected:
+                yield rx.toast("Connect to a Redis server first")
+                return
+            owner = self.router.session.client_token
+            self._monitor_generation += 1
+            generation = self._monitor_generation
+            self.lines = []
+            self.command_rates = []
+            self.prefix_rates = []
+            self.seen = self.matched = self.dropped = 0
+            self.is_running = True
+            session = MonitorSession(
+                config,
+                sample_rate=self.sample_rate,
+                max_seconds=self.max_seconds,
+                prefix=self.prefix_filter,
+                commands={
+                    command.strip()
+                    for command in self.command_filter.split(",")
+                    if command.strip()
+                },
+            )
+            self.remaining_seconds = session.max_seconds
+        try:
+            await monitors.start(owner, session)
+        except Exception as e:
+            logging.exception(f"MONITOR failed to start: {e}")
+            async with self:
+                if self._monitor_generation == generation:
+                    self.is_running = False
+            yield rx.toast(f"MONITOR failed: {e}")
+            return
+        while True:
+            await asyncio.sleep(MONITOR_FLUSH_SECONDS)
+            lines = session.drain()
+            command_rates, prefix_rates = session.rates()
+            async with self:
+                if self._monitor_generation != generation:
+                    session.stop()
+                    return
+                if lines:
+                    self.lines = (lines[::-1] + self.lines)[:MONITOR_VISIBLE_LINES]
+                self.command_rates = command_rates
+                self.prefix_rates = prefix_rates
+                self.seen = session.seen
+                self.matched = session.matched
+                self.dropped = session.dropped
+                self.remaining_seconds = session.remaining_seconds
+                if session.finished:
+                    monitors.stop(owner)
+                    self.is_running = False
+                    if session.error:
+                        yield rx.toast(f"MONITOR stopped: {session.error}")
+                    return
\ No newline at end of file
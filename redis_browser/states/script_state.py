@@ -0,0 +1,160 @@
+import reflex as rx
+import logging
+import re
+import shlex
+from typing import Any, TypedDict
+from redis_browser.backend.console_output import OutputPager, reply_preview
+from redis_browser.backend.latency import format_latency
+from redis_browser.backend.lua_scripts import SavedScript, script_sha, scripts
+from redis_browser.states.connection_state import ConnectionState
+
+# Per-key runs show at most this many result rows; the counts cover all keys
+SCRIPT_RESULT_ROWS = 500
+
+
+class ScriptRunRow(TypedDict):
+    key: str
+    output: str
+    status: str
+
+
+class ScriptState(rx.State):
+    show_panel: bool = False
+    scripts: list[SavedScript] = []
+    script_name: str = ""
+    script_source: str = ""
+    # Bumped to re-mount the editor fields with new default values
+    editor_version: int = 0
+    per_key: bool = False
+    is_running: bool = False
+    result: str = ""
+    result_status: str = ""
+    result_latency: str = ""
+    result_sha: str = ""
+    reloaded: bool = False
+    run_rows: list[ScriptRunRow] = []
+    run_errors: int = 0
+
+    @rx.event
+    def toggle_panel(self):
+        self.show_panel = not self.show_panel
+
+    @rx.event
+    def set_script_name(self, value: str):
+        self.script_name = value.strip()
+
+    @rx.event
+    def set_script_source(self, value: str):
+        self.script_source = value
+
+    @rx.event
+    def toggle_per_key(self):
+        self.per_key = not self.per_key
+
+    @rx.event
+    def new_script(self):
+        self.script_name = ""
+        self.script_source = ""
+        self.editor_version += 1
+
+    @rx.event
+    def select_script(self, name: str):
+        for script in self.scripts:
+            if script["name"] == name:
+                self.script_name = script["name"]
+                self.script_source = script["source"]
+                self.editor_version += 1
+                return
+
+    @rx.event
+    def save_script(self):
+        if not self.script_name or not self.script_source.strip():
+            return rx.toast("A script needs a name and a body")
+        self.scripts = [s for s in self.scripts if s["name"] != self.script_name] + [
+            {"name": self.script_name, "source": self.script_source}
+        ]
+        return rx.toast(f"Saved script '{self.script_name}'")
+
+    @rx.event
+    def delete_script(self, name: str):
+        self.scripts = [s for s in self.scripts if s["name"] != name]
+
+    @rx.event(background=True)
+    async def run_script(self, form_data: dict[str, Any]):
+        """Runs the editor's script by EVALSHA, once or once per key."""
+        source = form_data.get("source", "")
+        keys = [key for key in re.split(r"[\s,]+", form_data.get("keys", "")) if key]
+        async with self:
+            self.script_source = source
+            if not source.strip():
+                return
+            try:
+                args = shlex.split(form_data.get("args", ""))
+            except ValueError as e:
+                yield rx.toast(f"Invalid arguments: {e}")
+                return
+            connection_state = await self.get_state(ConnectionState)
+            config = connection_state.active_config
+            if not config or not connection_state.is_connected:
+                yield rx.toast("Connect to a Redis server first")
+                return
+            per_key = self.per_key
+            if per_key and not keys:
+                yield rx.toast("Per-key runs need at least one key")
+                return
+            self.is_running = True
+            self.result_sha = script_sha(source)
+        try:
+            if per_key:
+                replies, micros, reloaded = await scripts.run_per_key(
+                    config, source, keys, args
+                )
+                rows = [
+                    {
+                        "key": key,
+                        "output": reply_preview(reply),
+                        "status": (
+                            "error" if isinstance(reply, Exception) else "success"
+                        ),
+                    }
+                    for key, reply in zip(keys, replies)
+                ]
+                errors = sum(row["status"] == "error" for row in rows)
+                async with self:
+                    self.run_rows = rows[:SCRIPT_RESULT_ROWS]
+                    self.run_errors = errors
+                    self.result = f"{len(rows) - errors} succeeded, {errors} failed"
+                    self.result_status = "error" if errors else "success"
+            else:
+                reply, micros, reloaded = await scripts.run(config, source, keys, args)
+                pager = OutputPager(reply)
+                output = pager.next_page()
+                async with self:
+                    self.run_rows = []
+                    self.run_errors = 0
+                    self.result = f"{output}\n..." if pager.has_more else output
+                    self.result_status = "success"
+            async with self:
+                self.result_latency = format_latency(micros)
+                self.reloaded = reloaded
+                if keys:
+                    from redis_browser.states.key_browser_state import KeyBrowserState
+                    from redis_browser.states.key_details_state import (
+                        KeyDetailsState,
+                    )
+
+                    # Declared keys are the only ones a script may touch
+                    yield KeyBrowserState.refresh_keys(keys)
+                    selected_key = (await self.get_state(KeyBrowserState)).selected_key
+                    if selected_key in keys:
+                        yield KeyDetailsState.fetch_key_details(selected_key)
+        except Exception as e:
+            logging.exception(f"Error running Lua script: {e}")
+            async with self:
+                self.run_rows = []
+                self.result = f"Error: {e}"
+                self.result_status = "error"
+                self.result_latency = ""
+        finally:
+            async with self:
+                self.is_running = False
\ No newline at end of file
@@ -0,0 +1,53 @@
+import asyncio
+import redis.asyncio as aioredis
+from redis_browser.backend.command_batch import parse_script, run_batch
+
+
+async def _serve_db_number(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    """Answers GET with the db this connection has SELECTed, everything else +OK."""
+    db = b"0"
+    try:
+        while header := await reader.readline():
+            argv = []
+            for _ in range(int(header[1:])):
+                await reader.readline()
+                argv.append((await reader.readline()).strip())
+            name = argv[0].upper()
+            if name == b"SELECT":
+                db = argv[1]
+            if name == b"GET":
+                writer.write(b"$%d\r\n%s\r\n" % (len(db), db))
+            else:
+                writer.write(b"+OK\r\n")
+            await writer.drain()
+    finally:
+        writer.close()
+
+
+def test_parse_script_skips_comments_and_reports_bad_lines():
+    commands, errors = parse_script('# setup\nSET k "a b"\n\nGET "unclosed\n')
+    assert commands == [["SET", "k", "a b"]]
+    assert errors == ["line 4: No closing quotation"]
+
+
+def test_a_batch_that_selects_a_db_does_not_leak_it_to_the_pool():
+    async def scenario():
+        server = await asyncio.start_server(_serve_db_number, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        r = aioredis.Redis(
+            connection_pool=aioredis.BlockingConnectionPool(
+                host="127.0.0.1", port=port, max_connections=1, decode_responses=True
+            )
+        )
+        try:
+            results = await run_batch(r, [["SELECT", "3"], ["GET", "k"]])
+            after = await r.get("k")
+        finally:
+            await r.connection_pool.disconnect()
+            server.close()
+            await server.wait_closed()
+        return [reply for reply, _ in results], after
+
+    replies, after = asyncio.run(scenario())
+    assert replies == ["OK", "3"]
+    assert after == "0"
\ No newline at end of file
@@ -0,0 +1,17 @@
+import pytest
+from redis_browser.backend.command_info import changes_connection
+
+
+@pytest.mark.parametrize(
+    "argv, expected",
+    [
+        (["SELECT", "3"], True),
+        (["multi"], True),
+        (["SUBSCRIBE", "ch"], True),
+        (["CLIENT", "TRACKING", "on"], True),
+        (["CLIENT", "LIST"], False),
+        (["GET", "k"], False),
+    ],
+)
+def test_commands_that_change_connection_state_are_recognised(argv, expected):
+    assert changes_connection(argv) is expected
\ No newline at end of file
@@ -0,0 +1,60 @@
+from redis_browser.backend.console_output import (
+    OUTPUT_PAGE_LINES,
+    OutputStore,
+)
+
+REPLY = [f"value-{i}" for i in range(OUTPUT_PAGE_LINES * 3)]
+
+
+def test_pages_are_handed_out_until_the_reply_is_exhausted():
+    store = OutputStore()
+    page, has_more = store.open("tab", 1, REPLY)
+    pages = [page]
+    while has_more:
+        page, has_more = store.more("tab", 1)
+        pages.append(page)
+    assert len(pages) == 3
+    assert "\n".join(pages).splitlines()[-1].endswith(f"value-{len(REPLY) - 1}")
+    assert store.retained == 0
+    assert store.more("tab", 1) is None
+
+
+def test_only_the_unsent_remainder_is_retained():
+    store = OutputStore()
+    store.open("tab", 1, REPLY)
+    before = store.retained
+    store.more("tab", 1)
+    assert 0 < store.retained < before
+
+
+def _one_output_bytes() -> int:
+    store = OutputStore()
+    store.open("tab", 1, REPLY)
+    return store.retained
+
+
+def test_each_session_is_capped_in_bytes_oldest_first():
+    store = OutputStore(session_bytes=_one_output_bytes(), total_bytes=10**9)
+    store.open("tab", 1, REPLY)
+    store.open("tab", 2, REPLY)
+    store.open("other", 3, REPLY)
+    assert store.more("tab", 1) is None
+    assert store.more("tab", 2) is not None
+    assert store.more("other", 3) is not None
+
+
+def test_the_total_cap_drops_the_least_recently_used_session():
+    store = OutputStore(total_bytes=_one_output_bytes())
+    store.open("old", 1, REPLY)
+    store.open("new", 2, REPLY)
+    assert store.more("old", 1) is None
+    assert store.more("new", 2) is not None
+
+
+def test_closed_sessions_are_cleared():
+    store = OutputStore()
+    store.open("gone", 1, REPLY)
+    store.open("open", 2, REPLY)
+    store.clear_closed(lambda owner: owner == "open")
+    assert store.more("gone", 1) is None
+    assert store.more("open", 2) is not None
\ No newline at end of file
@@ -0,0 +1,27 @@
+from redis_browser.backend.key_trie import KeyTrie
+
+
+def test_remove_prunes_a_key_that_was_also_a_prefix():
+    trie = KeyTrie()
+    trie.insert("a")
+    trie.insert("a:b")
+    assert trie.remove("a:b")
+    assert [row["id"] for row in trie.visible_rows(set())] == ["a"]
+    assert trie.remove("a")
+    assert trie.visible_rows(set()) == []
+    assert len(trie) == 0
+    assert "a" not in trie
+
+
+def test_remove_keeps_a_prefix_key_with_keys_beneath():
+    trie = KeyTrie()
+    trie.update(["a", "a:b", "a:c"])
+    assert trie.remove("a")
+    rows = trie.visible_rows({"a"})
+    assert [(row["id"], row["type"]) for row in rows] == [
+        ("a", "folder"),
+        ("a:b", "key"),
+        ("a:c", "key"),
+    ]
+    assert "a" not in trie
+    assert list(trie.keys()) == ["a:b", "a:c"]
\ No newline at end of file
@@ -0,0 +1,91 @@
+import asyncio
+from redis_browser.backend import pool_registry
+from redis_browser.backend.pool_registry import PoolRegistry
+
+
+async def _serve_slowly(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    """Answers each RESP command after a short delay, so connections stay busy."""
+    try:
+        while header := await reader.readline():
+            argv = []
+            for _ in range(int(header[1:])):
+                await reader.readline()
+                argv.append((await reader.readline()).strip().decode())
+            await asyncio.sleep(0.05)
+            writer.write(b"+PONG\r\n" if argv[0].upper() == "PING" else b"+OK\r\n")
+            await writer.drain()
+    finally:
+        writer.close()
+
+
+def _config(port: int, max_connections: int) -> dict:
+    return {
+        "id": "test",
+        "name": "test",
+        "host": "127.0.0.1",
+        "port": port,
+        "password": "",
+        "db": 0,
+        "max_connections": max_connections,
+        "watch_mode": "keyspace",
+        "tracking_prefixes": "",
+    }
+
+
+def test_more_concurrent_commands_than_connections_wait_for_a_free_one():
+    async def scenario():
+        server = await asyncio.start_server(_serve_slowly, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        registry = PoolRegistry()
+        config = _config(port, max_connections=2)
+        client = registry.get_client(config)
+        try:
+            replies = await asyncio.gather(*(client.ping() for _ in range(8)))
+            [stats] = registry.stats([config])
+        finally:
+            await client.connection_pool.disconnect()
+            server.close()
+            await server.wait_closed()
+        return replies, stats
+
+    replies, stats = asyncio.run(scenario())
+    assert replies == [True] * 8
+    assert stats["in_use"] == 0
+    assert stats["idle"] <= 2
+
+
+def test_a_dedicated_client_never_returns_its_connection_to_the_shared_pool(
+    monkeypatch,
+):
+    async def scenario():
+        server = await asyncio.start_server(_serve_slowly, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        registry = PoolRegistry()
+        monkeypatch.setattr(pool_registry, "registry", registry)
+        config = _config(port, max_connections=2)
+        client = pool_registry.dedicated_client(config)
+        try:
+            await client.execute_command("SELECT", 3)
+        finally:
+            await client.aclose()
+            server.close()
+            await server.wait_closed()
+        return registry.stats([config])[0], client.connection_pool
+
+    stats, pool = asyncio.run(scenario())
+    assert stats["in_use"] == 0 and stats["idle"] == 0
+    assert not any(conn.is_connected for conn in pool._available_connections)
+
+
+def test_invalidating_a_config_leaves_other_versions_of_it_open():
+    registry = PoolRegistry()
+    saved = _config(6379, max_connections=2)
+    edited = {**saved, "db": 1}
+    registry.get_client(saved)
+    registry.get_client(edited)
+    registry.invalidate({**saved, "name": "renamed"}, saved)
+    registry.invalidate(edited)
+    assert [stats["address"] for stats in registry.stats([saved, edited])] == [
+        "127.0.0.1:6379/0"
+    ]
+    assert registry.stats([]) == []
\ No newline at end of file
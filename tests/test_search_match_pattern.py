@@ -0,0 +1,25 @@
+import pytest
+from redis_browser.states.key_browser_state import search_match_pattern
+
+
+@pytest.mark.parametrize(
+    "query, pattern",
+    [
+        ("^user:", "user:*"),
+        ("^user:\\d+$", "user:*"),
+        ("^user|session", "*"),
+        ("^user:(a|b)", "user:*"),
+        ("^user:[|]x", "user:*"),
+        ("^ab?", "a*"),
+        ("^a*", "*"),
+        ("^a{0,}", "*"),
+        ("user", "*"),
+    ],
+)
+def test_regex_prefix_is_pushed_down_only_when_every_match_has_it(query, pattern):
+    assert search_match_pattern("regex", query) == pattern
+
+
+def test_glob_without_wildcards_is_a_substring_match():
+    assert search_match_pattern("glob", "user[1]") == "user[1]"
+    assert search_match_pattern("glob", "user") == "*user*"
\ No newline at end of file
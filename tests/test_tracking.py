@@ -0,0 +1,109 @@
+import asyncio
+from redis_browser.backend import tracking
+from redis_browser.backend.tracking import (
+    TrackingDispatcher,
+    _TrackedServer,
+    tracks_key,
+)
+
+CONFIG = {
+    "id": "test",
+    "name": "test",
+    "host": "127.0.0.1",
+    "port": 6379,
+    "password": "",
+    "db": 0,
+    "max_connections": 10,
+    "watch_mode": "tracking",
+    "tracking_prefixes": "",
+}
+
+
+def _fake_server(monkeypatch) -> list[str]:
+    """Replaces the tracked reader with one that records every key it reads."""
+    reads = []
+
+    async def start(self):
+        self._listen_conn = object()
+
+    async def describe_key(r, key, page_size, stream_reverse):
+        reads.append(key)
+        return {"key": key, "type": "string", "value": f"v{len(reads)}"}
+
+    monkeypatch.setattr(_TrackedServer, "_start", start)
+    monkeypatch.setattr(tracking, "describe_key", describe_key)
+    return reads
+
+
+def test_reopening_a_key_is_served_from_the_cache(monkeypatch):
+    reads = _fake_server(monkeypatch)
+
+    async def scenario():
+        tracker = TrackingDispatcher()
+        sub = await tracker.subscribe("tab", CONFIG, "k", slot="details")
+        first = await tracker.describe(CONFIG, "k", 100)
+        await tracker.release(sub)
+        sub = await tracker.subscribe("tab", CONFIG, "k", slot="details")
+        again = await tracker.describe(CONFIG, "k", 100)
+        await tracker.release(sub)
+        return first, again
+
+    first, again = asyncio.run(scenario())
+    assert reads == ["k"]
+    assert again == first
+
+
+def test_an_invalidation_forces_a_fresh_read(monkeypatch):
+    reads = _fake_server(monkeypatch)
+
+    async def scenario():
+        tracker = TrackingDispatcher()
+        await tracker.describe(CONFIG, "k", 100)
+        tracker._server(CONFIG)._invalidate(["k"])
+        return await tracker.describe(CONFIG, "k", 100)
+
+    description = asyncio.run(scenario())
+    assert reads == ["k", "k"]
+    assert description["value"] == "v2"
+
+
+def test_a_subscription_made_before_reading_is_handed_over_once(monkeypatch):
+    _fake_server(monkeypatch)
+
+    async def scenario():
+        tracker = TrackingDispatcher()
+        early = await tracker.subscribe("tab", CONFIG, "k", slot="details")
+        claimed = await tracker.subscribe(
+            "tab", CONFIG, "k", slot="details", reuse=True
+        )
+        replaced = await tracker.subscribe(
+            "tab", CONFIG, "k", slot="details", reuse=True
+        )
+        return early, claimed, replaced
+
+    early, claimed, replaced = asyncio.run(scenario())
+    assert claimed is early
+    assert replaced is not early
+    assert early.closed
+
+
+def test_keys_outside_the_bcast_prefixes_are_never_cached(monkeypatch):
+    reads = _fake_server(monkeypatch)
+    config = {**CONFIG, "tracking_prefixes": "user:"}
+
+    async def scenario():
+        tracker = TrackingDispatcher()
+        for key in ["session:1", "session:1", "user:1", "user:1"]:
+            await tracker.describe(config, key, 100)
+
+    asyncio.run(scenario())
+    assert reads == ["session:1", "session:1", "user:1"]
+
+
+def test_only_keys_under_the_prefixes_are_tracked():
+    config = {**CONFIG, "tracking_prefixes": "user:, cart:"}
+    assert tracks_key(config, "user:1")
+    assert tracks_key(config, "cart:9")
+    assert not tracks_key(config, "session:1")
+    assert tracks_key(CONFIG, "session:1")
+    assert not tracks_key({**CONFIG, "watch_mode": "keyspace"}, "user:1")
\ No newline at end of file